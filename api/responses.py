@@ -0,0 +1,38 @@
+"""
+This module provides the response classes used by the API.
+
+Classes:
+    ORJSONResponse:
+        A JSON response rendered with orjson.
+"""
+
+import orjson
+
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    A JSON response rendered with orjson.
+
+    orjson serializes dictionaries, lists and native scalars several times faster than
+    the standard library and produces UTF-8 bytes directly. It is the default response
+    class of the application (see `main.py`).
+
+    Methods:
+        render(content) -> bytes:
+            Encodes the content as JSON.
+    """
+
+    def render(self, content) -> bytes:
+        """
+        Encodes the content as JSON.
+
+        Args:
+            content: The response content.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -1,15 +1,27 @@
 import requests
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.storage import get_db, PageModelMapping
-from .routes.scrape import perform_scrape, process_and_store_data
+from services.jobs import job_manager
+from services.storage import (
+    get_db, get_async_db, pool_monitor, PageModelMapping, AggregateFunction, AnalyticsMetric, SummaryKeyMapping
+)
+from services.storage.csv_handler import csv_handler
+from .responses import ORJSONResponse
+from .routes.scrape import (
+    scrape_and_store, scrape_batch, run_scrape_job, run_batch_job, get_pages_as_list, get_coverage
+)
 from .routes.retrieve import (
-    get_imports, get_exports, get_production, get_commercialization, get_processing, get_years_as_list
+    get_aggregates, get_summary, get_years_as_list, get_filters, get_fields_as_list, get_query_key, get_etag, etag_matches,
+    get_table_response,
 )
+from .routes.analytics import get_analytics, get_metrics_as_list
 from services.scraper.scraper_enums import ScraperPages
+from models import Import, Export, Production, Commercialization, Processing
+from config import MAX_PAGE_SIZE
 
 router = APIRouter()
 
@@ -64,16 +76,27 @@ async def root():
         },
     },
 )
-async def scrape_route(year: int, page: str, db: Session = Depends(get_db)):
+def scrape_route(
+    year: int,
+    page: str,
+    force: bool = Query(
+        default=False,
+        description="Fetch, parse and store the page even if it was scraped recently or its content is unchanged."
+    ),
+    db: Session = Depends(get_db)
+):
     """
     Scrape data for a specific year and page.
 
     This endpoint triggers a web scraping process for the specified year and page.
     The scraped data is processed, validated, and stored in the database.
+    Suboptions scraped within `SCRAPE_STATE_TTL`, or whose content has not changed since the
+    last scrape, are skipped unless `force` is set.
 
     Args:
         year (int): The year for which data is to be scraped.
         page (str): The page to scrape, corresponding to a valid `ScraperPages` value.
+        force (bool, optional): Process fresh and unchanged pages too. Defaults to False.
         db (Session): Database session dependency.
 
     Returns:
@@ -88,7 +111,7 @@ async def scrape_route(year: int, page: str, db: Session = Depends(get_db)):
     try:
         # Validate the page against PageModelMapping
         scraper_page = ScraperPages[page.upper()]
-        model = PageModelMapping[page.upper()].value
+        PageModelMapping[page.upper()]
     except KeyError:
         raise HTTPException(
             status_code=400,
@@ -96,25 +119,16 @@ async def scrape_route(year: int, page: str, db: Session = Depends(get_db)):
         )
 
     try:
-        # Perform the scraping process
-        scraped_data = perform_scrape(
+        # Perform the scraping process and store the data
+        result = scrape_and_store(
             year=year,
             page=scraper_page,
+            db=db,
+            force=force,
         )
 
-        if scraped_data is None:
-            return {"status": "error", "message": f"No data found for page {page}/{year}."}
-
-        # Process and store data
-        results = {}
-        for suboption, data in scraped_data.items():
-            results[suboption] = process_and_store_data(
-                scraped_data=data,
-                db=db,
-                model=model,
-                year=year,
-                suboption=suboption if suboption != "default" else None
-            )
+        if not result["suboptions"]:
+            return {"status": "success", "message": f"No new data for {page}/{year}; stored data is up to date."}
 
         return {"status": "success", "message": f"Data for {page}/{year} stored successfully."}
 
@@ -130,334 +144,294 @@ async def scrape_route(year: int, page: str, db: Session = Depends(get_db)):
         )
 
 
-@router.get(
-    "/import",
-    tags=["Import Data"],
-    summary="Retrieve import data",
+@router.post(
+    "/scrape",
+    status_code=202,
+    tags=["Scraping"],
+    summary="Queue a scrape for a specific year and page",
     description=(
-        "Fetch import data from the database, optionally filtered by a list of years. "
-        "The years should be provided as a comma-separated string."
+        "Queue a scraping job for a given year and page and return its id immediately. "
+        "The job runs on a dedicated worker pool; poll `/jobs/{job_id}` for its status."
     ),
     responses={
-        200: {
-            "description": "Successfully retrieved import data.",
+        202: {
+            "description": "Scraping job accepted.",
             "content": {
                 "application/json": {
-                    "example": {
-                        "status": "success",
-                        "data": [
-                            {
-                                "id": 1,
-                                "year": 2020,
-                                "country": "USA",
-                                "quantity": 1000,
-                                "value": 50000
-                            },
-                            {
-                                "id": 2,
-                                "year": 2021,
-                                "country": "Canada",
-                                "quantity": 2000,
-                                "value": 75000
-                            }
-                        ]
-                    }
+                    "example": {"status": "accepted", "job_id": "3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70", "status_url": "/jobs/3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70"}
                 }
             },
         },
         400: {
-            "description": "Invalid years format.",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
-                }
-            },
-        },
-        500: {
-            "description": "An unexpected error occurred.",
+            "description": "Invalid page provided.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                    "example": {"detail": "Invalid page: TEST. Must be one of ['PRODUCTION', 'PROCESSING', ...]."}
                 }
             },
         },
     },
 )
-async def import_route(
-    years: str = Query(
-        default=None,
-        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+async def scrape_job_route(
+    year: int,
+    page: str,
+    force: bool = Query(
+        default=False,
+        description="Fetch, parse and store the page even if it was scraped recently or its content is unchanged."
     ),
-    db: Session = Depends(get_db)
 ):
     """
-    Retrieve import data.
+    Queue a scraping job for a specific year and page.
 
     Args:
-        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
-        db (Session): Database session provided via dependency injection.
+        year (int): The year for which data is to be scraped.
+        page (str): The page to scrape, corresponding to a valid `ScraperPages` value.
+        force (bool, optional): Process fresh and unchanged pages too. Defaults to False.
 
     Returns:
-        dict: Status and retrieved data as a list of dictionaries.
+        dict: The accepted job id and the URL to poll for its status.
 
     Raises:
-        HTTPException:
-            - 400: If the `years` string cannot be parsed into a list of integers.
-            - 500: For any unexpected errors during data retrieval.
+        HTTPException: 400 - If the page is invalid.
     """
 
     try:
-        # Convert years string to a list of integers
-        years_list = get_years_as_list(years)
-        data = get_imports(db, years_list)
-
-        # Convert SQLAlchemy objects to dictionaries for the response
-        formatted_data = [
-            {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
-            for row in data
-        ]
-
-        return {"status": "success", "data": formatted_data}
-
-    except ValueError as e:
-        # Handle invalid years format
-        raise HTTPException(status_code=400, detail=str(e))
-
-    except Exception as e:
-        # Handle unexpected errors
+        scraper_page = ScraperPages[page.upper()]
+    except KeyError:
         raise HTTPException(
-            status_code=500,
-            detail=f"An unexpected error occurred: {str(e)}"
+            status_code=400,
+            detail=f"Invalid page: {page}. Must be one of {[p.name for p in PageModelMapping]}."
         )
 
+    job = job_manager.submit(
+        "scrape",
+        {"year": year, "page": scraper_page.name, "force": force},
+        run_scrape_job,
+        year,
+        scraper_page,
+        force=force,
+    )
+
+    return {"status": "accepted", "job_id": job.id, "status_url": f"/jobs/{job.id}"}
+
 
 @router.get(
-    "/export",
-    tags=["Export Data"],
-    summary="Retrieve export data",
+    "/scrape/batch",
+    tags=["Scraping"],
+    summary="Scrape a range of years for several pages",
     description=(
-        "Fetch export data from the database, optionally filtered by a list of years. "
-        "The years should be provided as a comma-separated string."
+        "Plan every (page, year, suboption) combination for the given year range and pages, "
+        "then scrape and store them as a single job with a global concurrency cap and a per-host rate limit. "
+        "Items scraped successfully within `SCRAPE_STATE_TTL` are skipped, see `/scrape/coverage`. "
+        "The response contains a per-item summary."
     ),
     responses={
         200: {
-            "description": "Successfully retrieved export data.",
+            "description": "Batch scraping finished. Individual items may have failed; see the summary.",
             "content": {
                 "application/json": {
                     "example": {
                         "status": "success",
-                        "data": [
-                            {
-                                "id": 1,
-                                "year": 2020,
-                                "country": "Brazil",
-                                "quantity": 1000,
-                                "value": 50000
-                            },
-                            {
-                                "id": 2,
-                                "year": 2021,
-                                "country": "Argentina",
-                                "quantity": 2000,
-                                "value": 75000
-                            }
+                        "counts": {"stored": 1, "skipped": 1, "failed": 1},
+                        "items": [
+                            {"page": "PRODUCTION", "year": 2020, "suboption": None, "status": "stored", "rows": 67, "error": None},
+                            {"page": "PRODUCTION", "year": 2021, "suboption": None, "status": "skipped", "rows": 0, "error": None},
+                            {"page": "EXPORT", "year": 2020, "suboption": "subopt_01", "status": "failed", "rows": 0, "error": "Timeout error."}
                         ]
                     }
                 }
             },
         },
         400: {
-            "description": "Invalid years format.",
+            "description": "Invalid year range or pages.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                    "example": {"detail": "Invalid year range: year_from must be less than or equal to year_to."}
                 }
             },
         },
         500: {
-            "description": "An unexpected error occurred.",
+            "description": "An unexpected error occurred during batch scraping.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                    "example": {"detail": "An unexpected error occurred: Database unavailable."}
                 }
             },
         },
     },
 )
-async def export_route(
-    years: str = Query(
+def scrape_batch_route(
+    year_from: int = Query(description="First year of the range (inclusive)."),
+    year_to: int = Query(description="Last year of the range (inclusive)."),
+    pages: str = Query(
         default=None,
-        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+        description="Comma-separated list of pages to scrape. If not provided, all pages are scraped."
+    ),
+    force: bool = Query(
+        default=False,
+        description="Fetch, parse and store pages even if they were scraped recently or their content is unchanged."
     ),
     db: Session = Depends(get_db)
 ):
     """
-    Retrieve export data.
+    Scrape a range of years for several pages in a single job.
 
     Args:
-        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
-        db (Session): Database session provided via dependency injection.
+        year_from (int): First year of the range (inclusive).
+        year_to (int): Last year of the range (inclusive).
+        pages (str, optional): Comma-separated page names. Defaults to all pages.
+        force (bool, optional): Process fresh and unchanged pages too. Defaults to False.
+        db (Session): Database session dependency.
 
     Returns:
-        dict: Status and retrieved data as a list of dictionaries.
+        dict: Status, per-status counts and the per-item summary.
 
     Raises:
-        HTTPException:
-            - 400: If the `years` string cannot be parsed into a list of integers.
-            - 500: For any unexpected errors during data retrieval.
+        HTTPException: 400 - If the year range or pages are invalid.
+        HTTPException: 500 - For any unexpected errors during batch scraping.
     """
 
+    if year_from > year_to:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid year range: year_from must be less than or equal to year_to."
+        )
+
     try:
-        # Convert years string to a list of integers
-        years_list = get_years_as_list(years)
-        data = get_exports(db, years_list)
+        scraper_pages = get_pages_as_list(pages)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-         # Convert SQLAlchemy objects to dictionaries for the response
-        formatted_data = [
-            {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
-            for row in data
-        ]
+    try:
+        items = scrape_batch(
+            years=list(range(year_from, year_to + 1)),
+            pages=scraper_pages,
+            db=db,
+            force=force,
+        )
 
-        return {"status": "success", "data": formatted_data}
+        counts = {}
+        for item in items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
 
-    except ValueError as e:
-        # Handle invalid years format
-        raise HTTPException(status_code=400, detail=str(e))
+        return {"status": "success", "counts": counts, "items": items}
 
     except Exception as e:
-        # Handle unexpected errors
         raise HTTPException(
             status_code=500,
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
 
-@router.get(
-    "/production",
-    tags=["Production Data"],
-    summary="Retrieve production data",
+@router.post(
+    "/scrape/batch",
+    status_code=202,
+    tags=["Scraping"],
+    summary="Queue a batch scrape for a range of years and several pages",
     description=(
-        "Fetch production data from the database, optionally filtered by a list of years. "
-        "The years should be provided as a comma-separated string."
+        "Queue a batch scraping job for the given year range and pages and return its id immediately. "
+        "Poll `/jobs/{job_id}` for its status and per-item summary."
     ),
     responses={
-        200: {
-            "description": "Successfully retrieved production data.",
+        202: {
+            "description": "Batch scraping job accepted.",
             "content": {
                 "application/json": {
-                    "example": {
-                        "status": "success",
-                        "data": [
-                            {
-                                "id": 1,
-                                "year": 2020,
-                                "product": "Wheat",
-                                "quantity": 1000
-                            },
-                            {
-                                "id": 2,
-                                "year": 2021,
-                                "product": "Corn",
-                                "quantity": 2000
-                            }
-                        ]
-                    }
+                    "example": {"status": "accepted", "job_id": "3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70", "status_url": "/jobs/3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70"}
                 }
             },
         },
         400: {
-            "description": "Invalid years format.",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
-                }
-            },
-        },
-        500: {
-            "description": "An unexpected error occurred.",
+            "description": "Invalid year range or pages.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                    "example": {"detail": "Invalid year range: year_from must be less than or equal to year_to."}
                 }
             },
         },
     },
 )
-async def production_route(
-    years: str = Query(
+async def scrape_batch_job_route(
+    year_from: int = Query(description="First year of the range (inclusive)."),
+    year_to: int = Query(description="Last year of the range (inclusive)."),
+    pages: str = Query(
         default=None,
-        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+        description="Comma-separated list of pages to scrape. If not provided, all pages are scraped."
+    ),
+    force: bool = Query(
+        default=False,
+        description="Fetch, parse and store pages even if they were scraped recently or their content is unchanged."
     ),
-    db: Session = Depends(get_db)
 ):
     """
-    Retrieve production data.
+    Queue a batch scraping job for a range of years and several pages.
 
     Args:
-        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
-        db (Session): Database session provided via dependency injection.
+        year_from (int): First year of the range (inclusive).
+        year_to (int): Last year of the range (inclusive).
+        pages (str, optional): Comma-separated page names. Defaults to all pages.
+        force (bool, optional): Process fresh and unchanged pages too. Defaults to False.
 
     Returns:
-        dict: Status and retrieved data as a list of dictionaries.
+        dict: The accepted job id and the URL to poll for its status.
 
     Raises:
-        HTTPException:
-            - 400: If the `years` string cannot be parsed into a list of integers.
-            - 500: For any unexpected errors during data retrieval.
+        HTTPException: 400 - If the year range or pages are invalid.
     """
 
-    try:
-        # Convert years string to a list of integers
-        years_list = get_years_as_list(years)
-        data = get_production(db, years_list)
-
-        # Convert SQLAlchemy objects to dictionaries for the response
-        formatted_data = [
-            {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
-            for row in data
-        ]
-
-        return {"status": "success", "data": formatted_data}
+    if year_from > year_to:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid year range: year_from must be less than or equal to year_to."
+        )
 
+    try:
+        scraper_pages = get_pages_as_list(pages)
     except ValueError as e:
-        # Handle invalid years format
         raise HTTPException(status_code=400, detail=str(e))
 
-    except Exception as e:
-        # Handle unexpected errors
-        raise HTTPException(
-            status_code=500,
-            detail=f"An unexpected error occurred: {str(e)}"
-        )
+    job = job_manager.submit(
+        "scrape_batch",
+        {"year_from": year_from, "year_to": year_to, "pages": [p.name for p in scraper_pages], "force": force},
+        run_batch_job,
+        list(range(year_from, year_to + 1)),
+        scraper_pages,
+        force=force,
+    )
+
+    return {"status": "accepted", "job_id": job.id, "status_url": f"/jobs/{job.id}"}
 
 
 @router.get(
-    "/commercialization",
-    tags=["Commercialization Data"],
-    summary="Retrieve commercialization data",
+    "/scrape/coverage",
+    tags=["Scraping"],
+    summary="Report which pages and years have been scraped",
     description=(
-        "Fetch commercialization data from the database, optionally filtered by a list of years. "
-        "The years should be provided as a comma-separated string."
+        "Report the scrape state ledger for every (page, year, suboption) in a year range: whether each item "
+        "is fresh (scraped successfully within `SCRAPE_STATE_TTL`), stale, pending, failed or missing, with "
+        "its content hash, row count, fetch time and duration. Scrapes skip fresh items, so this shows what "
+        "the next scheduled refresh will fetch."
     ),
     responses={
         200: {
-            "description": "Successfully retrieved commercialization data.",
+            "description": "Coverage of the requested pages and years.",
             "content": {
                 "application/json": {
                     "example": {
                         "status": "success",
-                        "data": [
+                        "ttl": 86400,
+                        "counts": {"fresh": 1, "stale": 0, "pending": 0, "failed": 0, "missing": 1},
+                        "items": [
                             {
-                                "id": 1,
-                                "year": 2020,
-                                "product": "Wine",
-                                "quantity": 1000
+                                "page": "PRODUCTION", "year": 2020, "suboption": None, "state": "fresh",
+                                "status": "stored", "rows": 67, "content_hash": "9f86d081884c7d65...",
+                                "fetched_at": "2024-05-01T02:00:00.123456+00:00", "age": 3600.0,
+                                "duration": 0.42, "error": None
                             },
                             {
-                                "id": 2,
-                                "year": 2021,
-                                "product": "Beer",
-                                "quantity": 2000
+                                "page": "PRODUCTION", "year": 2021, "suboption": None, "state": "missing",
+                                "status": None, "rows": None, "content_hash": None,
+                                "fetched_at": None, "age": None, "duration": None, "error": None
                             }
                         ]
                     }
@@ -465,10 +439,10 @@ async def production_route(
             },
         },
         400: {
-            "description": "Invalid years format.",
+            "description": "Invalid year range or pages.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                    "example": {"detail": "Invalid year range: year_from must be less than or equal to year_to."}
                 }
             },
         },
@@ -476,54 +450,59 @@ async def production_route(
             "description": "An unexpected error occurred.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                    "example": {"detail": "An unexpected error occurred: Database unavailable."}
                 }
             },
         },
     },
 )
-async def commercialization_route(
-    years: str = Query(
+def scrape_coverage_route(
+    year_from: int = Query(
         default=None,
-        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+        description="First year of the range (inclusive). Defaults to the first year recorded for the pages."
+    ),
+    year_to: int = Query(
+        default=None,
+        description="Last year of the range (inclusive). Defaults to the last year recorded for the pages."
+    ),
+    pages: str = Query(
+        default=None,
+        description="Comma-separated list of pages to report. If not provided, all pages are reported."
     ),
     db: Session = Depends(get_db)
 ):
     """
-    Retrieve commercialization data.
+    Report the scrape state of every (page, year, suboption) in a year range.
 
     Args:
-        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
-        db (Session): Database session provided via dependency injection.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        pages (str, optional): Comma-separated page names. Defaults to all pages.
+        db (Session): Database session dependency.
 
     Returns:
-        dict: Status and retrieved data as a list of dictionaries.
+        dict: Status, the ledger TTL, the number of items per state and one dictionary per item.
 
     Raises:
-        HTTPException:
-            - 400: If the `years` string cannot be parsed into a list of integers.
-            - 500: For any unexpected errors during data retrieval.
+        HTTPException: 400 - If the year range or pages are invalid.
+        HTTPException: 500 - For any unexpected errors while reading the ledger.
     """
 
-    try:
-        # Convert years string to a list of integers
-        years_list = get_years_as_list(years)
-        data = get_commercialization(db, years_list)
-
-        # Convert SQLAlchemy objects to dictionaries for the response
-        formatted_data = [
-            {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
-            for row in data
-        ]
-
-        return {"status": "success", "data": formatted_data}
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid year range: year_from must be less than or equal to year_to."
+        )
 
+    try:
+        scraper_pages = get_pages_as_list(pages)
     except ValueError as e:
-        # Handle invalid years format
         raise HTTPException(status_code=400, detail=str(e))
 
+    try:
+        return {"status": "success", **get_coverage(db, scraper_pages, year_range=(year_from, year_to))}
+
     except Exception as e:
-        # Handle unexpected errors
         raise HTTPException(
             status_code=500,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -531,94 +510,390 @@ async def commercialization_route(
 
 
 @router.get(
-    "/processing",
-    tags=["Processing Data"],
-    summary="Retrieve processing data",
-    description=(
-        "Fetch processing data from the database, optionally filtered by a list of years. "
-        "The years should be provided as a comma-separated string."
-    ),
+    "/jobs/{job_id}",
+    tags=["Scraping"],
+    summary="Retrieve the status of a background job",
+    description="Report the status, timings, stored row count and result of a job queued by `POST /scrape` or `POST /scrape/batch`.",
     responses={
         200: {
-            "description": "Successfully retrieved processing data.",
+            "description": "Job found.",
             "content": {
                 "application/json": {
                     "example": {
                         "status": "success",
-                        "data": [
-                            {
-                                "id": 1,
-                                "year": 2020,
-                                "variety": "Chardonnay",
-                                "quantity": 1500
-                            },
-                            {
-                                "id": 2,
-                                "year": 2021,
-                                "variety": "Pinot Noir",
-                                "quantity": 1200
-                            }
-                        ]
+                        "job": {
+                            "id": "3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70",
+                            "kind": "scrape",
+                            "params": {"year": 2020, "page": "PRODUCTION", "force": False},
+                            "status": "succeeded",
+                            "created_at": 1700000000.0,
+                            "started_at": 1700000000.1,
+                            "finished_at": 1700000002.4,
+                            "queued_seconds": 0.1,
+                            "run_seconds": 2.3,
+                            "rows": 67,
+                            "result": {"suboptions": {"default": 67}, "rows": 67},
+                            "error": None
+                        }
                     }
                 }
             },
         },
-        400: {
-            "description": "Invalid years format.",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
-                }
-            },
-        },
-        500: {
-            "description": "An unexpected error occurred.",
+        404: {
+            "description": "Unknown job id.",
             "content": {
                 "application/json": {
-                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                    "example": {"detail": "Job not found: 3f2c9a4e8b7d4c1e9f0a2b3c4d5e6f70."}
                 }
             },
         },
     },
 )
-async def processing_route(
+async def job_route(job_id: str):
+    """
+    Retrieve the status of a background job.
+
+    Args:
+        job_id (str): The job identifier returned when the job was queued.
+
+    Returns:
+        dict: Status and the job metadata.
+
+    Raises:
+        HTTPException: 404 - If the job is unknown or no longer retained.
+    """
+
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}.")
+
+    return {"status": "success", "job": job.to_dict()}
+
+
+@router.get(
+    "/import",
+    tags=["Import Data"],
+    summary="Retrieve import data",
+    description=(
+        "Fetch import data from the database, optionally filtered by a list of years. "
+        "The years should be provided as a comma-separated string. "
+        "Rows can also be filtered by `country`, `classification` and `year_from`/`year_to`, "
+        "and `fields` selects a subset of columns; all filters are applied in the SQL query. "
+        "Use `limit` to paginate by id; pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Use `format=arrow` or `format=parquet` (or the matching Accept header) for columnar output."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved import data.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": "{\"id\": 1, \"year\": 2020, ...}\n{\"id\": 2, \"year\": 2021, ...}\n"
+                },
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "next_cursor": None,
+                        "data": [
+                            {
+                                "id": 1,
+                                "year": 2020,
+                                "country": "USA",
+                                "quantity": 1000,
+                                "value": 50000
+                            },
+                            {
+                                "id": 2,
+                                "year": 2021,
+                                "country": "Canada",
+                                "quantity": 2000,
+                                "value": 75000
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid years format.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                }
+            },
+        },
+    },
+)
+async def import_route(
     years: str = Query(
         default=None,
         description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
     ),
-    db: Session = Depends(get_db)
+    limit: int = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of rows per page. If not provided, all matching rows are returned."
+    ),
+    cursor: str = Query(
+        default=None,
+        description="Opaque cursor returned as `next_cursor` by the previous page."
+    ),
+    stream: str = Query(
+        default=None,
+        description=(
+            "Set to 'ndjson' to stream rows as newline-delimited JSON instead of a single JSON document. "
+            "Cannot be combined with limit, cursor or format."
+        )
+    ),
+    country: str = Query(
+        default=None,
+        description="Comma-separated list of countries to filter by."
+    ),
+    classification: str = Query(
+        default=None,
+        description="Comma-separated list of classifications to filter by."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to return (e.g., 'year,value'). The `id` is always included."
+    ),
+    output_format: str = Query(
+        default=None,
+        alias="format",
+        description="Response format: 'json' (default), 'arrow' (Arrow IPC file) or 'parquet'. "
+                    "If not provided, the Accept header is used."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    accept: str = Header(default=None, include_in_schema=False),
+    accept_encoding: str = Header(default=None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Retrieve processing data.
+    Retrieve import data.
 
     Args:
         years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
-        db (Session): Database session provided via dependency injection.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        country (str, optional): Comma-separated list of countries to filter by. Defaults to None.
+        classification (str, optional): Comma-separated list of classifications to filter by. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve pre-compressed snapshots. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
 
     Returns:
-        dict: Status and retrieved data as a list of dictionaries.
+        Response: JSON with the status, retrieved data as a list of dictionaries and the cursor of the next page,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+                  For Arrow or Parquet, the encoded table, with the next cursor in the `X-Next-Cursor` header.
+                  Unfiltered single-year and full-table requests are answered with a brotli or gzip snapshot.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
 
     Raises:
         HTTPException:
-            - 400: If the `years` string cannot be parsed into a list of integers.
+            - 400: If the `years` string cannot be parsed into a list of integers,
+                   the cursor is malformed, the stream format is not supported,
+                   a stream is paginated or given a format, `fields` contains an unknown
+                   column or the format is not supported.
             - 500: For any unexpected errors during data retrieval.
     """
 
     try:
-        # Convert years string to a list of integers
-        years_list = get_years_as_list(years)
-        data = get_processing(db, years_list)
+        return await get_table_response(
+            db, Import, years, limit=limit, cursor=cursor, stream=stream,
+            filters=get_filters(country=country, classification=classification),
+            year_from=year_from, year_to=year_to, fields=fields,
+            output_format=output_format, if_none_match=if_none_match, accept=accept, accept_encoding=accept_encoding
+        )
+
+    except ValueError as e:
+        # Handle invalid years, cursor or stream format
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/export",
+    tags=["Export Data"],
+    summary="Retrieve export data",
+    description=(
+        "Fetch export data from the database, optionally filtered by a list of years. "
+        "The years should be provided as a comma-separated string. "
+        "Rows can also be filtered by `country`, `classification` and `year_from`/`year_to`, "
+        "and `fields` selects a subset of columns; all filters are applied in the SQL query. "
+        "Use `limit` to paginate by id; pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Use `format=arrow` or `format=parquet` (or the matching Accept header) for columnar output."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved export data.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": "{\"id\": 1, \"year\": 2020, ...}\n{\"id\": 2, \"year\": 2021, ...}\n"
+                },
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "next_cursor": None,
+                        "data": [
+                            {
+                                "id": 1,
+                                "year": 2020,
+                                "country": "Brazil",
+                                "quantity": 1000,
+                                "value": 50000
+                            },
+                            {
+                                "id": 2,
+                                "year": 2021,
+                                "country": "Argentina",
+                                "quantity": 2000,
+                                "value": 75000
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid years format.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                }
+            },
+        },
+    },
+)
+async def export_route(
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+    ),
+    limit: int = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of rows per page. If not provided, all matching rows are returned."
+    ),
+    cursor: str = Query(
+        default=None,
+        description="Opaque cursor returned as `next_cursor` by the previous page."
+    ),
+    stream: str = Query(
+        default=None,
+        description=(
+            "Set to 'ndjson' to stream rows as newline-delimited JSON instead of a single JSON document. "
+            "Cannot be combined with limit, cursor or format."
+        )
+    ),
+    country: str = Query(
+        default=None,
+        description="Comma-separated list of countries to filter by."
+    ),
+    classification: str = Query(
+        default=None,
+        description="Comma-separated list of classifications to filter by."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to return (e.g., 'year,value'). The `id` is always included."
+    ),
+    output_format: str = Query(
+        default=None,
+        alias="format",
+        description="Response format: 'json' (default), 'arrow' (Arrow IPC file) or 'parquet'. "
+                    "If not provided, the Accept header is used."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    accept: str = Header(default=None, include_in_schema=False),
+    accept_encoding: str = Header(default=None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retrieve export data.
 
-        # Convert SQLAlchemy objects to dictionaries for the response
-        formatted_data = [
-            {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
-            for row in data
-        ]
+    Args:
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        country (str, optional): Comma-separated list of countries to filter by. Defaults to None.
+        classification (str, optional): Comma-separated list of classifications to filter by. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve pre-compressed snapshots. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        Response: JSON with the status, retrieved data as a list of dictionaries and the cursor of the next page,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+                  For Arrow or Parquet, the encoded table, with the next cursor in the `X-Next-Cursor` header.
+                  Unfiltered single-year and full-table requests are answered with a brotli or gzip snapshot.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
+
+    Raises:
+        HTTPException:
+            - 400: If the `years` string cannot be parsed into a list of integers,
+                   the cursor is malformed, the stream format is not supported,
+                   a stream is paginated or given a format, `fields` contains an unknown
+                   column or the format is not supported.
+            - 500: For any unexpected errors during data retrieval.
+    """
 
-        return {"status": "success", "data": formatted_data}
+    try:
+        return await get_table_response(
+            db, Export, years, limit=limit, cursor=cursor, stream=stream,
+            filters=get_filters(country=country, classification=classification),
+            year_from=year_from, year_to=year_to, fields=fields,
+            output_format=output_format, if_none_match=if_none_match, accept=accept, accept_encoding=accept_encoding
+        )
 
     except ValueError as e:
-        # Handle invalid years format
+        # Handle invalid years, cursor or stream format
         raise HTTPException(status_code=400, detail=str(e))
 
     except Exception as e:
@@ -627,3 +902,1093 @@ async def processing_route(
             status_code=500,
             detail=f"An unexpected error occurred: {str(e)}"
         )
+
+
+@router.get(
+    "/production",
+    tags=["Production Data"],
+    summary="Retrieve production data",
+    description=(
+        "Fetch production data from the database, optionally filtered by a list of years. "
+        "The years should be provided as a comma-separated string. "
+        "Rows can also be filtered by `product` and `year_from`/`year_to`, "
+        "and `fields` selects a subset of columns; all filters are applied in the SQL query. "
+        "Use `limit` to paginate by id; pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Use `format=arrow` or `format=parquet` (or the matching Accept header) for columnar output."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved production data.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": "{\"id\": 1, \"year\": 2020, ...}\n{\"id\": 2, \"year\": 2021, ...}\n"
+                },
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "next_cursor": None,
+                        "data": [
+                            {
+                                "id": 1,
+                                "year": 2020,
+                                "product": "Wheat",
+                                "quantity": 1000
+                            },
+                            {
+                                "id": 2,
+                                "year": 2021,
+                                "product": "Corn",
+                                "quantity": 2000
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid years format.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                }
+            },
+        },
+    },
+)
+async def production_route(
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+    ),
+    limit: int = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of rows per page. If not provided, all matching rows are returned."
+    ),
+    cursor: str = Query(
+        default=None,
+        description="Opaque cursor returned as `next_cursor` by the previous page."
+    ),
+    stream: str = Query(
+        default=None,
+        description=(
+            "Set to 'ndjson' to stream rows as newline-delimited JSON instead of a single JSON document. "
+            "Cannot be combined with limit, cursor or format."
+        )
+    ),
+    product: str = Query(
+        default=None,
+        description="Comma-separated list of products to filter by."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to return (e.g., 'year,value'). The `id` is always included."
+    ),
+    output_format: str = Query(
+        default=None,
+        alias="format",
+        description="Response format: 'json' (default), 'arrow' (Arrow IPC file) or 'parquet'. "
+                    "If not provided, the Accept header is used."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    accept: str = Header(default=None, include_in_schema=False),
+    accept_encoding: str = Header(default=None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retrieve production data.
+
+    Args:
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        product (str, optional): Comma-separated list of products to filter by. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve pre-compressed snapshots. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        Response: JSON with the status, retrieved data as a list of dictionaries and the cursor of the next page,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+                  For Arrow or Parquet, the encoded table, with the next cursor in the `X-Next-Cursor` header.
+                  Unfiltered single-year and full-table requests are answered with a brotli or gzip snapshot.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
+
+    Raises:
+        HTTPException:
+            - 400: If the `years` string cannot be parsed into a list of integers,
+                   the cursor is malformed, the stream format is not supported,
+                   a stream is paginated or given a format, `fields` contains an unknown
+                   column or the format is not supported.
+            - 500: For any unexpected errors during data retrieval.
+    """
+
+    try:
+        return await get_table_response(
+            db, Production, years, limit=limit, cursor=cursor, stream=stream,
+            filters=get_filters(product=product),
+            year_from=year_from, year_to=year_to, fields=fields,
+            output_format=output_format, if_none_match=if_none_match, accept=accept, accept_encoding=accept_encoding
+        )
+
+    except ValueError as e:
+        # Handle invalid years, cursor or stream format
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/commercialization",
+    tags=["Commercialization Data"],
+    summary="Retrieve commercialization data",
+    description=(
+        "Fetch commercialization data from the database, optionally filtered by a list of years. "
+        "The years should be provided as a comma-separated string. "
+        "Rows can also be filtered by `product` and `year_from`/`year_to`, "
+        "and `fields` selects a subset of columns; all filters are applied in the SQL query. "
+        "Use `limit` to paginate by id; pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Use `format=arrow` or `format=parquet` (or the matching Accept header) for columnar output."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved commercialization data.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": "{\"id\": 1, \"year\": 2020, ...}\n{\"id\": 2, \"year\": 2021, ...}\n"
+                },
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "next_cursor": None,
+                        "data": [
+                            {
+                                "id": 1,
+                                "year": 2020,
+                                "product": "Wine",
+                                "quantity": 1000
+                            },
+                            {
+                                "id": 2,
+                                "year": 2021,
+                                "product": "Beer",
+                                "quantity": 2000
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid years format.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                }
+            },
+        },
+    },
+)
+async def commercialization_route(
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+    ),
+    limit: int = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of rows per page. If not provided, all matching rows are returned."
+    ),
+    cursor: str = Query(
+        default=None,
+        description="Opaque cursor returned as `next_cursor` by the previous page."
+    ),
+    stream: str = Query(
+        default=None,
+        description=(
+            "Set to 'ndjson' to stream rows as newline-delimited JSON instead of a single JSON document. "
+            "Cannot be combined with limit, cursor or format."
+        )
+    ),
+    product: str = Query(
+        default=None,
+        description="Comma-separated list of products to filter by."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to return (e.g., 'year,value'). The `id` is always included."
+    ),
+    output_format: str = Query(
+        default=None,
+        alias="format",
+        description="Response format: 'json' (default), 'arrow' (Arrow IPC file) or 'parquet'. "
+                    "If not provided, the Accept header is used."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    accept: str = Header(default=None, include_in_schema=False),
+    accept_encoding: str = Header(default=None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retrieve commercialization data.
+
+    Args:
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        product (str, optional): Comma-separated list of products to filter by. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve pre-compressed snapshots. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        Response: JSON with the status, retrieved data as a list of dictionaries and the cursor of the next page,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+                  For Arrow or Parquet, the encoded table, with the next cursor in the `X-Next-Cursor` header.
+                  Unfiltered single-year and full-table requests are answered with a brotli or gzip snapshot.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
+
+    Raises:
+        HTTPException:
+            - 400: If the `years` string cannot be parsed into a list of integers,
+                   the cursor is malformed, the stream format is not supported,
+                   a stream is paginated or given a format, `fields` contains an unknown
+                   column or the format is not supported.
+            - 500: For any unexpected errors during data retrieval.
+    """
+
+    try:
+        return await get_table_response(
+            db, Commercialization, years, limit=limit, cursor=cursor, stream=stream,
+            filters=get_filters(product=product),
+            year_from=year_from, year_to=year_to, fields=fields,
+            output_format=output_format, if_none_match=if_none_match, accept=accept, accept_encoding=accept_encoding
+        )
+
+    except ValueError as e:
+        # Handle invalid years, cursor or stream format
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/processing",
+    tags=["Processing Data"],
+    summary="Retrieve processing data",
+    description=(
+        "Fetch processing data from the database, optionally filtered by a list of years. "
+        "The years should be provided as a comma-separated string. "
+        "Rows can also be filtered by `variety`, `classification` and `year_from`/`year_to`, "
+        "and `fields` selects a subset of columns; all filters are applied in the SQL query. "
+        "Use `limit` to paginate by id; pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Use `format=arrow` or `format=parquet` (or the matching Accept header) for columnar output."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved processing data.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": "{\"id\": 1, \"year\": 2020, ...}\n{\"id\": 2, \"year\": 2021, ...}\n"
+                },
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "next_cursor": None,
+                        "data": [
+                            {
+                                "id": 1,
+                                "year": 2020,
+                                "variety": "Chardonnay",
+                                "quantity": 1500
+                            },
+                            {
+                                "id": 2,
+                                "year": 2021,
+                                "variety": "Pinot Noir",
+                                "quantity": 1200
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid years format.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid format for years. Expected comma-separated integers."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving data."}
+                }
+            },
+        },
+    },
+)
+async def processing_route(
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data will be returned."
+    ),
+    limit: int = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of rows per page. If not provided, all matching rows are returned."
+    ),
+    cursor: str = Query(
+        default=None,
+        description="Opaque cursor returned as `next_cursor` by the previous page."
+    ),
+    stream: str = Query(
+        default=None,
+        description=(
+            "Set to 'ndjson' to stream rows as newline-delimited JSON instead of a single JSON document. "
+            "Cannot be combined with limit, cursor or format."
+        )
+    ),
+    variety: str = Query(
+        default=None,
+        description="Comma-separated list of grape varieties to filter by."
+    ),
+    classification: str = Query(
+        default=None,
+        description="Comma-separated list of classifications to filter by."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to return (e.g., 'year,value'). The `id` is always included."
+    ),
+    output_format: str = Query(
+        default=None,
+        alias="format",
+        description="Response format: 'json' (default), 'arrow' (Arrow IPC file) or 'parquet'. "
+                    "If not provided, the Accept header is used."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    accept: str = Header(default=None, include_in_schema=False),
+    accept_encoding: str = Header(default=None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retrieve processing data.
+
+    Args:
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        variety (str, optional): Comma-separated list of varieties to filter by. Defaults to None.
+        classification (str, optional): Comma-separated list of classifications to filter by. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve pre-compressed snapshots. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        Response: JSON with the status, retrieved data as a list of dictionaries and the cursor of the next page,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+                  For Arrow or Parquet, the encoded table, with the next cursor in the `X-Next-Cursor` header.
+                  Unfiltered single-year and full-table requests are answered with a brotli or gzip snapshot.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
+
+    Raises:
+        HTTPException:
+            - 400: If the `years` string cannot be parsed into a list of integers,
+                   the cursor is malformed, the stream format is not supported,
+                   a stream is paginated or given a format, `fields` contains an unknown
+                   column or the format is not supported.
+            - 500: For any unexpected errors during data retrieval.
+    """
+
+    try:
+        return await get_table_response(
+            db, Processing, years, limit=limit, cursor=cursor, stream=stream,
+            filters=get_filters(variety=variety, classification=classification),
+            year_from=year_from, year_to=year_to, fields=fields,
+            output_format=output_format, if_none_match=if_none_match, accept=accept, accept_encoding=accept_encoding
+        )
+
+    except ValueError as e:
+        # Handle invalid years, cursor or stream format
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/aggregate",
+    tags=["Aggregation"],
+    summary="Aggregate data of a page",
+    description=(
+        "Compute `sum`, `avg`, `min`, `max` or `count` of the numeric columns (`quantity`, `value`) "
+        "of a page, grouped by one or more descriptive columns (e.g., `year`, `country`, `classification`, "
+        "`product`). The aggregation runs as a single GROUP BY query in the database, so only one row per "
+        "group is returned. Results are named `{function}_{measure}` (e.g., `sum_value`)."
+    ),
+    responses={
+        200: {
+            "description": "Successfully aggregated the data.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "page": "EXPORT",
+                        "data": [
+                            {"year": 2020, "sum_quantity": 25000000, "sum_value": 9800000},
+                            {"year": 2021, "sum_quantity": 27000000, "sum_value": 11200000}
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid page, grouping column, function or measure.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid group_by: ['product']. Must be a subset of ['year', 'country', 'classification']."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while aggregating data."}
+                }
+            },
+        },
+    },
+)
+async def aggregate_route(
+    page: str = Query(description=f"The page to aggregate. Must be one of {[p.name for p in PageModelMapping]}."),
+    group_by: str = Query(
+        default=None,
+        description="Comma-separated list of columns to group by (e.g., 'year,country'). If not provided, "
+                    "a single row with the totals is returned."
+    ),
+    functions: str = Query(
+        default="sum",
+        description=f"Comma-separated list of aggregate functions. Must be a subset of {[f.value for f in AggregateFunction]}."
+    ),
+    measures: str = Query(
+        default=None,
+        description="Comma-separated list of numeric columns to aggregate. If not provided, all of them are used."
+    ),
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data is aggregated."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Aggregate data of a page.
+
+    Args:
+        page (str): The page to aggregate, corresponding to a valid `PageModelMapping` member.
+        group_by (str, optional): Comma-separated list of columns to group by. Defaults to None.
+        functions (str, optional): Comma-separated list of aggregate functions. Defaults to "sum".
+        measures (str, optional): Comma-separated list of numeric columns to aggregate. Defaults to None.
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        ORJSONResponse: Status, page and one dictionary per group with the aggregated values,
+                      with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+
+    Raises:
+        HTTPException:
+            - 400: If the page is invalid, the `years` string cannot be parsed, or a grouping
+                   column, function or measure is not supported for the page.
+            - 500: For any unexpected errors during aggregation.
+    """
+
+    try:
+        # Validate the page against PageModelMapping
+        model = PageModelMapping[page.upper()].value
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid page: {page}. Must be one of {[p.name for p in PageModelMapping]}."
+        )
+
+    try:
+        group_by_list = get_fields_as_list(group_by)
+        functions_list = get_fields_as_list(functions)
+        measures_list = get_fields_as_list(measures)
+        years_list = get_years_as_list(years)
+        year_range = (year_from, year_to)
+
+        # Answer unchanged polls from the data versions alone
+        key = ("aggregate", group_by_list, functions_list, measures_list,
+               get_query_key(years_list, year_range=year_range))
+        etag = await get_etag(db, model, key, years_list, year_range)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        data = await get_aggregates(
+            db,
+            model,
+            group_by=group_by_list,
+            functions=functions_list,
+            measures=measures_list,
+            years=years_list,
+            year_range=year_range,
+        )
+
+        return ORJSONResponse(content={"status": "success", "page": page.upper(), "data": data}, headers=headers)
+
+    except ValueError as e:
+        # Handle invalid years, grouping columns, functions or measures
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/summary/{page}",
+    tags=["Aggregation"],
+    summary="Retrieve the yearly totals of a page",
+    description=(
+        "Return the total `quantity` (and `value` for import and export), and the row count, of a page per "
+        "year and category: the classification for import, export and processing, and the category "
+        "(e.g., `VINHO DE MESA`) for production and commercialization. The totals of production, processing "
+        "and commercialization add up the category rows only, as they already include the rows nested "
+        "under them. Totals are maintained in a summary table on every write, so "
+        "the response time depends on the number of years, not on the number of rows."
+    ),
+    responses={
+        200: {
+            "description": "Successfully retrieved the yearly totals.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "page": "EXPORT",
+                        "category": "classification",
+                        "data": [
+                            {"year": 2020, "classification": "Espumantes", "quantity": 1200, "value": 9800, "rows": 31},
+                            {"year": 2020, "classification": "Vinhos de mesa", "quantity": 25000, "value": 98000, "rows": 110}
+                        ]
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid page or years.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid page: wine. Must be one of ['PRODUCTION', 'PROCESSING', 'COMMERCIALIZATION', 'IMPORT', 'EXPORT']."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while retrieving the totals."}
+                }
+            },
+        },
+    },
+)
+async def summary_route(
+    page: str,
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the totals. If not provided, all years are returned."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    categories: str = Query(
+        default=None,
+        description="Comma-separated list of classifications (or products) to filter by."
+    ),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Retrieve the yearly totals of a page.
+
+    Args:
+        page (str): The page to summarize, corresponding to a valid `PageModelMapping` member.
+        years (str, optional): Comma-separated list of years to filter the totals. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        categories (str, optional): Comma-separated list of categories to filter by. Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        ORJSONResponse: Status, page, category column and one dictionary per (year, category),
+                        with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+
+    Raises:
+        HTTPException:
+            - 400: If the page is invalid or the `years` string cannot be parsed.
+            - 500: For any unexpected errors during retrieval.
+    """
+
+    try:
+        # Validate the page against PageModelMapping
+        model = PageModelMapping[page.upper()].value
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid page: {page}. Must be one of {[p.name for p in PageModelMapping]}."
+        )
+
+    try:
+        years_list = get_years_as_list(years)
+        categories_list = get_fields_as_list(categories)
+        year_range = (year_from, year_to)
+
+        # Answer unchanged polls from the data versions alone
+        key = ("summary", categories_list, get_query_key(years_list, year_range=year_range))
+        etag = await get_etag(db, model, key, years_list, year_range)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        data = await get_summary(db, model, years=years_list, year_range=year_range, categories=categories_list)
+
+        return ORJSONResponse(
+            content={"status": "success", "page": page.upper(), "category": SummaryKeyMapping[model.__name__], "data": data},
+            headers=headers,
+        )
+
+    except ValueError as e:
+        # Handle invalid years
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/analytics/{page}",
+    tags=["Analytics"],
+    summary="Compute time-series analytics of a page",
+    description=(
+        "Compute derived yearly series of a measure for every entity of a page (e.g., every country for "
+        "`export`): year-over-year change (`yoy`), compound annual growth rate (`cagr`), trailing rolling "
+        "mean (`rolling_mean`) and share of the yearly total (`share`), plus the same series for the total. "
+        "The yearly totals are loaded with a single GROUP BY query and the metrics are computed for all "
+        "entities at once. Results are cached until the next write to the page. Undefined values (e.g., "
+        "growth from zero) are returned as null."
+    ),
+    responses={
+        200: {
+            "description": "Successfully computed the analytics.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "entity": "country",
+                        "measure": "value",
+                        "window": 3,
+                        "years": [2021, 2022, 2023],
+                        "series": [
+                            {
+                                "entity": "Paraguay",
+                                "values": [100.0, 120.0, 90.0],
+                                "yoy": [None, 0.2, -0.25],
+                                "cagr": -0.0513,
+                                "rolling_mean": [100.0, 110.0, 103.33],
+                                "share": [0.5, 0.6, 0.45]
+                            }
+                        ],
+                        "total": {
+                            "values": [200.0, 200.0, 200.0],
+                            "yoy": [None, 0.0, 0.0],
+                            "cagr": 0.0,
+                            "rolling_mean": [200.0, 200.0, 200.0]
+                        }
+                    }
+                }
+            },
+        },
+        304: {"description": "The data has not changed since the response with the given ETag."},
+        400: {
+            "description": "Invalid page, entity, measure or metric.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid metrics: ['median']. Must be a subset of ['yoy', 'cagr', 'rolling_mean', 'share']."}
+                }
+            },
+        },
+        500: {
+            "description": "An unexpected error occurred.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "An unexpected error occurred while computing analytics."}
+                }
+            },
+        },
+    },
+)
+async def analytics_route(
+    page: str,
+    entity: str = Query(
+        default=None,
+        description="Column identifying each series (e.g., 'country', 'classification', 'product'). "
+                    "If not provided, the main descriptive column of the page is used."
+    ),
+    measure: str = Query(default="quantity", description="Numeric column to analyze ('quantity' or 'value')."),
+    metrics: str = Query(
+        default=None,
+        description=f"Comma-separated list of metrics. Must be a subset of {[m.value for m in AnalyticsMetric]}. "
+                    "If not provided, all metrics are computed."
+    ),
+    window: int = Query(default=3, ge=1, le=50, description="Number of years of the rolling mean."),
+    entities: str = Query(
+        default=None,
+        description="Comma-separated list of entities to analyze. If not provided, all entities are analyzed."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    if_none_match: str = Header(
+        default=None,
+        description="ETag of a previous response. If the data has not changed, 304 Not Modified is returned."
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Compute time-series analytics of a page.
+
+    Args:
+        page (str): The page to analyze, corresponding to a valid `PageModelMapping` member.
+        entity (str, optional): Column identifying each series. Defaults to None.
+        measure (str, optional): Numeric column to analyze. Defaults to "quantity".
+        metrics (str, optional): Comma-separated list of metrics. Defaults to None (all).
+        window (int, optional): Number of years of the rolling mean. Defaults to 3.
+        entities (str, optional): Comma-separated list of entities to analyze. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        db (AsyncSession): Async database session provided via dependency injection.
+
+    Returns:
+        Response: JSON with the years, one series per entity and the series of the total,
+                  with an `ETag` header. 304 Not Modified without a body if `if_none_match` is current.
+
+    Raises:
+        HTTPException:
+            - 400: If the page is invalid, or the entity, measure or a metric is not supported for the page.
+            - 500: For any unexpected errors during the computation.
+    """
+
+    try:
+        # Validate the page against PageModelMapping
+        model = PageModelMapping[page.upper()].value
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid page: {page}. Must be one of {[p.name for p in PageModelMapping]}."
+        )
+
+    try:
+        metrics_list = get_metrics_as_list(metrics)
+        entities_list = get_fields_as_list(entities)
+        year_range = (year_from, year_to)
+
+        # Answer unchanged polls from the data versions alone
+        key = ("analytics", entity, measure, metrics_list, window, entities_list, get_query_key(year_range=year_range))
+        etag = await get_etag(db, model, key, year_range=year_range)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        body = await get_analytics(
+            db,
+            model,
+            etag,
+            entity=entity,
+            measure=measure,
+            metrics=metrics_list,
+            window=window,
+            entities=entities_list,
+            year_range=year_range,
+        )
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    except ValueError as e:
+        # Handle invalid entities, measures or metrics
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except Exception as e:
+        # Handle unexpected errors
+        raise HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+
+@router.get(
+    "/export-csv/{page}",
+    tags=["CSV Export"],
+    summary="Export the data of a page as CSV",
+    description=(
+        "Stream the rows of a page as CSV, optionally gzip-compressed, with the same filters as the "
+        "retrieval endpoints. Rows are read through a server-side cursor and written incrementally, "
+        "so the full history can be exported in constant memory."
+    ),
+    responses={
+        200: {
+            "description": "The CSV file, streamed.",
+            "content": {
+                "text/csv": {"example": "id,year,country,quantity,value,classification\n1,2020,Brazil,1000,50000,Espumantes\n"},
+                "application/gzip": {},
+            },
+        },
+        400: {
+            "description": "Invalid page, years format, filter or field.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid filter: country. Not a column of production."}
+                }
+            },
+        },
+    },
+)
+async def export_csv_route(
+    page: str,
+    years: str = Query(
+        default=None,
+        description="Comma-separated list of years to filter the data. If not provided, all data will be exported."
+    ),
+    year_from: int = Query(default=None, description="First year of the range (inclusive)."),
+    year_to: int = Query(default=None, description="Last year of the range (inclusive)."),
+    country: str = Query(default=None, description="Comma-separated list of countries to filter by (import/export)."),
+    product: str = Query(
+        default=None,
+        description="Comma-separated list of products to filter by (production/commercialization)."
+    ),
+    variety: str = Query(default=None, description="Comma-separated list of grape varieties to filter by (processing)."),
+    classification: str = Query(
+        default=None,
+        description="Comma-separated list of classifications to filter by (import/export/processing)."
+    ),
+    fields: str = Query(
+        default=None,
+        description="Comma-separated list of columns to export (e.g., 'year,value'). The `id` is always included."
+    ),
+    gzip: bool = Query(default=False, description="Compress the CSV with gzip."),
+):
+    """
+    Export the data of a page as CSV.
+
+    Args:
+        page (str): The page to export, corresponding to a valid `PageModelMapping` member.
+        years (str, optional): Comma-separated list of years to filter the data. Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        country (str, optional): Comma-separated list of countries to filter by. Defaults to None.
+        product (str, optional): Comma-separated list of products to filter by. Defaults to None.
+        variety (str, optional): Comma-separated list of varieties to filter by. Defaults to None.
+        classification (str, optional): Comma-separated list of classifications to filter by. Defaults to None.
+        fields (str, optional): Comma-separated list of columns to export. Defaults to None.
+        gzip (bool, optional): Compress the output with gzip. Defaults to False.
+
+    Returns:
+        StreamingResponse: The CSV (or gzip-compressed CSV) file.
+
+    Raises:
+        HTTPException:
+            - 400: If the page is invalid, the `years` string cannot be parsed, or a filter
+                   or field is not a column of the page.
+    """
+
+    try:
+        # Validate the page against PageModelMapping
+        model = PageModelMapping[page.upper()].value
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid page: {page}. Must be one of {[p.name for p in PageModelMapping]}."
+        )
+
+    try:
+        chunks = csv_handler.iter_csv(
+            model,
+            years=get_years_as_list(years),
+            filters=get_filters(country=country, product=product, variety=variety, classification=classification),
+            year_range=(year_from, year_to),
+            fields=get_fields_as_list(fields),
+            compress=gzip,
+        )
+    except ValueError as e:
+        # Handle invalid years, filters or fields
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = f"{model.__tablename__}.csv.gz" if gzip else f"{model.__tablename__}.csv"
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/pool-stats",
+    tags=["Monitoring"],
+    summary="Report database connection pool telemetry",
+    description=(
+        "Report the configuration, current state and checkout telemetry of the sync and async database "
+        "connection pools: checkout latency percentiles, time spent waiting for a free connection, overflow "
+        "usage, peak concurrent checkouts, hold times, timeouts and invalidated connections. "
+        "Pass `reset=true` to start a new measurement window after reading the current one."
+    ),
+    responses={
+        200: {
+            "description": "Pool telemetry.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "since": 1700000000.0,
+                        "pools": {
+                            "async": {
+                                "class": "MonitoredAsyncAdaptedQueuePool",
+                                "pool_size": 5,
+                                "max_overflow": 10,
+                                "timeout": 30.0,
+                                "recycle": 1800,
+                                "pre_ping": True,
+                                "checked_out": 1,
+                                "checked_in": 4,
+                                "overflow": 0,
+                                "peak_checked_out": 7,
+                                "peak_overflow": 2,
+                                "checkouts": 1520,
+                                "checkins": 1519,
+                                "connects": 7,
+                                "invalidations": 0,
+                                "soft_invalidations": 0,
+                                "timeouts": 0,
+                                "waits": 0,
+                                "checkout_ms": {"mean": 0.21, "p50": 0.12, "p95": 0.45, "p99": 3.8, "max": 41.2},
+                                "wait_ms": {"total": 0.0, "max": 0.0},
+                                "held_ms": {"mean": 4.9, "max": 612.3}
+                            }
+                        }
+                    }
+                }
+            },
+        },
+    },
+)
+async def pool_stats_route(reset: bool = Query(False, description="Clear the collected telemetry after reading it.")):
+    """
+    Report database connection pool telemetry.
+
+    Args:
+        reset (bool): Whether to clear the collected telemetry after reading it.
+
+    Returns:
+        dict: Status, the start of the measurement window and the telemetry of each pool.
+    """
+
+    snapshot = pool_monitor.snapshot()
+    if reset:
+        pool_monitor.reset()
+
+    return {"status": "success", **snapshot}
@@ -0,0 +1,232 @@
+"""
+This module computes derived time series of a page for dashboards and forecasting.
+
+The (entity x year) series of a measure is loaded with a single GROUP BY query and pivoted
+into a matrix with one row per entity and one column per year, so every metric is computed
+for all entities at once with vectorized NumPy and pandas operations.
+
+Functions:
+    get_analytics(db: AsyncSession, model: Base, etag: str, entity: str = None, measure: str = "quantity",
+                  metrics: list = None, window: int = 3, entities: list = None, year_range: tuple = None) -> bytes:
+        Compute the derived series of a page as an encoded JSON body, served from the analytics cache when possible.
+
+    load_matrix(db: AsyncSession, model: Base, entity: str, measure: str, entities: list = None,
+                year_range: tuple = None) -> pd.DataFrame:
+        Load the yearly totals of a measure per entity as an (entity x year) matrix.
+
+    compute_metrics(matrix: pd.DataFrame, metrics: list, window: int = 3) -> dict:
+        Compute the requested metrics for every row of a matrix at once.
+
+    get_metrics_as_list(metrics: str) -> list[str]:
+        Convert a comma-separated string of metric names into a validated list.
+"""
+
+import orjson
+import numpy as np
+import pandas as pd
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.storage import async_db_handler, analytics_cache, AnalyticsMetric, ModelKeyMapping
+
+
+async def get_analytics(
+    db: AsyncSession,
+    model,
+    etag: str,
+    entity: str = None,
+    measure: str = "quantity",
+    metrics: list = None,
+    window: int = 3,
+    entities: list = None,
+    year_range: tuple = None,
+) -> bytes:
+    """
+    Compute the derived series of a page as an encoded JSON body.
+
+    Results are cached under the ETag of the data they were computed from, so a cached
+    result is reused until the next write to the table and never served stale.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        etag (str): The ETag of the request, derived from the current data versions.
+        entity (str, optional): The column identifying a series. Defaults to None, the first
+                                natural key column after the year (e.g., "country" for Export).
+        measure (str, optional): The numeric column to analyze. Defaults to "quantity".
+        metrics (list, optional): Names of `AnalyticsMetric` members to compute. Defaults to None (all).
+        window (int, optional): Number of years of the rolling mean. Defaults to 3.
+        entities (list, optional): Only analyze these entities. Defaults to None (all).
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+    Returns:
+        bytes: The JSON body with the years, one series per entity and the series of the total.
+
+    Raises:
+        ValueError: If the entity or measure is not a column of the table.
+    """
+
+    entity = entity or ModelKeyMapping[model.__name__][1]
+    metrics = metrics or [metric.value for metric in AnalyticsMetric]
+    table_name = model.__tablename__
+    key = ("analytics", etag, entity, measure, tuple(metrics), window, tuple(sorted(entities or ())))
+
+    body = analytics_cache.get(table_name, key)
+    if body is not None:
+        return body
+
+    matrix = await load_matrix(db, model, entity, measure, entities=entities, year_range=year_range)
+    total = matrix.sum(axis=0, min_count=1).to_frame().T
+
+    computed = compute_metrics(matrix, metrics, window)
+    computed_total = compute_metrics(total, [metric for metric in metrics if metric != AnalyticsMetric.SHARE.value], window)
+
+    series = [
+        {"entity": name, **{metric: values[row] for metric, values in computed.items()}}
+        for row, name in enumerate(matrix.index)
+    ]
+
+    body = orjson.dumps(
+        {
+            "status": "success",
+            "entity": entity,
+            "measure": measure,
+            "window": window,
+            "years": matrix.columns.tolist(),
+            "series": series,
+            "total": {metric: values[0] for metric, values in computed_total.items()},
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    analytics_cache.put(table_name, key, body, year_range=year_range)
+
+    return body
+
+
+async def load_matrix(db: AsyncSession, model, entity: str, measure: str, entities: list = None, year_range: tuple = None):
+    """
+    Load the yearly totals of a measure per entity as an (entity x year) matrix.
+
+    The totals are computed by one GROUP BY query. Years between the first and the last
+    year of the data without any rows for an entity are kept as missing values, so
+    adjacent columns are always consecutive years.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        entity (str): The column identifying a series.
+        measure (str): The numeric column to total.
+        entities (list, optional): Only load these entities. Defaults to None (all).
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+    Returns:
+        pd.DataFrame: A float matrix indexed by entity, with one column per year.
+
+    Raises:
+        ValueError: If the entity or measure is not a column of the table.
+    """
+
+    if entity == "year":
+        raise ValueError("Invalid entity: year. The series are indexed by year.")
+
+    rows = await async_db_handler.aggregate(
+        db,
+        model,
+        group_by=[entity, "year"],
+        functions=["sum"],
+        measures=[measure],
+        filters={entity: entities} if entities else None,
+        year_range=year_range,
+    )
+
+    frame = pd.DataFrame(rows, columns=[entity, "year", f"sum_{measure}"])
+    frame[entity] = frame[entity].fillna("")
+    matrix = frame.pivot(index=entity, columns="year", values=f"sum_{measure}").astype("float64")
+
+    if matrix.columns.empty:
+        return matrix
+
+    years = range(int(matrix.columns.min()), int(matrix.columns.max()) + 1)
+    return matrix.reindex(columns=list(years))
+
+
+def compute_metrics(matrix, metrics: list, window: int = 3) -> dict:
+    """
+    Compute the requested metrics for every row of a matrix at once.
+
+    Relative changes are undefined when the previous value is zero or missing, and the
+    CAGR is undefined when the first value is not positive; these are returned as NaN
+    (serialized as null).
+
+    Args:
+        matrix (pd.DataFrame): An (entity x year) float matrix with consecutive year columns.
+        metrics (list): Names of `AnalyticsMetric` members to compute.
+        window (int, optional): Number of years of the rolling mean. Defaults to 3.
+
+    Returns:
+        dict: "values" and each requested metric mapped to an array with one row per entity
+              (or one value per entity for "cagr").
+
+    Example:
+        compute_metrics(matrix, ["yoy", "cagr"])
+        # {"values": array([[100., 110.]]), "yoy": array([[nan, 0.1]]), "cagr": array([0.1])}
+    """
+
+    values = np.ascontiguousarray(matrix.to_numpy(dtype="float64"))
+    result = {"values": values}
+    observed = ~np.isnan(values)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if AnalyticsMetric.YOY.value in metrics:
+            previous, current = values[:, :-1], values[:, 1:]
+            yoy = np.full_like(values, np.nan)
+            yoy[:, 1:] = np.where(previous != 0, (current - previous) / previous, np.nan)
+            result["yoy"] = yoy
+
+        if AnalyticsMetric.CAGR.value in metrics and values.shape[1] == 0:
+            result["cagr"] = np.full(values.shape[0], np.nan)
+        elif AnalyticsMetric.CAGR.value in metrics:
+            # Positions of the first and last observed years of each row
+            first = observed.argmax(axis=1)
+            last = values.shape[1] - 1 - observed[:, ::-1].argmax(axis=1)
+            rows = np.arange(values.shape[0])
+            start, end, periods = values[rows, first], values[rows, last], (last - first).astype("float64")
+            valid = observed.any(axis=1) & (periods > 0) & (start > 0) & (end >= 0)
+            result["cagr"] = np.where(valid, np.power(end / start, 1 / periods) - 1, np.nan)
+
+        if AnalyticsMetric.ROLLING_MEAN.value in metrics:
+            result["rolling_mean"] = np.ascontiguousarray(
+                matrix.T.rolling(window, min_periods=1).mean().T.to_numpy(dtype="float64")
+            )
+
+        if AnalyticsMetric.SHARE.value in metrics:
+            totals = np.nansum(values, axis=0)
+            result["share"] = np.where(totals != 0, values / totals, np.nan)
+
+    return result
+
+
+def get_metrics_as_list(metrics: str) -> list[str]:
+    """
+    Convert a comma-separated string of metric names into a validated list.
+
+    Args:
+        metrics (str): Comma-separated metric names (e.g., "yoy,cagr"). If empty, all metrics are returned.
+
+    Returns:
+        list[str]: The requested metric names.
+
+    Raises:
+        ValueError: If any metric is not an `AnalyticsMetric` value.
+    """
+
+    supported = [metric.value for metric in AnalyticsMetric]
+    if not metrics:
+        return supported
+
+    requested = [metric.strip().lower() for metric in metrics.split(",") if metric.strip()]
+    invalid = [metric for metric in requested if metric not in supported]
+    if invalid:
+        raise ValueError(f"Invalid metrics: {invalid}. Must be a subset of {supported}.")
+
+    return requested
@@ -2,105 +2,738 @@
 This module provides functions for retrieving data from the database
 and utility functions for processing query parameters.
 
+The functions taking a database session are coroutines running on the async storage
+layer (`AsyncDBHandler`), so the `async def` routes never block the event loop on I/O.
+Streaming responses read through their own synchronous sessions in a worker thread.
+
 Functions:
-    get_imports(db: Session, years: list = None) -> list:
+    get_imports(db: AsyncSession, years: list = None, limit: int = None, after_id: int = None,
+                filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
         Retrieve import data for the given years or all data if no years are specified.
 
-    get_exports(db: Session, years: list = None) -> list:
+    get_exports(db: AsyncSession, years: list = None, limit: int = None, after_id: int = None,
+                filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
         Retrieve export data for the given years or all data if no years are specified.
 
-    get_production(db: Session, years: list = None) -> list:
+    get_production(db: AsyncSession, years: list = None, limit: int = None, after_id: int = None,
+                   filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
         Retrieve production data for the given years or all data if no years are specified.
 
-    get_commercialization(db: Session, years: list = None) -> list:
+    get_commercialization(db: AsyncSession, years: list = None, limit: int = None, after_id: int = None,
+                          filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
         Retrieve commercialization data for the given years or all data if no years are specified.
 
-    get_processing(db: Session, years: list = None) -> list:
+    get_processing(db: AsyncSession, years: list = None, limit: int = None, after_id: int = None,
+                   filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
         Retrieve processing data for the given years or all data if no years are specified.
 
+    get_query_key(years: list = None, limit: int = None, after_id: int = None, filters: dict = None,
+                  year_range: tuple = None, fields: list = None) -> tuple:
+        Normalize the parameters of a retrieval query into a hashable key.
+
+    make_etag(model: Base, key: tuple, version: int, covered: int) -> str:
+        Build the ETag of a query result from the data version it was read at.
+
+    get_etag(db: AsyncSession, model: Base, key: tuple, years: list = None, year_range: tuple = None) -> str:
+        Compute the ETag of a query from the data versions of the years it covers.
+
+    etag_matches(if_none_match: str, etag: str) -> bool:
+        Check whether an If-None-Match header matches an ETag.
+
+    get_page(db: AsyncSession, model: Base, years: list = None, limit: int = None, after_id: int = None,
+             filters: dict = None, year_range: tuple = None, fields: list = None, etag: str = None) -> bytes:
+        Retrieve one page of a table as an encoded JSON body, served from the read cache when possible.
+
+    get_output_format(output_format: str = None, accept: str = None) -> str:
+        Resolve the response format from the `format` parameter or the Accept header.
+
+    get_content_encoding(accept_encoding: str = None) -> str:
+        Choose the snapshot content coding accepted by the client.
+
+    get_snapshot(model: Base, output_format: str, accept_encoding: str = None, years: list = None, limit: int = None,
+                 after_id: int = None, filters: dict = None, year_range: tuple = None,
+                 fields: list = None) -> tuple[bytes, str, str]:
+        Return the pre-compressed snapshot answering a request, if there is one.
+
+    build_snapshots(model: Base, years: list) -> int:
+        Rebuild the snapshots of the given years and the full table after an ingest.
+
+    get_columnar_page(db: AsyncSession, model: Base, output_format: str, years: list = None, limit: int = None,
+                      after_id: int = None, filters: dict = None, year_range: tuple = None,
+                      fields: list = None) -> tuple[bytes, str]:
+        Retrieve one page of a table encoded as Arrow IPC or Parquet.
+
+    get_aggregates(db: AsyncSession, model: Base, group_by: list = None, functions: list = None, measures: list = None,
+                   years: list = None, year_range: tuple = None) -> list[dict]:
+        Aggregate the measures of a table in the database, grouped by the given columns.
+
+    get_summary(db: AsyncSession, model: Base, years: list = None, year_range: tuple = None,
+                categories: list = None) -> list[dict]:
+        Retrieve the pre-aggregated yearly totals per category of a table.
+
     get_years_as_list(years: str) -> list[int]:
         Convert a comma-separated string of years into a list of integers.
+
+    get_filters(**values: str) -> dict:
+        Build a filter dictionary from comma-separated query parameter values.
+
+    get_fields_as_list(fields: str) -> list[str]:
+        Convert a comma-separated string of column names into a list.
+
+    format_rows(rows: list) -> list[dict]:
+        Convert ORM instances or projected rows into dictionaries.
+
+    decode_cursor(cursor: str) -> int:
+        Decode an opaque pagination cursor into the last returned id.
+
+    encode_cursor(last_id: int) -> str:
+        Encode the last returned id into an opaque pagination cursor.
+
+    paginate(rows: list, limit: int) -> tuple[list, str]:
+        Trim a page fetched with one extra row and compute its next cursor.
+
+    get_stream_format(stream: str, limit: int = None, cursor: str = None, output_format: str = None) -> str:
+        Validate the requested streaming format.
+
+    stream_ndjson(model: Base, years: list = None, batch_size: int = STREAM_BATCH_SIZE, filters: dict = None,
+                  year_range: tuple = None, fields: list = None) -> Iterator[bytes]:
+        Stream rows of a table as newline-delimited JSON, validating the query first.
+
+    generate_ndjson(model: Base, years: list, batch_size: int, filters: dict, year_range: tuple,
+                    fields: list) -> Iterator[bytes]:
+        Yield the NDJSON chunks of a table, reading through its own session.
+
+    get_table_response(db: AsyncSession, model: Base, years: str = None, limit: int = None, cursor: str = None,
+                       stream: str = None, filters: dict = None, year_from: int = None, year_to: int = None,
+                       fields: str = None, output_format: str = None, if_none_match: str = None, accept: str = None,
+                       accept_encoding: str = None) -> Response:
+        Answer a retrieval request on a table with a stream, a snapshot, a 304 or an encoded page.
 """
 
-from sqlalchemy.orm import Session
+import json
+import base64
+import orjson
+import hashlib
+import logging
+import binascii
+
+from sqlalchemy import Integer
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.storage import db_handler
+from config import STREAM_BATCH_SIZE
+
+from services.storage import db_handler, async_db_handler, read_cache, snapshot_store, DBHandler
+from services.storage.snapshot_store import ENCODINGS, FULL_TABLE
 from models import Import, Export, Production, Commercialization, Processing
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Media types of the supported response formats
+OUTPUT_FORMATS = {
+    "json": "application/json",
+    "arrow": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
 
-def get_imports(db: Session, years: list = None):
+
+async def get_imports(
+    db: AsyncSession,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
     """
     Retrieve import data for the given years or all data if no years are specified.
 
     Args:
-        db (Session): SQLAlchemy session instance.
+        db (AsyncSession): SQLAlchemy async session instance.
         years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows to return. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
 
     Returns:
         list: List of import data rows.
     """
 
-    return db_handler.retrieve(db, Import, years)
+    return await async_db_handler.retrieve(
+        db, Import, years, limit=limit, after_id=after_id, filters=filters, year_range=year_range, fields=fields
+    )
 
 
-def get_exports(db: Session, years: list = None):
+async def get_exports(
+    db: AsyncSession,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
     """
     Retrieve export data for the given years or all data if no years are specified.
 
     Args:
-        db (Session): SQLAlchemy session instance.
+        db (AsyncSession): SQLAlchemy async session instance.
         years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows to return. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
 
     Returns:
         list: List of export data rows.
     """
 
-    return db_handler.retrieve(db, Export, years)
+    return await async_db_handler.retrieve(
+        db, Export, years, limit=limit, after_id=after_id, filters=filters, year_range=year_range, fields=fields
+    )
 
 
-def get_production(db: Session, years: list = None):
+async def get_production(
+    db: AsyncSession,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
     """
     Retrieve production data for the given years or all data if no years are specified.
 
     Args:
-        db (Session): SQLAlchemy session instance.
+        db (AsyncSession): SQLAlchemy async session instance.
         years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows to return. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
 
     Returns:
         list: List of production data rows.
     """
 
-    return db_handler.retrieve(db, Production, years)
+    return await async_db_handler.retrieve(
+        db, Production, years, limit=limit, after_id=after_id, filters=filters, year_range=year_range, fields=fields
+    )
 
 
-def get_commercialization(db: Session, years: list = None):
+async def get_commercialization(
+    db: AsyncSession,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
     """
     Retrieve commercialization data for the given years or all data if no years are specified.
 
     Args:
-        db (Session): SQLAlchemy session instance.
+        db (AsyncSession): SQLAlchemy async session instance.
         years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows to return. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
 
     Returns:
         list: List of commercialization data rows.
     """
 
-    return db_handler.retrieve(db, Commercialization, years)
+    return await async_db_handler.retrieve(
+        db, Commercialization, years, limit=limit, after_id=after_id, filters=filters, year_range=year_range, fields=fields
+    )
 
 
-def get_processing(db: Session, years: list = None):
+async def get_processing(
+    db: AsyncSession,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
     """
     Retrieve processing data for the given years or all data if no years are specified.
 
     Args:
-        db (Session): SQLAlchemy session instance.
+        db (AsyncSession): SQLAlchemy async session instance.
         years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows to return. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
 
     Returns:
         list: List of processing data rows.
     """
 
-    return db_handler.retrieve(db, Processing, years)
+    return await async_db_handler.retrieve(
+        db, Processing, years, limit=limit, after_id=after_id, filters=filters, year_range=year_range, fields=fields
+    )
+
+
+def get_query_key(
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+) -> tuple:
+    """
+    Normalize the parameters of a retrieval query into a hashable key.
+
+    Years and filter values are sorted, so equivalent queries share the same key.
+
+    Args:
+        years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None.
+
+    Returns:
+        tuple: The normalized query key.
+    """
+
+    return (
+        tuple(sorted(set(years))) if years else None,
+        limit,
+        after_id,
+        tuple(sorted((name, tuple(sorted(values))) for name, values in (filters or {}).items())),
+        tuple(year_range) if year_range else None,
+        tuple(fields) if fields else None,
+    )
+
+
+def make_etag(model, key: tuple, version: int, covered: int) -> str:
+    """
+    Build the ETag of a query result from the data version it was read at.
+
+    Args:
+        model (Base): SQLAlchemy model class representing the target table.
+        key (tuple): The normalized query key (see `get_query_key`).
+        version (int): The sum of the data versions covered by the query.
+        covered (int): The number of versioned years covered by the query.
+
+    Returns:
+        str: A quoted strong entity tag.
+    """
+
+    digest = hashlib.sha1(repr((model.__tablename__, key, version, covered)).encode("utf-8")).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+async def get_etag(db: AsyncSession, model, key: tuple, years: list = None, year_range: tuple = None) -> str:
+    """
+    Compute the ETag of a query from the data versions of the years it covers.
+
+    Only the `data_version` table is read, so the ETag of an unchanged result can be
+    checked without reading or serializing any rows.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        key (tuple): The normalized query key (see `get_query_key`).
+        years (list, optional): List of years covered by the query. Defaults to None (all years).
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+    Returns:
+        str: A quoted strong entity tag.
+    """
+
+    version, covered = await async_db_handler.data_version(db, model, years, year_range)
+    return make_etag(model, key, version, covered)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+
+    Args:
+        if_none_match (str): The If-None-Match request header, or None.
+        etag (str): The current entity tag.
+
+    Returns:
+        bool: True if the client's cached representation is still current.
+    """
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+async def get_page(
+    db: AsyncSession,
+    model,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+    etag: str = None,
+):
+    """
+    Retrieve one page of a table as an encoded JSON body, served from the read cache when possible.
+
+    Rows are selected as plain column tuples with SQLAlchemy Core, skipping ORM identity-map
+    hydration, and encoded once with orjson. The body is cached per table and normalized
+    query, so repeated requests skip both the database and the JSON encoding. Entries are invalidated by the `DBHandler` write paths
+    when rows of a covered year are stored.
+
+    The in-process invalidation does not see writes made by other processes, so the ETag
+    derived from the data versions is part of the cache key: once another process bumps
+    a version, the page is read again instead of sending the old body with the new ETag.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
+        etag (str, optional): The ETag of the data versions covering the page (see `get_etag`). Defaults to None.
+
+    Returns:
+        bytes: The JSON body with the status, the rows and the cursor of the next page.
+    """
+
+    table_name = model.__tablename__
+    key = (etag,) + get_query_key(years, limit, after_id, filters, year_range, fields)
+
+    body = read_cache.get(table_name, key)
+    if body is not None:
+        return body
+
+    generation = read_cache.generation(table_name)
+
+    # Select plain column tuples rather than ORM entities, even without a projection
+    rows = await async_db_handler.retrieve(
+        db, model, years, limit=limit + 1 if limit else None, after_id=after_id,
+        filters=filters, year_range=year_range, fields=fields or model.__table__.columns.keys()
+    )
+    data, next_cursor = paginate(rows, limit)
+
+    body = orjson.dumps({"status": "success", "data": format_rows(data), "next_cursor": next_cursor})
+    read_cache.put(table_name, key, body, years=years, year_range=year_range, generation=generation)
+
+    return body
+
+
+def get_output_format(output_format: str = None, accept: str = None) -> str:
+    """
+    Resolve the response format from the `format` parameter or the Accept header.
+
+    An explicit `format` parameter wins. Otherwise the first media type of the Accept
+    header matching a supported format is used, and JSON is the default.
+
+    Args:
+        output_format (str, optional): The requested format ("json", "arrow" or "parquet"). Defaults to None.
+        accept (str, optional): The Accept request header. Defaults to None.
+
+    Returns:
+        str: The name of the format, a key of `OUTPUT_FORMATS`.
+
+    Raises:
+        ValueError: If the requested format is not supported.
+    """
+
+    if output_format:
+        if output_format.lower() not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid format: {output_format}. Must be one of {list(OUTPUT_FORMATS)}.")
+        return output_format.lower()
+
+    media_types = {media_type: name for name, media_type in OUTPUT_FORMATS.items()}
+    for media_type in (accept or "").split(","):
+        name = media_types.get(media_type.split(";")[0].strip())
+        if name:
+            return name
+
+    return "json"
+
+
+def get_content_encoding(accept_encoding: str = None) -> str:
+    """
+    Choose the snapshot content coding accepted by the client.
+
+    Brotli is preferred over gzip. Codings refused with `q=0` are skipped.
+
+    Args:
+        accept_encoding (str, optional): The Accept-Encoding request header. Defaults to None.
+
+    Returns:
+        str: "br" or "gzip", or None if the client accepts neither.
+    """
+
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, parameters = item.strip().lower().partition(";")
+        quality = parameters.strip().removeprefix("q=")
+        try:
+            if parameters and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip())
+
+    for encoding in ENCODINGS:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+
+    return None
+
+
+def get_snapshot(
+    model,
+    output_format: str,
+    accept_encoding: str = None,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+) -> tuple:
+    """
+    Return the pre-compressed snapshot answering a request, if there is one.
+
+    Only unpaginated, unfiltered JSON requests for a single year or for the whole table
+    are answered from snapshots, and only if the client accepts brotli or gzip. The body
+    is sent as stored, without reading the database or encoding any rows.
+
+    Args:
+        model (Base): SQLAlchemy model class representing the target table.
+        output_format (str): The resolved response format.
+        accept_encoding (str, optional): The Accept-Encoding request header. Defaults to None.
+        years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None.
+
+    Returns:
+        tuple[bytes, str, str]: The compressed body, its ETag and its content coding,
+                                or None if the request must be answered from the database.
+    """
+
+    if output_format != "json" or limit or after_id or filters or fields or any(year_range or ()):
+        return None
+    if years and len(set(years)) > 1:
+        return None
+
+    encoding = get_content_encoding(accept_encoding)
+    if encoding is None:
+        return None
+
+    snapshot = snapshot_store.get(model.__tablename__, str(years[0]) if years else FULL_TABLE, encoding)
+    if snapshot is None:
+        return None
+
+    # Each content coding is a distinct representation, so it gets its own strong ETag
+    body, etag = snapshot
+    return body, f'{etag[:-1]}-{encoding}"', encoding
+
+
+def build_snapshots(model, years: list) -> int:
+    """
+    Rebuild the snapshots of the given years and the full table after an ingest.
+
+    Each snapshot holds the same body and ETag as the unfiltered `GET` of its year (or
+    of the whole table). If the data version changes while a snapshot is built, the
+    snapshot is dropped again, so it can never outlive the rows it was read from.
+
+    Args:
+        model (Base): SQLAlchemy model class representing the written table.
+        years (list): The written years.
+
+    Returns:
+        int: The number of stored snapshots.
+
+    Logs:
+        - Info: The number of snapshots built and their total compressed size.
+    """
+
+    if not snapshot_store.enabled:
+        return 0
+
+    table_name = model.__tablename__
+    columns = model.__table__.columns.keys()
+    built, stored_bytes = 0, 0
+
+    db = db_handler.SessionLocal()
+    try:
+        for year in sorted(set(years)) + [None]:
+            selected = [year] if year is not None else None
+            name = str(year) if year is not None else FULL_TABLE
+
+            version = db_handler.data_version(db, model, selected)
+            rows = db_handler.retrieve(db, model, selected, fields=columns)
+            body = orjson.dumps({"status": "success", "data": format_rows(rows), "next_cursor": None})
+
+            key = get_query_key(selected, year_range=(None, None)) + ("json",)
+            sizes = snapshot_store.put(table_name, name, body, make_etag(model, key, *version))
+
+            # Rows committed by a concurrent write may be missing from the body
+            if db_handler.data_version(db, model, selected) != version:
+                snapshot_store.invalidate(table_name, selected or [])
+                continue
+
+            built += 1
+            stored_bytes += sizes["br"] + sizes["gzip"]
+    finally:
+        db.close()
+
+    logger.info(f"Built {built} snapshots of {table_name} ({stored_bytes} compressed bytes)")
+    return built
+
+
+async def get_columnar_page(
+    db: AsyncSession,
+    model,
+    output_format: str,
+    years: list = None,
+    limit: int = None,
+    after_id: int = None,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
+    """
+    Retrieve one page of a table encoded as Arrow IPC or Parquet.
+
+    The rows are selected as plain tuples and transposed into typed columns (int64 for
+    integer columns, string otherwise) without building intermediate dictionaries.
+    Arrow output uses the IPC file format, which clients can memory-map without copying
+    (e.g., `pyarrow.ipc.open_file(pyarrow.memory_map(path))` or `polars.read_ipc`).
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        output_format (str): Either "arrow" or "parquet".
+        years (list, optional): List of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        after_id (int, optional): Only return rows with a greater id. Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
+
+    Returns:
+        tuple[bytes, str]: The encoded table and the cursor of the next page, or None on the last page.
+    """
+
+    # Imported lazily, as only columnar responses need pyarrow
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = model.__table__
+    fields = fields or table.columns.keys()
+    names = ["id"] + [name for name in fields if name != "id"]
+
+    rows = await async_db_handler.retrieve(
+        db, model, years, limit=limit + 1 if limit else None, after_id=after_id,
+        filters=filters, year_range=year_range, fields=names
+    )
+    rows, next_cursor = paginate(rows, limit)
+
+    schema = pa.schema([
+        pa.field(
+            name,
+            pa.int64() if isinstance(table.c[name].type, Integer) else pa.string(),
+            nullable=table.c[name].nullable,
+        )
+        for name in names
+    ])
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    arrow_table = pa.Table.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+    )
+
+    sink = pa.BufferOutputStream()
+    if output_format == "parquet":
+        pq.write_table(arrow_table, sink)
+    else:
+        with pa.ipc.new_file(sink, schema) as writer:
+            writer.write_table(arrow_table)
+
+    return sink.getvalue().to_pybytes(), next_cursor
+
+
+async def get_aggregates(
+    db: AsyncSession,
+    model,
+    group_by: list = None,
+    functions: list = None,
+    measures: list = None,
+    years: list = None,
+    year_range: tuple = None,
+):
+    """
+    Aggregate the measures of a table in the database, grouped by the given columns.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        group_by (list, optional): Columns to group by. Defaults to None (a single total row).
+        functions (list, optional): Aggregate functions to apply. Defaults to None ("sum").
+        measures (list, optional): Numeric columns to aggregate. Defaults to None (all of them).
+        years (list, optional): List of years to filter by. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+    Returns:
+        list[dict]: One dictionary per group.
+    """
+
+    return await async_db_handler.aggregate(
+        db, model, group_by=group_by, functions=functions, measures=measures, years=years, year_range=year_range
+    )
+
+
+async def get_summary(
+    db: AsyncSession,
+    model,
+    years: list = None,
+    year_range: tuple = None,
+    categories: list = None,
+):
+    """
+    Retrieve the pre-aggregated yearly totals per category of a table.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        years (list, optional): List of years to filter by. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        categories (list, optional): Categories to filter by. Defaults to None.
+
+    Returns:
+        list[dict]: One dictionary per (year, category).
+    """
+
+    return await async_db_handler.summary(db, model, years=years, year_range=year_range, categories=categories)
+
 
 def get_years_as_list(years: str) -> list[int]:
     """
@@ -116,3 +749,323 @@ def get_years_as_list(years: str) -> list[int]:
         return [int(year) for year in years.split(",")] if years else None
     except ValueError:
         raise ValueError("Invalid format for years. Expected comma-separated integers.")
+
+
+def get_filters(**values: str) -> dict:
+    """
+    Build a filter dictionary from comma-separated query parameter values.
+
+    Args:
+        **values (str): Column names mapped to comma-separated accepted values, or None.
+
+    Returns:
+        dict: Column names mapped to lists of accepted values, omitting unset parameters.
+
+    Example:
+        get_filters(country="Argentina,Chile", classification=None)
+        # {"country": ["Argentina", "Chile"]}
+    """
+
+    return {
+        name: [item.strip() for item in value.split(",") if item.strip()]
+        for name, value in values.items() if value
+    }
+
+
+def get_fields_as_list(fields: str) -> list[str]:
+    """
+    Convert a comma-separated string of column names into a list.
+
+    Args:
+        fields (str): Comma-separated column names (e.g., "year,country,value").
+
+    Returns:
+        list[str]: List of column names, or None if no projection was requested.
+    """
+
+    return [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+
+
+def format_rows(rows: list) -> list[dict]:
+    """
+    Convert ORM instances or projected rows into dictionaries.
+
+    Args:
+        rows (list): ORM instances or SQLAlchemy rows returned by `DBHandler.retrieve`.
+
+    Returns:
+        list[dict]: One dictionary per row.
+    """
+
+    if rows and hasattr(rows[0], "_fields"):
+        # Plain rows share the same keys, so zip them instead of calling `_asdict` per row
+        keys = rows[0]._fields
+        return [dict(zip(keys, row)) for row in rows]
+
+    return [
+        {key: value for key, value in row.__dict__.items() if not key.startswith("_")}
+        for row in rows
+    ]
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode an opaque pagination cursor into the last returned id.
+
+    Args:
+        cursor (str): The cursor returned as `next_cursor` by a previous page, or None.
+
+    Returns:
+        int: The id of the last row of the previous page, or None for the first page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor. Use the next_cursor value returned by the previous page.")
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the last returned id into an opaque pagination cursor.
+
+    Args:
+        last_id (int): The id of the last row of the current page.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+
+def paginate(rows: list, limit: int):
+    """
+    Trim a page fetched with one extra row and compute its next cursor.
+
+    Pages are fetched with `limit + 1` rows; the extra row only signals that another page exists.
+
+    Args:
+        rows (list): The fetched rows, ordered by id.
+        limit (int): The requested page size, or None if pagination is disabled.
+
+    Returns:
+        tuple[list, str]: The rows of the page and the cursor of the next page (None on the last page).
+    """
+
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].id)
+
+
+def get_stream_format(stream: str, limit: int = None, cursor: str = None, output_format: str = None) -> str:
+    """
+    Validate the requested streaming format.
+
+    Streams always return every matching row as NDJSON, so they cannot be paginated or
+    combined with an output format.
+
+    Args:
+        stream (str): The value of the `stream` query parameter, or None.
+        limit (int, optional): The requested page size. Defaults to None.
+        cursor (str, optional): The requested page cursor. Defaults to None.
+        output_format (str, optional): The requested `format` parameter. Defaults to None.
+
+    Returns:
+        str: The normalized streaming format, or None if streaming was not requested.
+
+    Raises:
+        ValueError: If the format is not supported, or if `stream` is combined with `limit`, `cursor`
+                    or `output_format`.
+    """
+
+    if not stream:
+        return None
+    if stream.lower() != "ndjson":
+        raise ValueError(f"Invalid stream format: {stream}. Supported formats: ['ndjson'].")
+
+    conflicting = [name for name, value in (("limit", limit), ("cursor", cursor), ("format", output_format)) if value]
+    if conflicting:
+        raise ValueError(f"stream=ndjson cannot be combined with {conflicting}.")
+    return "ndjson"
+
+
+def stream_ndjson(
+    model,
+    years: list = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    filters: dict = None,
+    year_range: tuple = None,
+    fields: list = None,
+):
+    """
+    Stream rows of a table as newline-delimited JSON.
+
+    Rows are encoded as they arrive from the server-side cursor and sent in chunks of
+    `batch_size` lines, which keeps memory constant without paying a per-row send overhead.
+    The filters and fields are validated before the generator is returned, so invalid
+    requests are rejected before the response starts. The generator opens its own session,
+    because it is consumed by the response after the request-scoped session has been
+    released, and closes it once the last row is sent.
+
+    Args:
+        model (Base): SQLAlchemy model class representing the target table.
+        years (list, optional): List of years to filter by. Defaults to None.
+        batch_size (int, optional): Rows per chunk. Defaults to `STREAM_BATCH_SIZE`.
+        filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+        fields (list, optional): Columns to select. Defaults to None (all columns).
+
+    Returns:
+        Iterator[bytes]: Chunks of JSON-encoded rows, one per line.
+
+    Raises:
+        ValueError: If a filter or field does not exist in the table.
+    """
+
+    DBHandler._build_conditions(model, years, filters, year_range)
+    DBHandler._build_columns(model, fields)
+
+    return generate_ndjson(model, years, batch_size, filters, year_range, fields)
+
+
+def generate_ndjson(model, years: list, batch_size: int, filters: dict, year_range: tuple, fields: list):
+    """
+    Yield the NDJSON chunks of a table, reading through its own session.
+
+    Args:
+        model (Base): SQLAlchemy model class representing the target table.
+        years (list): List of years to filter by.
+        batch_size (int): Rows per chunk.
+        filters (dict): Column names mapped to accepted values.
+        year_range (tuple): Inclusive (year_from, year_to) bounds.
+        fields (list): Columns to select.
+
+    Yields:
+        bytes: A chunk of JSON-encoded rows, one per line.
+    """
+
+    db = db_handler.SessionLocal()
+    try:
+        lines = []
+        rows = db_handler.stream(
+            db, model, years, batch_size=batch_size, filters=filters, year_range=year_range, fields=fields
+        )
+        for row in rows:
+            lines.append(orjson.dumps(row))
+            if len(lines) >= batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+    finally:
+        db.close()
+
+
+async def get_table_response(
+    db: AsyncSession,
+    model,
+    years: str = None,
+    limit: int = None,
+    cursor: str = None,
+    stream: str = None,
+    filters: dict = None,
+    year_from: int = None,
+    year_to: int = None,
+    fields: str = None,
+    output_format: str = None,
+    if_none_match: str = None,
+    accept: str = None,
+    accept_encoding: str = None,
+):
+    """
+    Answer a retrieval request on a table with a stream, a snapshot, a 304 or an encoded page.
+
+    The request is answered by the first applicable path: a newline-delimited JSON stream
+    (`stream=ndjson`), a pre-compressed snapshot for unfiltered single-year and full-table
+    requests, `304 Not Modified` when `if_none_match` matches the ETag derived from the data
+    versions, an Arrow or Parquet page, or a JSON page served from the read cache.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async session instance.
+        model (Base): SQLAlchemy model class representing the target table.
+        years (str, optional): Comma-separated list of years to filter by. Defaults to None.
+        limit (int, optional): Maximum number of rows per page. Defaults to None.
+        cursor (str, optional): Cursor of the page to fetch. Defaults to None.
+        stream (str, optional): Streaming format ("ndjson"). Defaults to None.
+        filters (dict, optional): Column names mapped to accepted values (see `get_filters`). Defaults to None.
+        year_from (int, optional): First year of the range (inclusive). Defaults to None.
+        year_to (int, optional): Last year of the range (inclusive). Defaults to None.
+        fields (str, optional): Comma-separated list of columns to return. Defaults to None.
+        output_format (str, optional): Response format ("json", "arrow" or "parquet"). Defaults to None.
+        if_none_match (str, optional): ETag of a previously received response. Defaults to None.
+        accept (str, optional): Accept header, used when `output_format` is not provided. Defaults to None.
+        accept_encoding (str, optional): Accept-Encoding header, used to serve snapshots. Defaults to None.
+
+    Returns:
+        Response: The encoded page or snapshot with an `ETag` header, or 304 Not Modified without a body.
+        StreamingResponse: Newline-delimited JSON rows, if `stream=ndjson`.
+
+    Raises:
+        ValueError: If the years, cursor, stream format, fields or output format are invalid,
+                    or if `stream` is combined with `limit`, `cursor` or `output_format`.
+    """
+
+    years_list = get_years_as_list(years)
+    year_range = (year_from, year_to)
+    fields_list = get_fields_as_list(fields)
+
+    if get_stream_format(stream, limit=limit, cursor=cursor, output_format=output_format):
+        return StreamingResponse(
+            stream_ndjson(model, years_list, filters=filters, year_range=year_range, fields=fields_list),
+            media_type="application/x-ndjson"
+        )
+
+    after_id = decode_cursor(cursor)
+
+    output_format = get_output_format(output_format, accept)
+
+    # Serve unfiltered single-year and full-table requests from the pre-compressed snapshots
+    snapshot = get_snapshot(
+        model, output_format, accept_encoding, years_list, limit=limit, after_id=after_id,
+        filters=filters, year_range=year_range, fields=fields_list
+    )
+    if snapshot is not None:
+        body, etag, encoding = snapshot
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept, Accept-Encoding"}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=body, media_type="application/json", headers={**headers, "Content-Encoding": encoding}
+        )
+
+    # Answer unchanged polls from the data versions alone
+    key = get_query_key(years_list, limit, after_id, filters, year_range, fields_list) + (output_format,)
+    etag = await get_etag(db, model, key, years_list, year_range)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept, Accept-Encoding"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if output_format != "json":
+        body, next_cursor = await get_columnar_page(
+            db, model, output_format, years_list, limit=limit, after_id=after_id,
+            filters=filters, year_range=year_range, fields=fields_list
+        )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return Response(content=body, media_type=OUTPUT_FORMATS[output_format], headers=headers)
+
+    # Serve the encoded page from the read cache, querying the database on a miss
+    body = await get_page(
+        db, model, years_list, limit=limit, after_id=after_id,
+        filters=filters, year_range=year_range, fields=fields_list, etag=etag
+    )
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -2,38 +2,106 @@
 This module handles scraping data from external sources and preparing it for storage or processing.
 
 Functions:
-    perform_scrape(year: int, page: str) -> dict:
+    perform_scrape(year: int, page: str, force: bool = False, db: Session = None) -> dict:
         Perform a scrape for a specific year and page, translating column names and organizing data by suboptions.
 
-    scrape_data(year: int, page: ScraperPages) -> dict:
-        Perform the actual scraping for a given year and page, including handling suboptions if applicable.
+    scrape_data(year: int, page: ScraperPages, max_workers: int = SCRAPER_MAX_WORKERS, force: bool = False,
+                db: Session = None) -> dict:
+        Perform the actual scraping for a given year and page, fetching suboptions concurrently if applicable.
+
+    scrape_item(year: int, page: ScraperPages, suboption: str = None, state: dict = None, force: bool = False) -> tuple:
+        Fetch and parse one (page, year, suboption), returning its scrape state ledger entry and data.
 
     translate_columns(df: pd.DataFrame, mapping: dict) -> pd.DataFrame:
         Translate column names in a DataFrame based on a dictionary mapping.
 
     process_and_store_data(scraped_data: pd.DataFrame, db: Session, model: Base, year: int, suboption: str = None) -> str:
         Process and store the scraped data into the database, optionally handling suboptions.
+
+    plan_batch(years: list, pages: list) -> list:
+        Build the full (page, year, suboption) work list for a batch scrape.
+
+    scrape_batch(years: list, pages: list, db: Session, max_workers: int = SCRAPER_BATCH_MAX_WORKERS, force: bool = False) -> list:
+        Scrape and store every planned item with a global concurrency cap, returning a per-item summary.
+
+    scrape_and_store(year: int, page: ScraperPages, db: Session, force: bool = False) -> dict:
+        Scrape a page for a year and store every suboption, returning row counts.
+
+    refresh_snapshots(model: Base, years: list) -> int:
+        Rebuild the retrieval snapshots of the written years without failing the ingest.
+
+    discard_cached_html(page: ScraperPages, year: int, suboption: str = None) -> bool:
+        Remove the raw HTML cache entry of an item whose content could not be stored.
+
+    load_states(db: Session, pages: list, years: list = None, year_range: tuple = None) -> dict:
+        Load the scrape state ledger entries of some pages, keyed by (page, year, suboption).
+
+    record_states(db: Session, states: list) -> int:
+        Record scrape state ledger entries without failing the scrape.
+
+    update_state(db: Session, page_name: str, year: int, suboption: str, **values):
+        Update a scrape state ledger entry without failing the scrape.
+
+    is_fresh(state: dict, now: datetime = None) -> bool:
+        Check whether a ledger entry is recent enough for its item to be skipped.
+
+    get_coverage_state(state: dict, now: datetime = None) -> str:
+        Classify a ledger entry as "fresh", "stale", "pending", "failed" or "missing".
+
+    get_fetched_at(state: dict) -> datetime:
+        Return when a ledger entry was fetched, as a timezone-aware UTC datetime.
+
+    get_coverage(db: Session, pages: list, year_range: tuple = None) -> dict:
+        Report the ledger state of every (page, year, suboption) in a year range.
+
+    run_scrape_job(year: int, page: ScraperPages, force: bool = False) -> dict:
+        Job entry point for a single scrape, using its own database session.
+
+    run_batch_job(years: list, pages: list, force: bool = False) -> dict:
+        Job entry point for a batch scrape, using its own database session.
+
+    get_pages_as_list(pages: str) -> list[ScraperPages]:
+        Convert a comma-separated string of page names into a list of ScraperPages.
 """
 
+import time
 import logging
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from enum import Enum
 
-from services.scraper import Scraper, ScraperPages, ScraperParsers
-from services.storage import db_handler, ColumnKeyMapping, SuboptionKeyMapping
+from config import SCRAPER_MAX_WORKERS, SCRAPER_BATCH_MAX_WORKERS, SCRAPE_STATE_TTL
+
+from services.scraper import Scraper, ScraperPages, ScraperParsers, ScrapeStatus, html_cache
+from services.storage import db_handler, ColumnKeyMapping, SuboptionKeyMapping, PageModelMapping, ModelKeyMapping
+from .retrieve import build_snapshots
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Ledger statuses of items whose last scrape succeeded, so their content hash describes the stored data
+SETTLED_STATUSES = (ScrapeStatus.STORED.value, ScrapeStatus.UNCHANGED.value, ScrapeStatus.EMPTY.value)
+
+# Ledger key of pages without suboptions
+DEFAULT_SUBOPTION = "default"
 
-def perform_scrape(year, page):
+
+def perform_scrape(year, page, force=False, db=None):
     """
     Perform a scrape for a specific year and page, translating column names.
 
+    Suboptions whose raw HTML is unchanged since the last scrape are skipped entirely,
+    so they are neither parsed nor stored again unless `force` is set. When a database
+    session is given, suboptions scraped recently according to the scrape state ledger
+    are not fetched at all (see `scrape_data`).
+
     Args:
         year (int): The year for which data should be scraped.
         page (str): The page to scrape, corresponding to one of the ScraperPages.
+        force (bool, optional): Parse and return unchanged pages too. Defaults to False.
+        db (Session, optional): Database session used to consult and update the ledger. Defaults to None.
 
     Returns:
         dict: A dictionary where keys are suboptions (or "default") and values are translated DataFrames.
@@ -43,7 +111,7 @@ def perform_scrape(year, page):
     """
 
     try:
-        scraped_data = scrape_data(year, page)
+        scraped_data = scrape_data(year, page, force=force, db=db)
 
         translated_data = {
             suboption: translate_columns(data, ColumnKeyMapping)
@@ -55,43 +123,145 @@ def perform_scrape(year, page):
     except KeyError:
         raise ValueError(f"Invalid page: {page}. Must be one of {list(ScraperPages)}.")
 
-def scrape_data(year, page):
+def scrape_data(year, page, max_workers=SCRAPER_MAX_WORKERS, force=False, db=None):
     """
     Perform the actual scraping for a given year and page.
 
     This function handles suboptions when available and organizes the scraped data
     into a dictionary, with suboptions as keys and the respective DataFrames as values.
+    Suboptions are fetched concurrently using a bounded thread pool, so the total time
+    is close to the slowest single fetch instead of the sum of all fetches.
+
+    When a database session is given, the scrape state ledger is consulted first:
+    suboptions whose last scrape succeeded less than `SCRAPE_STATE_TTL` seconds ago are
+    not fetched, the others are compared with the hash of their last stored content, and
+    the outcome of every fetched suboption is recorded. Parsed suboptions are recorded as
+    "pending" until the caller marks them as stored.
 
     Args:
         year (int): The year for which data should be scraped.
         page (ScraperPages): The page to scrape, represented as a ScraperPages enum value.
+        max_workers (int, optional): Maximum number of concurrent fetches.
+                                     Defaults to `SCRAPER_MAX_WORKERS`.
+        force (bool, optional): Fetch and parse suboptions even if they are fresh or unchanged. Defaults to False.
+        db (Session, optional): Database session used to consult and update the ledger. Defaults to None.
 
     Returns:
         dict: A dictionary with suboptions as keys and DataFrames as values. If no suboptions exist,
-        the key "default" will hold the DataFrame.
+        the key "default" will hold the DataFrame. Suboptions that fail, are fresh or are unchanged are left out.
 
     Logs:
-        - An error message if scraping fails.
+        - An error message for each suboption whose scraping fails.
+        - Info: The number of suboptions skipped as fresh.
     """
 
     results = {}
-    suboptions = page.value["suboptions"]
+    states = load_states(db, [page], years=[year]) if db is not None else {}
+
+    suboptions = [
+        suboption for suboption in page.value["suboptions"] or [None]
+        if force or not is_fresh(states.get((page.name, year, suboption or DEFAULT_SUBOPTION)))
+    ]
+    skipped = len(page.value["suboptions"] or [None]) - len(suboptions)
+    if skipped:
+        logger.info(f"Skipped {skipped} fresh suboptions of {page.name}/{year}")
+    if not suboptions:
+        return results
+
+    records = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(suboptions)))) as executor:
+        futures = {
+            executor.submit(
+                scrape_item, year, page, suboption, states.get((page.name, year, suboption or DEFAULT_SUBOPTION)), force
+            ): suboption
+            for suboption in suboptions
+        }
 
-    try:
-        if suboptions:
-            for suboption in suboptions:
-                scraper = Scraper(year, page, suboption=suboption)
-                data = scraper.scrape()
-                results[suboption] = data
-        else:
-            scraper = Scraper(year, page)
-            results["default"] = scraper.scrape()
+        for future in as_completed(futures):
+            suboption = futures[future]
+            record, data = future.result()
+            records.append(record)
 
-    except Exception as e:
-        logger.error(f"Error scraping data for {page}: {e}")
+            if record["status"] == ScrapeStatus.FAILED.value:
+                logger.error(f"Error scraping data for {page}/{suboption or 'default'}: {record['error']}")
+            elif data is not None:
+                results[suboption or "default"] = data
+
+    if db is not None:
+        record_states(db, records)
 
     return results
 
+def scrape_item(year, page, suboption=None, state=None, force=False):
+    """
+    Fetch and parse one (page, year, suboption), returning its scrape state ledger entry.
+
+    If the item's last scrape succeeded, its content is compared with the hash recorded
+    in the ledger, so content that is identical to the stored data is not parsed again.
+    Items missing from the ledger, or whose last scrape failed or was never stored, are
+    always parsed, even if the raw HTML cache already holds their content.
+
+    Args:
+        year (int): The year to scrape.
+        page (ScraperPages): The page to scrape.
+        suboption (str, optional): The suboption to scrape. Defaults to None.
+        state (dict, optional): The current ledger entry of the item. Defaults to None.
+        force (bool, optional): Parse the content even if it is unchanged. Defaults to False.
+
+    Returns:
+        tuple[dict, pd.DataFrame]: The new ledger entry, with the status "pending", "unchanged",
+        "empty" or "failed", and the parsed data (None unless rows were parsed).
+    """
+
+    settled = state is not None and state["status"] in SETTLED_STATUSES
+    scraper = Scraper(
+        year,
+        page,
+        suboption=suboption,
+        force=force or not settled,
+        known_hash=state["content_hash"] if settled else None,
+    )
+
+    record = {
+        "page": page.name,
+        "year": year,
+        "suboption": suboption or DEFAULT_SUBOPTION,
+        "content_hash": None,
+        "row_count": state["row_count"] if state else 0,
+        "fetched_at": datetime.now(timezone.utc),
+        "duration": None,
+        "status": None,
+        "error": None,
+    }
+
+    start = time.monotonic()
+    data = None
+    try:
+        data = scraper.scrape()
+        if data is None and (scraper.changed or scraper.force):
+            raise ValueError(f"No data parsed from {scraper.url}")
+    except Exception as e:
+        record["status"] = ScrapeStatus.FAILED.value
+        record["error"] = str(e)
+        data = None
+        if scraper.content_hash is not None:
+            scraper.discard_cache()
+
+    record["duration"] = time.monotonic() - start
+    record["content_hash"] = scraper.content_hash
+
+    if record["status"] is None:
+        if data is None:
+            record["status"] = ScrapeStatus.UNCHANGED.value
+        elif data.empty:
+            record["status"] = ScrapeStatus.EMPTY.value
+            record["row_count"] = 0
+        else:
+            record["status"] = ScrapeStatus.PENDING.value
+            record["row_count"] = len(data)
+
+    return record, data
+
 def translate_columns(df: pd.DataFrame, mapping: dict) -> pd.DataFrame:
     """
     Translate column names of a DataFrame using a dictionary mapping.
@@ -138,9 +308,9 @@ def process_and_store_data(scraped_data, db, model, year, suboption=None):
     """
     Process and store data from the scraped DataFrame into the database.
 
-    This function iterates through the rows of the scraped DataFrame, processes each row,
-    and stores it in the database. If a suboption is provided, the classification field is
-    added to the row data using SuboptionKeyMapping.
+    The year and, if a suboption is provided, the classification (from SuboptionKeyMapping)
+    are added as columns, and the whole page is written in a single set-based operation
+    by `DBHandler.ingest`, keyed on the model's natural key from ModelKeyMapping.
 
     Args:
         scraped_data (pd.DataFrame): The DataFrame containing scraped data.
@@ -152,29 +322,464 @@ def process_and_store_data(scraped_data, db, model, year, suboption=None):
     Returns:
         str: Status message indicating success or no data found.
 
+    Raises:
+        Exception: If the data cannot be stored.
+
     Example:
-        For a given suboption, the function adds a "classification" field to each row based
-        on SuboptionKeyMapping and then stores the row in the database.
+        For a given suboption, the function adds a "classification" column based
+        on SuboptionKeyMapping and then upserts all rows in one transaction.
     """
 
     if scraped_data.empty:
         return "No data found."
 
     try:
-        for _, row in scraped_data.iterrows():
-            row_data = {
-                **row.to_dict(),
-                "year": year,
-            }
-            if suboption:
-                classification = SuboptionKeyMapping.get(model.__name__, {}).get(suboption, "")
-                row_data["classification"] = classification
-            db_handler.store(
-                db=db,
-                model=model,
-                **row_data
-            )
+        data = scraped_data.assign(year=year)
+        if suboption:
+            classification = SuboptionKeyMapping.get(model.__name__, {}).get(suboption, "")
+            data = data.assign(classification=classification)
+
+        db_handler.ingest(
+            db=db,
+            model=model,
+            dataframe=data,
+            key_columns=ModelKeyMapping[model.__name__],
+        )
     except Exception as e:
         logger.error(f"Error storing data: {e}")
+        raise e
 
     return "Data stored successfully."
+
+def plan_batch(years, pages):
+    """
+    Build the full work list for a batch scrape.
+
+    Args:
+        years (list): Years to scrape.
+        pages (list): ScraperPages to scrape.
+
+    Returns:
+        list: A list of (page, year, suboption) tuples, with suboption None for pages without suboptions.
+    """
+
+    return [
+        (page, year, suboption)
+        for page in pages
+        for year in years
+        for suboption in (page.value["suboptions"] or [None])
+    ]
+
+def scrape_batch(years, pages, db, max_workers=SCRAPER_BATCH_MAX_WORKERS, force=False):
+    """
+    Scrape and store every (page, year, suboption) combination as a single job.
+
+    All items are fetched through one bounded thread pool, so the number of in-flight
+    requests never exceeds `max_workers`, and the shared HTTP client additionally enforces
+    its per-host rate limit. Each item is stored as soon as its fetch completes; a failing
+    item is recorded in the summary without interrupting the others. Once every item is
+    done, the snapshots of the written years are rebuilt once per page.
+
+    The scrape state ledger is consulted before planning the fetches: items whose last
+    scrape succeeded less than `SCRAPE_STATE_TTL` seconds ago are skipped without any
+    request, so a scheduled refresh of the whole history only fetches missing, stale and
+    failed items. The outcome of every fetched item is recorded in the ledger.
+
+    Args:
+        years (list): Years to scrape.
+        pages (list): ScraperPages to scrape.
+        db (Session): Database session.
+        max_workers (int, optional): Global concurrency cap. Defaults to `SCRAPER_BATCH_MAX_WORKERS`.
+        force (bool, optional): Fetch, parse and store fresh and unchanged pages too. Defaults to False.
+
+    Returns:
+        list: One summary dictionary per item with the keys "page", "year", "suboption",
+        "status" ("stored", "unchanged", "empty", "skipped" or "failed"), "rows" and "error".
+
+    Example:
+        summary = scrape_batch([2021, 2022], [ScraperPages.PRODUCTION], db)
+        # [{"page": "PRODUCTION", "year": 2021, "suboption": None, "status": "stored", "rows": 67, "error": None}, ...]
+    """
+
+    states = load_states(db, pages, years=years)
+    summary = []
+    records = []
+    stored = {}
+
+    items = []
+    for page, year, suboption in plan_batch(years, pages):
+        state = states.get((page.name, year, suboption or DEFAULT_SUBOPTION))
+        if not force and is_fresh(state):
+            summary.append({
+                "page": page.name, "year": year, "suboption": suboption,
+                "status": ScrapeStatus.SKIPPED.value, "rows": 0, "error": None,
+            })
+        else:
+            items.append((page, year, suboption, state))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(scrape_item, year, page, suboption, state, force): (page, year, suboption)
+            for page, year, suboption, state in items
+        }
+
+        for future in as_completed(futures):
+            page, year, suboption = futures[future]
+            record, data = future.result()
+            result = {
+                "page": page.name, "year": year, "suboption": suboption,
+                "status": record["status"], "rows": 0, "error": record["error"],
+            }
+
+            try:
+                if record["status"] == ScrapeStatus.FAILED.value:
+                    raise Exception(record["error"])
+
+                if record["status"] == ScrapeStatus.PENDING.value:
+                    process_and_store_data(
+                        scraped_data=translate_columns(data, ColumnKeyMapping),
+                        db=db,
+                        model=PageModelMapping[page.name].value,
+                        year=year,
+                        suboption=suboption,
+                    )
+                    record["status"] = result["status"] = ScrapeStatus.STORED.value
+                    result["rows"] = len(data)
+                    stored.setdefault(page.name, set()).add(year)
+
+            except Exception as e:
+                logger.error(f"Error in batch scrape for {page.name}/{year}/{suboption or 'default'}: {e}")
+                record["status"] = result["status"] = ScrapeStatus.FAILED.value
+                record["error"] = result["error"] = str(e)
+                discard_cached_html(page, year, suboption)
+
+            records.append(record)
+            summary.append(result)
+
+    record_states(db, records)
+
+    for page_name, stored_years in stored.items():
+        refresh_snapshots(PageModelMapping[page_name].value, stored_years)
+
+    return summary
+
+def scrape_and_store(year, page, db, force=False):
+    """
+    Scrape a page for a year and store every returned suboption.
+
+    Suboptions that are fresh or unchanged according to the scrape state ledger are
+    skipped, and each stored suboption is marked as stored in the ledger.
+
+    Args:
+        year (int): The year to scrape.
+        page (ScraperPages): The page to scrape.
+        db (Session): Database session.
+        force (bool, optional): Fetch, parse and store fresh and unchanged pages too. Defaults to False.
+
+    Returns:
+        dict: A dictionary with the stored row count per suboption under "suboptions"
+        and the total row count under "rows". Empty if nothing new was scraped.
+
+    Raises:
+        Exception: If a suboption cannot be stored; it is marked as failed in the ledger, and the
+                   cached HTML of the suboptions left unstored is discarded.
+    """
+
+    model = PageModelMapping[page.name].value
+    scraped_data = perform_scrape(year=year, page=page, force=force, db=db)
+
+    suboptions = {}
+    try:
+        for suboption, data in scraped_data.items():
+            try:
+                process_and_store_data(
+                    scraped_data=data,
+                    db=db,
+                    model=model,
+                    year=year,
+                    suboption=suboption if suboption != "default" else None
+                )
+            except Exception as e:
+                update_state(db, page.name, year, suboption, status=ScrapeStatus.FAILED.value, error=str(e))
+                raise e
+
+            update_state(db, page.name, year, suboption, status=ScrapeStatus.STORED.value)
+            suboptions[suboption] = len(data)
+    finally:
+        # Content that was fetched but not stored must be fetched again by the next scrape
+        for suboption in scraped_data.keys() - suboptions.keys():
+            discard_cached_html(page, year, suboption if suboption != "default" else None)
+        if suboptions:
+            refresh_snapshots(model, [year])
+
+    return {"suboptions": suboptions, "rows": sum(suboptions.values())}
+
+def refresh_snapshots(model, years):
+    """
+    Rebuild the retrieval snapshots of the written years and of the full table.
+
+    Snapshots are an optimization: a failure is logged and the affected requests are
+    answered from the database, so it never fails the ingest that triggered it.
+
+    Args:
+        model (Base): SQLAlchemy model class of the written table.
+        years (list): The written years.
+
+    Returns:
+        int: The number of rebuilt snapshots.
+
+    Logs:
+        - An error message if the snapshots cannot be built.
+    """
+
+    try:
+        return build_snapshots(model, list(years))
+    except Exception as e:
+        logger.error(f"Error building snapshots for {model.__tablename__}: {e}")
+        return 0
+
+def discard_cached_html(page, year, suboption=None):
+    """
+    Remove the raw HTML cache entry of an item whose content could not be stored.
+
+    Args:
+        page (ScraperPages): The scraped page.
+        year (int): The scraped year.
+        suboption (str, optional): The scraped suboption. Defaults to None.
+
+    Returns:
+        bool: True if an entry was removed.
+    """
+
+    return html_cache.remove(year, page.value["option"], suboption)
+
+def load_states(db, pages, years=None, year_range=None):
+    """
+    Load the scrape state ledger entries of some pages.
+
+    Args:
+        db (Session): Database session.
+        pages (list): ScraperPages whose entries are loaded.
+        years (list, optional): Years to load. Defaults to None (all years).
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+    Returns:
+        dict: Ledger entries keyed by (page name, year, suboption), with "default" as the
+        suboption of pages without suboptions.
+    """
+
+    return {
+        (state["page"], state["year"], state["suboption"]): state
+        for state in db_handler.scrape_states(db, pages=[page.name for page in pages], years=years, year_range=year_range)
+    }
+
+def record_states(db, states):
+    """
+    Record scrape state ledger entries.
+
+    The ledger only decides what to fetch next, so a failure is logged and the affected
+    items are fetched again by the next scrape, without failing the current one.
+
+    Args:
+        db (Session): Database session.
+        states (list): The ledger entries to record.
+
+    Returns:
+        int: The number of recorded entries.
+
+    Logs:
+        - An error message if the entries cannot be recorded.
+    """
+
+    try:
+        return db_handler.record_scrape_states(db, states)
+    except Exception as e:
+        logger.error(f"Error recording {len(states)} scrape states: {e}")
+        return 0
+
+def update_state(db, page_name, year, suboption, **values):
+    """
+    Update a scrape state ledger entry, logging instead of raising on failure.
+
+    Args:
+        db (Session): Database session.
+        page_name (str): The name of the scraped page.
+        year (int): The scraped year.
+        suboption (str): The scraped suboption, or "default".
+        values: Column-value mappings to update (e.g., status="stored").
+
+    Logs:
+        - An error message if the entry cannot be updated.
+    """
+
+    try:
+        db_handler.update_scrape_state(db, page_name, year, suboption, **values)
+    except Exception as e:
+        logger.error(f"Error updating the scrape state of {page_name}/{year}/{suboption}: {e}")
+
+def is_fresh(state, now=None):
+    """
+    Check whether a ledger entry is recent enough for its item to be skipped.
+
+    Args:
+        state (dict): The ledger entry of the item, or None if it was never scraped.
+        now (datetime, optional): The reference time. Defaults to the current time.
+
+    Returns:
+        bool: True if the last scrape succeeded less than `SCRAPE_STATE_TTL` seconds ago.
+    """
+
+    return get_coverage_state(state, now) == "fresh"
+
+def get_coverage_state(state, now=None):
+    """
+    Classify a ledger entry.
+
+    Args:
+        state (dict): The ledger entry of the item, or None if it was never scraped.
+        now (datetime, optional): The reference time. Defaults to the current time.
+
+    Returns:
+        str: "missing" if the item was never scraped, "failed" or "pending" if its last scrape
+        did not finish storing it, and otherwise "fresh" or "stale" depending on its age.
+    """
+
+    if state is None:
+        return "missing"
+    if state["status"] not in SETTLED_STATUSES:
+        return state["status"]
+
+    age = ((now or datetime.now(timezone.utc)) - get_fetched_at(state)).total_seconds()
+    return "fresh" if age < SCRAPE_STATE_TTL else "stale"
+
+def get_fetched_at(state):
+    """
+    Return when a ledger entry was fetched.
+
+    Args:
+        state (dict): The ledger entry.
+
+    Returns:
+        datetime: The fetch time as a timezone-aware UTC datetime.
+    """
+
+    fetched_at = state["fetched_at"]
+    # SQLite returns naive timestamps; they are stored in UTC
+    return fetched_at.replace(tzinfo=timezone.utc) if fetched_at.tzinfo is None else fetched_at
+
+def get_coverage(db, pages, year_range=None):
+    """
+    Report the ledger state of every (page, year, suboption) in a year range.
+
+    Args:
+        db (Session): Database session.
+        pages (list): ScraperPages to report.
+        year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Either bound defaults
+                                      to the first or last year recorded in the ledger for the pages.
+
+    Returns:
+        dict: The TTL, the number of items per coverage state under "counts" and one dictionary
+        per item under "items", in page, year and suboption order.
+
+    Example:
+        get_coverage(db, [ScraperPages.PRODUCTION], (2020, 2021))["counts"]
+        # {"fresh": 1, "stale": 0, "pending": 0, "failed": 0, "missing": 1}
+    """
+
+    year_from, year_to = year_range or (None, None)
+    states = load_states(db, pages, year_range=year_range)
+
+    if states and (year_from is None or year_to is None):
+        recorded = [year for _, year, _ in states]
+        year_from = min(recorded) if year_from is None else year_from
+        year_to = max(recorded) if year_to is None else year_to
+
+    years = list(range(year_from, year_to + 1)) if year_from is not None and year_to is not None else []
+    now = datetime.now(timezone.utc)
+    counts = {"fresh": 0, "stale": 0, "pending": 0, "failed": 0, "missing": 0}
+    items = []
+
+    for page, year, suboption in plan_batch(years, pages):
+        state = states.get((page.name, year, suboption or DEFAULT_SUBOPTION))
+        coverage = get_coverage_state(state, now)
+        fetched_at = get_fetched_at(state) if state else None
+        counts[coverage] += 1
+        items.append({
+            "page": page.name,
+            "year": year,
+            "suboption": suboption,
+            "state": coverage,
+            "status": state["status"] if state else None,
+            "rows": state["row_count"] if state else None,
+            "content_hash": state["content_hash"] if state else None,
+            "fetched_at": fetched_at.isoformat() if fetched_at else None,
+            "age": round((now - fetched_at).total_seconds(), 3) if fetched_at else None,
+            "duration": state["duration"] if state else None,
+            "error": state["error"] if state else None,
+        })
+
+    return {"ttl": SCRAPE_STATE_TTL, "counts": counts, "items": items}
+
+def run_scrape_job(year, page, force=False):
+    """
+    Job entry point for a single scrape.
+
+    Background jobs outlive the request that submitted them, so a dedicated
+    database session is opened and closed here.
+
+    Args:
+        year (int): The year to scrape.
+        page (ScraperPages): The page to scrape.
+        force (bool, optional): Parse and store unchanged pages too. Defaults to False.
+
+    Returns:
+        dict: The result of `scrape_and_store`.
+    """
+
+    db = db_handler.SessionLocal()
+    try:
+        return scrape_and_store(year, page, db, force=force)
+    finally:
+        db.close()
+
+def run_batch_job(years, pages, force=False):
+    """
+    Job entry point for a batch scrape.
+
+    Args:
+        years (list): Years to scrape.
+        pages (list): ScraperPages to scrape.
+        force (bool, optional): Parse and store unchanged pages too. Defaults to False.
+
+    Returns:
+        dict: The per-item summary under "items" and the total stored row count under "rows".
+    """
+
+    db = db_handler.SessionLocal()
+    try:
+        items = scrape_batch(years, pages, db, force=force)
+        return {"items": items, "rows": sum(item["rows"] for item in items)}
+    finally:
+        db.close()
+
+def get_pages_as_list(pages):
+    """
+    Convert a comma-separated string of page names into a list of ScraperPages.
+
+    Args:
+        pages (str): Comma-separated page names (e.g., "PRODUCTION,EXPORT"). If empty, all pages are returned.
+
+    Returns:
+        list[ScraperPages]: List of pages to scrape.
+
+    Raises:
+        ValueError: If any page name is invalid.
+    """
+
+    if not pages:
+        return list(ScraperPages)
+
+    try:
+        return [ScraperPages[page.strip().upper()] for page in pages.split(",")]
+    except KeyError:
+        raise ValueError(f"Invalid pages: {pages}. Must be a comma-separated subset of {[p.name for p in ScraperPages]}.")
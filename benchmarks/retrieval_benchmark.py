@@ -0,0 +1,122 @@
+"""
+Benchmark of the full-table retrieval path.
+
+Compares the original serialization path of the retrieval routes with the current one:
+
+    orm:  ORM entities -> `__dict__` comprehension -> `jsonable_encoder` -> stdlib `json`
+    core: Core column tuples -> `dict(zip(...))` -> orjson (`api.routes.retrieve.get_page`)
+
+Both paths read the same table through the configured `DATABASE_URL`, with the read cache
+disabled, and produce the JSON body of a full-table response.
+
+Usage:
+    python -m benchmarks.retrieval_benchmark EXPORT --repeat 5
+"""
+
+import json
+import time
+import argparse
+import statistics
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+
+from services.storage import db_handler, read_cache, PageModelMapping
+from api.routes.retrieve import get_page
+
+
+def orm_body(db, model):
+    """
+    Builds the response body with the original ORM path.
+
+    Args:
+        db (Session): SQLAlchemy session instance.
+        model (Base): SQLAlchemy model class representing the table.
+
+    Returns:
+        bytes: The JSON body.
+    """
+
+    rows = db.execute(select(model)).scalars().all()
+    data = [{key: value for key, value in row.__dict__.items() if not key.startswith("_")} for row in rows]
+    content = jsonable_encoder({"status": "success", "data": data, "next_cursor": None})
+    body = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # Drop the hydrated entities, as a request-scoped session would
+    db.expunge_all()
+    return body
+
+
+def core_body(db, model):
+    """
+    Builds the response body with the Core tuple and orjson path.
+
+    Args:
+        db (Session): SQLAlchemy session instance.
+        model (Base): SQLAlchemy model class representing the table.
+
+    Returns:
+        bytes: The JSON body.
+    """
+
+    return get_page(db, model)
+
+
+def measure(func, db, model, repeat):
+    """
+    Runs a path several times and records its latency.
+
+    Args:
+        func (callable): The path to measure.
+        db (Session): SQLAlchemy session instance.
+        model (Base): SQLAlchemy model class representing the table.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple[list, int]: The latencies in seconds and the size of the body in bytes.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func(db, model)
+        timings.append(time.perf_counter() - start)
+    return timings, len(body)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to None (`sys.argv`).
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the full-table retrieval path.")
+    parser.add_argument("page", type=str.upper, choices=[page.name for page in PageModelMapping])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per path.")
+    args = parser.parse_args(argv)
+
+    model = PageModelMapping[args.page].value
+    read_cache.ttl = 0
+
+    db = db_handler.SessionLocal()
+    try:
+        # Warm up the connection and the database buffers
+        core_body(db, model)
+
+        results = {name: measure(func, db, model, args.repeat) for name, func in (("orm", orm_body), ("core", core_body))}
+    finally:
+        db.close()
+
+    print(f"{model.__tablename__}: full-table read, {args.repeat} runs")
+    for name, (timings, size) in results.items():
+        print(f"  {name:<5} median {statistics.median(timings) * 1000:8.1f} ms  "
+              f"min {min(timings) * 1000:8.1f} ms  body {size / 1e6:6.1f} MB")
+
+    speedup = statistics.median(results["orm"][0]) / statistics.median(results["core"][0])
+    print(f"  speedup {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,43 @@ for key configurations used throughout the project.
 Environment Variables:
     BASE_URL (str): The base URL for scraping or API requests.
     DATABASE_URL (str): The database connection string.
+    ASYNC_DATABASE_URL (str): The connection string of the async engine used by the read endpoints.
+        Defaults to `DATABASE_URL` with the asyncpg (PostgreSQL) or aiosqlite (SQLite) driver.
+    DB_POOL_SIZE (int): Number of connections kept open by each database engine. Defaults to 5.
+    DB_MAX_OVERFLOW (int): Extra connections opened when the pool is exhausted. Defaults to 10.
+    DB_POOL_TIMEOUT (float): Seconds to wait for a free connection before failing. Defaults to 30.
+    DB_POOL_RECYCLE (int): Seconds after which connections are replaced (-1 disables). Defaults to 1800.
+    DB_POOL_PRE_PING (bool): Whether connections are tested before each checkout. Defaults to True.
+    DB_STATEMENT_TIMEOUT (int): PostgreSQL statement timeout in milliseconds (0 disables). Defaults to 0.
+    SCRAPER_MAX_WORKERS (int): Maximum number of suboptions fetched concurrently. Defaults to 5.
+    SCRAPER_POOL_SIZE (int): Maximum number of pooled HTTP connections per host. Defaults to 10.
+    SCRAPER_CONNECT_TIMEOUT (float): HTTP connection timeout in seconds. Defaults to 5.
+    SCRAPER_READ_TIMEOUT (float): HTTP read timeout in seconds. Defaults to 10.
+    SCRAPER_RETRIES (int): Number of retry attempts for failed HTTP requests. Defaults to 3.
+    SCRAPER_BACKOFF_FACTOR (float): Backoff multiplier between retries. Defaults to 1.
+    SCRAPER_BACKOFF_JITTER (float): Maximum random jitter added to each retry delay. Defaults to 0.5.
+    SCRAPER_CACHE_DIR (str): Directory of the raw HTML cache. Defaults to ".cache/html".
+    SCRAPER_CACHE_TTL (int): Seconds during which cached pages are used without revalidation. Defaults to 86400.
+    SCRAPER_PARSER_ENGINE (str): HTML table parser engine, "lxml" or "bs4". Defaults to "lxml".
+    SCRAPER_RATE_LIMIT (float): Maximum requests per second sent to a single host (0 disables). Defaults to 5.
+    SCRAPER_BATCH_MAX_WORKERS (int): Global concurrency cap for batch scrapes. Defaults to 8.
+    SCRAPE_STATE_TTL (int): Seconds during which a successfully scraped item is not fetched again
+        (0 always fetches). Defaults to 86400.
+    JOB_MAX_WORKERS (int): Number of worker threads running background jobs. Defaults to 2.
+    JOB_HISTORY_SIZE (int): Number of finished jobs kept in memory for status queries. Defaults to 1000.
+    BULK_BATCH_SIZE (int): Number of rows sent per statement by bulk upserts. Defaults to 1000.
+    INGEST_MODE (str): "copy" to load through PostgreSQL COPY and a staging table, or "upsert"
+        for batched INSERT ... ON CONFLICT. Defaults to "copy".
+    STREAM_BATCH_SIZE (int): Number of rows fetched per round trip by streaming reads. Defaults to 1000.
+    MAX_PAGE_SIZE (int): Largest `limit` accepted by paginated retrieval endpoints. Defaults to 10000.
+    READ_CACHE_TTL (int): Seconds a cached retrieval result is served (0 disables the cache). Defaults to 300.
+    READ_CACHE_MAX_BYTES (int): Maximum total size of the cached retrieval results. Defaults to 67108864 (64 MiB).
+    ANALYTICS_CACHE_TTL (int): Seconds computed analytics are kept (0 disables the cache). Defaults to 86400.
+    ANALYTICS_CACHE_MAX_BYTES (int): Maximum total size of the cached analytics. Defaults to 16777216 (16 MiB).
+    SNAPSHOT_DIR (str): Directory of the pre-compressed per-year and full-table snapshots (empty disables them).
+        Defaults to ".cache/snapshots".
+    MIGRATE_DEDUPLICATE (bool): Whether the migration command may delete rows sharing the key of a new
+        unique index, keeping the newest one. Defaults to False (the index is not created).
 
 Usage:
     Import the constants defined here to access configuration values:
@@ -25,3 +62,69 @@ BASE_URL = os.getenv("BASE_URL")
 
 # Database connection string
 DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Async database connection string (derived from DATABASE_URL if not set)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# Connection pool settings, applied to both the sync and async engines
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_STATEMENT_TIMEOUT = int(os.getenv("DB_STATEMENT_TIMEOUT", 0))
+
+# Maximum number of concurrent suboption fetches per scrape
+SCRAPER_MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", 5))
+
+# Shared HTTP client settings for the scraper
+SCRAPER_RATE_LIMIT = float(os.getenv("SCRAPER_RATE_LIMIT", 5))
+SCRAPER_POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", 10))
+SCRAPER_CONNECT_TIMEOUT = float(os.getenv("SCRAPER_CONNECT_TIMEOUT", 5))
+SCRAPER_READ_TIMEOUT = float(os.getenv("SCRAPER_READ_TIMEOUT", 10))
+SCRAPER_RETRIES = int(os.getenv("SCRAPER_RETRIES", 3))
+SCRAPER_BACKOFF_FACTOR = float(os.getenv("SCRAPER_BACKOFF_FACTOR", 1))
+SCRAPER_BACKOFF_JITTER = float(os.getenv("SCRAPER_BACKOFF_JITTER", 0.5))
+
+# Raw HTML cache settings for the scraper
+SCRAPER_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", ".cache/html")
+SCRAPER_CACHE_TTL = int(os.getenv("SCRAPER_CACHE_TTL", 86400))
+
+# HTML table parser engine ("lxml" for the single-pass parser, "bs4" for the BeautifulSoup fallback)
+SCRAPER_PARSER_ENGINE = os.getenv("SCRAPER_PARSER_ENGINE", "lxml")
+
+# Global concurrency cap for batch scrapes
+SCRAPER_BATCH_MAX_WORKERS = int(os.getenv("SCRAPER_BATCH_MAX_WORKERS", 8))
+
+# Seconds during which items recorded as scraped in the scrape state ledger are skipped
+SCRAPE_STATE_TTL = int(os.getenv("SCRAPE_STATE_TTL", 86400))
+
+# Background job worker pool
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", 2))
+JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", 1000))
+
+# Number of rows sent per statement by bulk upserts
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", 1000))
+
+# Ingest mode ("copy" uses PostgreSQL COPY with a staging table, "upsert" uses batched INSERTs)
+INGEST_MODE = os.getenv("INGEST_MODE", "copy")
+
+# Number of rows fetched per round trip by streaming reads
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", 1000))
+
+# Largest page size accepted by paginated retrieval endpoints
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 10000))
+
+# In-process cache for retrieval results, invalidated on writes
+READ_CACHE_TTL = int(os.getenv("READ_CACHE_TTL", 300))
+READ_CACHE_MAX_BYTES = int(os.getenv("READ_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+# In-process cache for computed analytics, keyed by data version and invalidated on writes
+ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", 86400))
+ANALYTICS_CACHE_MAX_BYTES = int(os.getenv("ANALYTICS_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+# Pre-compressed retrieval snapshots, rebuilt after each ingest
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", ".cache/snapshots")
+
+# Whether the migration command may delete duplicate rows to create a unique index
+MIGRATE_DEDUPLICATE = os.getenv("MIGRATE_DEDUPLICATE", "false").lower() in ("1", "true", "yes")
@@ -4,9 +4,10 @@ Entry point for the FastAPI application.
 This module initializes the FastAPI application, includes API routes, and handles database initialization.
 
 Components:
-    - FastAPI application: The main app instance.
+    - FastAPI application: The main app instance, rendering JSON responses with orjson by default.
     - Router: Routes for API endpoints included from the `api.router` module.
     - Startup Event: Initializes the database tables on application startup.
+    - Shutdown Event: Disposes of the async database engine.
 
 Usage:
     Run this module to start the FastAPI server:
@@ -18,10 +19,11 @@ Usage:
 
 from fastapi import FastAPI
 
-from services.storage import db_handler
+from services.storage import db_handler, async_db_handler
 from api.router import router
+from api.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(router)
 
 
@@ -35,6 +37,17 @@ async def startup_event():
     
     db_handler.init_db()
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Event handler triggered when the application stops.
+
+    Closes the pooled connections of the async database engine.
+    """
+
+    await async_db_handler.dispose()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
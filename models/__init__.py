@@ -4,6 +4,9 @@ from .export_model import Export
 from .production_model import Production
 from .commercialization_model import Commercialization
 from .processing_model import Processing
+from .data_version_model import DataVersion
+from .yearly_summary_model import YearlySummary
+from .scrape_state_model import ScrapeState
 
 
 __all__ = [
@@ -13,4 +16,7 @@ __all__ = [
     "Production",
     "Commercialization",
     "Processing",
+    "DataVersion",
+    "YearlySummary",
+    "ScrapeState",
 ]
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, BigInteger
+
+from .base import Base
+
+
+class DataVersion(Base):
+    """
+    Represents the data version table in the database.
+
+    Each row counts the writes made to one year of one data table. Versions are bumped
+    by `DBHandler` in the same transaction as the rows they describe, so they can be used
+    to tell whether a query result may have changed without reading the rows themselves.
+
+    Attributes:
+        table_name (str): The name of the data table (e.g., "export").
+        year (int): The year of the written rows.
+        version (BigInteger): The number of committed writes to the year of the table.
+
+    Constraints:
+        Primary key: The combination of 'table_name' and 'year'.
+
+    Table:
+        - Name: "data_version"
+    """
+
+    __tablename__ = "data_version"
+
+    table_name = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, BigInteger
+from sqlalchemy import Column, Integer, String, BigInteger, Index
 
 from .base import Base
 
@@ -16,14 +16,24 @@ class Export(Base):
         classification (str): The classification of the exported goods (e.g., type of product).
 
     Constraints:
-        UniqueConstraint: Ensures that each combination of 'year', 'country', and 'classification'
-                          is unique within the table.
+        Unique index (uq_export_natural_key): Ensures that each combination of 'year',
+                          'country', and 'classification' is unique within the table.
+
+    Indexes:
+        uq_export_natural_key: Also serves year filters, as 'year' is its leading column.
+        ix_export_classification_year: Serves classification filters, optionally combined with years.
+        ix_export_country: Serves country filters.
 
     Table:
         - Name: "export"
     """
 
     __tablename__ = "export"
+    __table_args__ = (
+        Index("uq_export_natural_key", "year", "country", "classification", unique=True),
+        Index("ix_export_classification_year", "classification", "year"),
+        Index("ix_export_country", "country"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     year = Column(Integer, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, BigInteger
+from sqlalchemy import Column, Integer, String, BigInteger, Index
 
 from .base import Base
 
@@ -16,14 +16,24 @@ class Import(Base):
         classification (str): The classification of the imported goods (e.g., type of product).
 
     Constraints:
-        UniqueConstraint: Ensures that each combination of 'year', 'country', and 'classification'
-                          is unique within the table.
+        Unique index (uq_import_natural_key): Ensures that each combination of 'year',
+                          'country', and 'classification' is unique within the table.
+
+    Indexes:
+        uq_import_natural_key: Also serves year filters, as 'year' is its leading column.
+        ix_import_classification_year: Serves classification filters, optionally combined with years.
+        ix_import_country: Serves country filters.
 
     Table:
         - Name: "import"
     """
 
     __tablename__ = "import"
+    __table_args__ = (
+        Index("uq_import_natural_key", "year", "country", "classification", unique=True),
+        Index("ix_import_classification_year", "classification", "year"),
+        Index("ix_import_country", "country"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     year = Column(Integer, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, BigInteger
+from sqlalchemy import Column, Integer, String, BigInteger, Index
 
 from .base import Base
 
@@ -13,19 +13,32 @@ class Processing(Base):
         variety (str): The variety of the processed product (e.g., type of grape or derivative).
         quantity (BigInteger, optional): The quantity of the processed product.
         classification (str): The classification of the processed product (e.g., type or category).
+        category (str): The parent category of the variety (e.g., "TINTAS"), or the variety itself for
+            category rows. Empty for rows stored before categories were recorded.
 
     Constraints:
-        UniqueConstraint: Ensures that each combination of 'year', 'variety', and 'classification'
-                          is unique within the table.
+        Unique index (uq_processing_natural_key): Ensures that each combination of 'year',
+                          'variety', 'classification' and 'category' is unique within the table.
+
+    Indexes:
+        uq_processing_natural_key: Also serves year filters, as 'year' is its leading column.
+        ix_processing_classification_year: Serves classification filters, optionally combined with years.
+        ix_processing_variety: Serves variety filters.
 
     Table:
         - Name: "processing"
     """
 
     __tablename__ = "processing"
+    __table_args__ = (
+        Index("uq_processing_natural_key", "year", "variety", "classification", "category", unique=True),
+        Index("ix_processing_classification_year", "classification", "year"),
+        Index("ix_processing_variety", "variety"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     year = Column(Integer, nullable=False)
     variety = Column(String, nullable=False)
     quantity = Column(BigInteger, nullable=True)
     classification = Column(String, nullable=False)
+    category = Column(String, nullable=False, default="", server_default="")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, BigInteger
+from sqlalchemy import Column, Integer, String, BigInteger, Index
 
 from .base import Base
 
@@ -10,16 +10,28 @@ class Production(Base):
     Attributes:
         id (int): Primary key for the table.
         year (int): The year associated with the production data.
+        category (str): The parent category of the product (e.g., "VINHO DE MESA"), or the product itself
+            for category rows. Empty for rows stored before categories were recorded.
         product (str): The name of the product being produced.
         quantity (int, optional): The quantity of the product produced.
 
     Constraints:
-        - UniqueConstraint: Ensures that the combination of 'year' and 'product' is unique.
+        - Unique index (uq_production_natural_key): Ensures that the combination of 'year',
+          'product' and 'category' is unique, so products listed under several categories (e.g., "Tinto") are all kept.
+
+    Indexes:
+        - uq_production_natural_key: Also serves year filters, as 'year' is its leading column.
+        - ix_production_product: Serves product filters.
     """
 
     __tablename__ = "production"
+    __table_args__ = (
+        Index("uq_production_natural_key", "year", "product", "category", unique=True),
+        Index("ix_production_product", "product"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     year = Column(Integer, nullable=False)
+    category = Column(String, nullable=False, default="", server_default="")
     product = Column(String, nullable=False)
     quantity = Column(BigInteger, nullable=True)
@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime
+
+from .base import Base
+
+
+class ScrapeState(Base):
+    """
+    Represents the scrape state ledger in the database.
+
+    Each row records the last scrape of one suboption of one year of a page: the hash of
+    the fetched content, the number of rows it held and the outcome. The scraper reads it
+    to skip items scraped recently and to recognize unchanged content, and the coverage
+    endpoint reports it.
+
+    Attributes:
+        page (str): The name of the scraped page (e.g., "EXPORT").
+        year (int): The scraped year.
+        suboption (str): The scraped suboption, or "default" for pages without suboptions.
+        content_hash (str, optional): SHA-256 hash of the fetched HTML content.
+        row_count (int): The number of rows of the content.
+        fetched_at (DateTime): When the item was last fetched.
+        duration (float, optional): Seconds spent fetching and parsing the item.
+        status (str): The outcome of the last scrape (see `ScrapeStatus`).
+        error (str, optional): The error of the last scrape, if it failed.
+
+    Constraints:
+        Primary key: The combination of 'page', 'year' and 'suboption'.
+
+    Table:
+        - Name: "scrape_state"
+    """
+
+    __tablename__ = "scrape_state"
+
+    page = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    suboption = Column(String, primary_key=True)
+    content_hash = Column(String, nullable=True)
+    row_count = Column(Integer, nullable=False, default=0)
+    fetched_at = Column(DateTime(timezone=True), nullable=False)
+    duration = Column(Float, nullable=True)
+    status = Column(String, nullable=False)
+    error = Column(String, nullable=True)
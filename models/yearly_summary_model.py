@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, BigInteger
+
+from .base import Base
+
+
+class YearlySummary(Base):
+    """
+    Represents the yearly summary table in the database.
+
+    Each row holds the totals of one category (e.g., a classification or a product) for
+    one year of one data table. Summaries are recomputed by `DBHandler` for the written
+    years in the same transaction as the rows they describe, so summary reads never scan
+    the data tables.
+
+    Attributes:
+        table_name (str): The name of the data table (e.g., "export").
+        year (int): The year of the summarized rows.
+        category (str): The value of the table's summary column (see `SummaryKeyMapping`).
+        quantity (BigInteger, optional): The total quantity of the rows.
+        value (BigInteger, optional): The total value of the rows, for tables with a value column.
+        row_count (int): The number of summarized rows.
+
+    Constraints:
+        Primary key: The combination of 'table_name', 'year' and 'category'.
+
+    Table:
+        - Name: "yearly_summary"
+    """
+
+    __tablename__ = "yearly_summary"
+
+    table_name = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    category = Column(String, primary_key=True)
+    quantity = Column(BigInteger, nullable=True)
+    value = Column(BigInteger, nullable=True)
+    row_count = Column(Integer, nullable=False, default=0)
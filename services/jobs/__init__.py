@@ -0,0 +1,5 @@
+from .job_enums import JobStatus
+from services.jobs.job_manager import Job, JobManager
+
+# Create a global instance of JobManager
+job_manager = JobManager()
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class JobStatus(Enum):
+    """
+    Represents the lifecycle states of a background job.
+
+    Members:
+        PENDING (str): The job is queued and waiting for a worker.
+        RUNNING (str): The job is being executed.
+        SUCCEEDED (str): The job finished without raising an exception.
+        FAILED (str): The job raised an exception.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -0,0 +1,184 @@
+import time
+import uuid
+import logging
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from config import JOB_MAX_WORKERS, JOB_HISTORY_SIZE
+
+from .job_enums import JobStatus
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+class Job:
+    """
+    Represents a unit of background work and its execution metadata.
+
+    Attributes:
+        id (str): Unique identifier of the job.
+        kind (str): The kind of work (e.g., "scrape", "scrape_batch").
+        params (dict): The parameters the job was submitted with.
+        status (JobStatus): The current status of the job.
+        created_at (float): Epoch timestamp when the job was submitted.
+        started_at (float): Epoch timestamp when a worker picked up the job, or None.
+        finished_at (float): Epoch timestamp when the job finished, or None.
+        rows (int): Number of rows stored by the job.
+        result: The value returned by the job function, or None.
+        error (str): The error message if the job failed, or None.
+
+    Methods:
+        to_dict() -> dict:
+            Serializes the job, including queue and run durations, for API responses.
+    """
+
+    def __init__(self, kind, params):
+        """
+        Initializes a pending Job.
+
+        Args:
+            kind (str): The kind of work.
+            params (dict): The parameters the job was submitted with.
+        """
+
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = JobStatus.PENDING
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.rows = 0
+        self.result = None
+        self.error = None
+
+    def to_dict(self):
+        """
+        Serializes the job for API responses.
+
+        Returns:
+            dict: The job metadata, with `queued_seconds` and `run_seconds` timings.
+        """
+
+        end = self.finished_at or time.time()
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queued_seconds": round((self.started_at or end) - self.created_at, 3),
+            "run_seconds": round(end - self.started_at, 3) if self.started_at else None,
+            "rows": self.rows,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs jobs on a dedicated worker pool and keeps track of their status.
+
+    Jobs are kept in memory, so their status is only visible from the process that
+    accepted them. The most recent `history_size` jobs are retained.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The worker pool used to run jobs.
+        history_size (int): Maximum number of jobs kept for status queries.
+
+    Methods:
+        submit(kind: str, params: dict, func: callable, *args, **kwargs) -> Job:
+            Queues a job and returns it immediately.
+
+        get(job_id: str) -> Job:
+            Returns the job with the given id, or None.
+    """
+
+    def __init__(self, max_workers=JOB_MAX_WORKERS, history_size=JOB_HISTORY_SIZE):
+        """
+        Initializes the JobManager.
+
+        Args:
+            max_workers (int): Number of worker threads. Defaults to `JOB_MAX_WORKERS`.
+            history_size (int): Maximum number of retained jobs. Defaults to `JOB_HISTORY_SIZE`.
+        """
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.history_size = history_size
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, params, func, *args, **kwargs):
+        """
+        Queues a job for execution on the worker pool.
+
+        The job function should return a dictionary; if it contains a "rows" key,
+        that value is reported as the job's row count.
+
+        Args:
+            kind (str): The kind of work.
+            params (dict): The parameters to report for the job.
+            func (callable): The function to execute.
+            *args: Positional arguments for `func`.
+            **kwargs: Keyword arguments for `func`.
+
+        Returns:
+            Job: The pending job.
+        """
+
+        job = Job(kind, params)
+
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.history_size:
+                self._jobs.popitem(last=False)
+
+        self.executor.submit(self._run, job, func, *args, **kwargs)
+        logger.info(f"Job {job.id} ({kind}) queued")
+
+        return job
+
+    def get(self, job_id):
+        """
+        Returns the job with the given id.
+
+        Args:
+            job_id (str): The job identifier.
+
+        Returns:
+            Job: The job, or None if it is unknown or no longer retained.
+        """
+
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, func, *args, **kwargs):
+        """
+        Executes a job and records its outcome.
+
+        Args:
+            job (Job): The job to execute.
+            func (callable): The function to execute.
+            *args: Positional arguments for `func`.
+            **kwargs: Keyword arguments for `func`.
+        """
+
+        job.started_at = time.time()
+        job.status = JobStatus.RUNNING
+
+        try:
+            job.result = func(*args, **kwargs)
+            if isinstance(job.result, dict):
+                job.rows = job.result.get("rows", 0)
+            job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = time.time()
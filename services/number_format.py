@@ -0,0 +1,56 @@
+import re
+import pandas as pd
+
+# Cell values used by the source tables to represent missing data
+PLACEHOLDERS = frozenset({"", "-", "*"})
+
+# Integers written with "." as the thousands separator (e.g., "1.234.567")
+BRAZILIAN_INTEGER = re.compile(r"^\d{1,3}(\.\d{3})*$|^\d+$")
+
+
+def mask_placeholders(values: pd.Series) -> pd.Series:
+    """
+    Strips cell texts and replaces the missing data placeholders with missing values.
+
+    Args:
+        values (pd.Series): The cell texts.
+
+    Returns:
+        pd.Series: A string Series where `"-"`, `"*"` and blank cells are missing.
+    """
+
+    text = values.astype("string").str.strip()
+    return text.mask(text.isin(PLACEHOLDERS))
+
+
+def is_brazilian_integer(text: pd.Series) -> bool:
+    """
+    Checks whether every present value is an integer in the Brazilian format.
+
+    Args:
+        text (pd.Series): Cell texts, as returned by `mask_placeholders`.
+
+    Returns:
+        bool: True if there is at least one present value and all of them match `BRAZILIAN_INTEGER`.
+    """
+
+    present = text.dropna()
+    return not present.empty and bool(present.str.match(BRAZILIAN_INTEGER).all())
+
+
+def parse_integers(text: pd.Series) -> pd.Series:
+    """
+    Converts integers written with "." as the thousands separator into a nullable Int64 Series.
+
+    Args:
+        text (pd.Series): Cell texts, as returned by `mask_placeholders`.
+
+    Returns:
+        pd.Series: An Int64 Series; missing and unparseable values are `<NA>`.
+
+    Example:
+        parse_integers(mask_placeholders(pd.Series(["1.234", "-"])))
+        # [1234, <NA>]
+    """
+
+    return pd.to_numeric(text.str.replace(".", "", regex=False), errors="coerce").astype("Int64")
@@ -1,3 +1,5 @@
-from .scraper_enums import ScraperPages
+from .scraper_enums import ScraperPages, ScrapeStatus
 from .scraper_parsers import ScraperParsers
 from .scraper import Scraper
+from .http_client import HTTPClient, RateLimiter, RateLimitedRetry, http_client
+from .html_cache import HTMLCache, html_cache
@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+
+from config import SCRAPER_CACHE_DIR, SCRAPER_CACHE_TTL
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class HTMLCache:
+    """
+    A disk-backed, content-addressed cache for raw HTML pages.
+
+    Raw HTML is stored once per content hash under `objects/`, while small JSON entries
+    under `entries/` map each (year, option, suboption) to the hash of its latest content
+    and to the HTTP validators (ETag / Last-Modified) returned by the server.
+
+    Layout:
+        {cache_dir}/objects/{sha256}.html
+        {cache_dir}/entries/{option}_{suboption}_{year}.json
+
+    Attributes:
+        cache_dir (str): Root directory of the cache.
+        ttl (int): Number of seconds during which an entry is served without contacting the server.
+
+    Methods:
+        get(year: int, option: str, suboption: str = None) -> dict:
+            Returns the cache entry for the given key, or None.
+
+        read_html(entry: dict) -> str:
+            Returns the raw HTML referenced by an entry, or None if the object is missing.
+
+        is_fresh(entry: dict) -> bool:
+            Checks whether an entry is still within its TTL.
+
+        conditional_headers(entry: dict) -> dict:
+            Builds If-None-Match / If-Modified-Since headers for an entry.
+
+        put(year: int, option: str, suboption: str, html: str, etag: str = None, last_modified: str = None) -> dict:
+            Stores the HTML and its metadata, returning the new entry.
+
+        touch(year: int, option: str, suboption: str, entry: dict) -> dict:
+            Marks an entry as revalidated after a 304 Not Modified response.
+
+        remove(year: int, option: str, suboption: str = None) -> bool:
+            Removes the entry of a page whose content could not be parsed or stored.
+    """
+
+    def __init__(self, cache_dir=SCRAPER_CACHE_DIR, ttl=SCRAPER_CACHE_TTL):
+        """
+        Initializes the HTMLCache.
+
+        Args:
+            cache_dir (str): Root directory of the cache. Defaults to `SCRAPER_CACHE_DIR`.
+            ttl (int): Freshness lifetime in seconds. Defaults to `SCRAPER_CACHE_TTL`.
+        """
+
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(html):
+        """
+        Computes the SHA-256 hash of the HTML content.
+
+        Args:
+            html (str): The HTML content.
+
+        Returns:
+            str: The hexadecimal digest.
+        """
+
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, year, option, suboption):
+        return os.path.join(self.cache_dir, "entries", f"{option}_{suboption or 'default'}_{year}.json")
+
+    def _object_path(self, content_hash):
+        return os.path.join(self.cache_dir, "objects", f"{content_hash}.html")
+
+    def _write_atomic(self, path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+
+    def get(self, year, option, suboption=None):
+        """
+        Returns the cache entry for the given key.
+
+        Args:
+            year (int): The year of the page.
+            option (str): The page option (e.g., "opt_02").
+            suboption (str, optional): The page suboption. Defaults to None.
+
+        Returns:
+            dict: The entry metadata, or None if the key is not cached or unreadable.
+        """
+
+        try:
+            with open(self._entry_path(year, option, suboption), encoding="utf-8") as entry_file:
+                return json.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {option}/{suboption}/{year}: {e}")
+            return None
+
+    def read_html(self, entry):
+        """
+        Returns the raw HTML referenced by an entry.
+
+        Args:
+            entry (dict): A cache entry.
+
+        Returns:
+            str: The cached HTML, or None if the object file is missing.
+        """
+
+        try:
+            with open(self._object_path(entry["content_hash"]), encoding="utf-8") as object_file:
+                return object_file.read()
+        except (OSError, KeyError):
+            return None
+
+    def is_fresh(self, entry):
+        """
+        Checks whether an entry is still within its TTL.
+
+        Args:
+            entry (dict): A cache entry.
+
+        Returns:
+            bool: True if the entry was validated less than `ttl` seconds ago.
+        """
+
+        return self.ttl > 0 and time.time() - entry.get("validated_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Builds conditional request headers from an entry's validators.
+
+        Args:
+            entry (dict): A cache entry, or None.
+
+        Returns:
+            dict: Headers for a conditional GET (empty if no validators are known).
+        """
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, year, option, suboption, html, etag=None, last_modified=None):
+        """
+        Stores the HTML and its metadata.
+
+        Args:
+            year (int): The year of the page.
+            option (str): The page option.
+            suboption (str): The page suboption, or None.
+            html (str): The raw HTML content.
+            etag (str, optional): The ETag returned by the server. Defaults to None.
+            last_modified (str, optional): The Last-Modified header returned by the server. Defaults to None.
+
+        Returns:
+            dict: The stored entry.
+        """
+
+        now = time.time()
+        entry = {
+            "year": year,
+            "option": option,
+            "suboption": suboption,
+            "content_hash": self.content_hash(html),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": now,
+            "validated_at": now,
+        }
+
+        try:
+            with self._lock:
+                object_path = self._object_path(entry["content_hash"])
+                if not os.path.exists(object_path):
+                    self._write_atomic(object_path, html)
+                self._write_atomic(self._entry_path(year, option, suboption), json.dumps(entry))
+        except OSError as e:
+            logger.warning(f"Failed to cache HTML for {option}/{suboption}/{year}: {e}")
+
+        return entry
+
+    def touch(self, year, option, suboption, entry):
+        """
+        Marks an entry as revalidated after a 304 Not Modified response.
+
+        Args:
+            year (int): The year of the page.
+            option (str): The page option.
+            suboption (str): The page suboption, or None.
+            entry (dict): The existing cache entry.
+
+        Returns:
+            dict: The updated entry.
+        """
+
+        entry = {**entry, "validated_at": time.time()}
+
+        try:
+            with self._lock:
+                self._write_atomic(self._entry_path(year, option, suboption), json.dumps(entry))
+        except OSError as e:
+            logger.warning(f"Failed to update cache entry for {option}/{suboption}/{year}: {e}")
+
+        return entry
+
+    def remove(self, year, option, suboption=None):
+        """
+        Removes the entry of a page, so its next fetch is unconditional and treated as changed.
+
+        Entries are written as soon as a page is fetched; callers remove them when the page
+        could not be parsed or stored, otherwise the next scrape would see a 304 or an
+        unchanged hash and skip content that was never written. The HTML object is kept,
+        since other entries may reference the same content.
+
+        Args:
+            year (int): The year of the page.
+            option (str): The page option.
+            suboption (str, optional): The page suboption. Defaults to None.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+
+        try:
+            with self._lock:
+                os.remove(self._entry_path(year, option, suboption))
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to remove cache entry for {option}/{suboption}/{year}: {e}")
+            return False
+
+
+# Create a global instance shared by all scrapers
+html_cache = HTMLCache()
@@ -0,0 +1,295 @@
+import time
+import logging
+import threading
+import requests
+
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import (
+    SCRAPER_POOL_SIZE,
+    SCRAPER_CONNECT_TIMEOUT,
+    SCRAPER_READ_TIMEOUT,
+    SCRAPER_RETRIES,
+    SCRAPER_BACKOFF_FACTOR,
+    SCRAPER_BACKOFF_JITTER,
+    SCRAPER_RATE_LIMIT,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A thread-safe per-host rate limiter.
+
+    Requests to the same host are spaced at least `1 / rate` seconds apart, regardless
+    of how many threads are issuing them or whether they are first attempts or retries.
+
+    Attributes:
+        rate (float): Maximum number of requests per second per host. 0 disables the limit.
+
+    Methods:
+        wait(url: str):
+            Blocks until a request to the URL's host is allowed.
+    """
+
+    def __init__(self, rate=SCRAPER_RATE_LIMIT):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            rate (float): Maximum number of requests per second per host. Defaults to `SCRAPER_RATE_LIMIT`.
+        """
+
+        self.rate = rate
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """
+        Blocks until a request to the URL's host is allowed.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+
+        if self.rate <= 0:
+            return
+
+        host = urlsplit(url).hostname
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1 / self.rate
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RateLimitedRetry(Retry):
+    """
+    A urllib3 Retry policy that takes a rate limiter slot before every retry attempt.
+
+    urllib3 re-issues failed requests inside the connection pool, so limiting only the
+    initial call would let retries of 429 and 5xx responses reach the host unthrottled.
+    The slot is taken after the backoff delay, right before the request is sent again.
+
+    Attributes:
+        rate_limiter (RateLimiter): The rate limiter shared with the first attempts.
+        url (str): The scheme and host of the request being retried, set on each increment.
+
+    Methods:
+        new(**kw) -> RateLimitedRetry:
+            Returns a copy of the policy that keeps the rate limiter and URL.
+
+        increment(*args, **kwargs) -> RateLimitedRetry:
+            Returns the incremented policy, recording the host of the connection pool.
+
+        sleep(response=None):
+            Sleeps for the backoff delay, then waits for the host's rate limiter.
+    """
+
+    def __init__(self, *args, rate_limiter=None, url=None, **kwargs):
+        """
+        Initializes the RateLimitedRetry.
+
+        Args:
+            rate_limiter (RateLimiter, optional): The rate limiter applied to retries. Defaults to None.
+            url (str, optional): The scheme and host of the request. Defaults to None.
+            *args, **kwargs: Arguments of `urllib3.util.retry.Retry`.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.url = url
+
+    def new(self, **kw):
+        """
+        Returns a copy of the policy that keeps the rate limiter and URL.
+
+        Args:
+            **kw: Retry attributes to override.
+
+        Returns:
+            RateLimitedRetry: The new policy.
+        """
+
+        kw.setdefault("rate_limiter", self.rate_limiter)
+        kw.setdefault("url", self.url)
+        return super().new(**kw)
+
+    def increment(self, *args, **kwargs):
+        """
+        Returns the incremented policy, recording the host of the connection pool.
+
+        Args:
+            *args, **kwargs: Arguments of `urllib3.util.retry.Retry.increment`.
+
+        Returns:
+            RateLimitedRetry: The incremented policy.
+        """
+
+        retry = super().increment(*args, **kwargs)
+        pool = kwargs.get("_pool")
+        if pool is not None:
+            retry.url = f"{pool.scheme}://{pool.host}"
+        return retry
+
+    def sleep(self, response=None):
+        """
+        Sleeps for the backoff delay, then waits for the host's rate limiter.
+
+        Args:
+            response (BaseHTTPResponse, optional): The response that triggered the retry. Defaults to None.
+        """
+
+        super().sleep(response)
+        if self.rate_limiter is not None and self.url is not None:
+            self.rate_limiter.wait(self.url)
+
+
+class HTTPClient:
+    """
+    A process-wide HTTP client shared by all Scraper instances.
+
+    The client lazily creates a single `requests.Session` backed by a pooled `HTTPAdapter`,
+    so consecutive requests to the same host reuse keep-alive connections instead of
+    opening a new TCP connection each time. Retries are handled at the transport level
+    by urllib3 with exponential backoff and jitter, and every attempt, including
+    retries, is spaced per host by a shared RateLimiter.
+
+    Attributes:
+        pool_size (int): Maximum number of pooled connections per host.
+        timeout (tuple): The (connect, read) timeout in seconds.
+        retries (int): Number of retry attempts for failed requests.
+        backoff_factor (float): Backoff multiplier for retry delays.
+        backoff_jitter (float): Maximum random jitter, in seconds, added to each retry delay.
+        rate_limiter (RateLimiter): The per-host rate limiter applied to every request attempt.
+
+    Methods:
+        session -> requests.Session:
+            Returns the shared session, creating it on first use.
+
+        get(url: str, headers: dict = None) -> requests.Response:
+            Performs a GET request using the shared session.
+
+        close():
+            Closes the shared session and its pooled connections.
+    """
+
+    def __init__(
+        self,
+        pool_size=SCRAPER_POOL_SIZE,
+        connect_timeout=SCRAPER_CONNECT_TIMEOUT,
+        read_timeout=SCRAPER_READ_TIMEOUT,
+        retries=SCRAPER_RETRIES,
+        backoff_factor=SCRAPER_BACKOFF_FACTOR,
+        backoff_jitter=SCRAPER_BACKOFF_JITTER,
+        rate_limit=SCRAPER_RATE_LIMIT,
+    ):
+        """
+        Initializes the HTTPClient with pool, timeout and retry settings.
+
+        Args:
+            pool_size (int): Maximum number of pooled connections per host. Defaults to `SCRAPER_POOL_SIZE`.
+            connect_timeout (float): Connection timeout in seconds. Defaults to `SCRAPER_CONNECT_TIMEOUT`.
+            read_timeout (float): Read timeout in seconds. Defaults to `SCRAPER_READ_TIMEOUT`.
+            retries (int): Number of retry attempts. Defaults to `SCRAPER_RETRIES`.
+            backoff_factor (float): Backoff multiplier for retry delays. Defaults to `SCRAPER_BACKOFF_FACTOR`.
+            backoff_jitter (float): Maximum jitter added to retry delays. Defaults to `SCRAPER_BACKOFF_JITTER`.
+            rate_limit (float): Maximum requests per second per host. Defaults to `SCRAPER_RATE_LIMIT`.
+        """
+
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        self.rate_limiter = RateLimiter(rate_limit)
+
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        Returns the shared session, creating it on first use.
+
+        Returns:
+            requests.Session: The pooled session used for all scraping requests.
+        """
+
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        """
+        Builds a session with a pooled adapter and transport-level retries.
+
+        Returns:
+            requests.Session: A configured session instance.
+        """
+
+        retry = RateLimitedRetry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            backoff_jitter=self.backoff_jitter,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+            rate_limiter=self.rate_limiter,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        logger.info(f"HTTP session created (pool size: {self.pool_size}, retries: {self.retries})")
+        return session
+
+    def get(self, url, headers=None):
+        """
+        Performs a GET request using the shared session.
+
+        The first attempt waits for the rate limiter here; retries wait in `RateLimitedRetry.sleep`.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (dict, optional): Additional request headers. Defaults to None.
+
+        Returns:
+            requests.Response: The response object. Gzip-encoded bodies are decoded transparently.
+
+        Raises:
+            RequestException: If the request fails after all retry attempts.
+        """
+
+        self.rate_limiter.wait(url)
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def close(self):
+        """
+        Closes the shared session and releases its pooled connections.
+        """
+
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Create a global instance shared by all scrapers
+http_client = HTTPClient()
@@ -1,34 +1,71 @@
+import re
+import logging
 import pandas as pd
+import lxml.html
+
+from io import StringIO
 
 from bs4 import BeautifulSoup
 
+from config import SCRAPER_PARSER_ENGINE
+from services.number_format import mask_placeholders, is_brazilian_integer, parse_integers
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r"\s+")
+
+# CSS classes of the rows opening a category and of the rows nested under it
+ITEM_CLASS = "tb_item"
+SUBITEM_CLASS = "tb_subitem"
+
 
 class BaseParser:
     """
-    A base class for parsing HTML tables using BeautifulSoup and pandas.
+    A base class for parsing HTML tables using lxml (default) or BeautifulSoup and pandas.
 
     Attributes:
         class_name (str): The CSS class name of the table to parse. Defaults to "tb_base tb_dados".
+        engine (str): The parsing engine, either "lxml" or "bs4". Defaults to `SCRAPER_PARSER_ENGINE`.
+        category_column (str): The name of the column holding each row's parent category, or None
+            for tables without nested rows. Defaults to None.
 
     Methods:
         parse(html: str) -> pd.DataFrame:
             Parses the HTML to extract a table with the specified class name and converts it into a pandas DataFrame.
     """
 
-    def __init__(self, class_name="tb_base tb_dados"):
+    def __init__(self, class_name="tb_base tb_dados", engine=SCRAPER_PARSER_ENGINE, category_column=None):
         """
         Initializes the BaseParser with a specific table class name.
 
         Args:
             class_name (str): The CSS class name of the table to parse. Defaults to "tb_base tb_dados".
+            engine (str): The parsing engine, either "lxml" or "bs4". Defaults to `SCRAPER_PARSER_ENGINE`.
+            category_column (str, optional): The name of the column added with each row's parent
+                category. Defaults to None (no column is added).
         """
 
         self.class_name = class_name
+        self.engine = engine
+        self.category_column = category_column
 
     def parse(self, html):
         """
         Parses the HTML to extract a table with the specified class name.
 
+        The "lxml" engine walks the table once and builds the DataFrame directly from
+        columnar lists, converting integer columns written in the Brazilian format
+        (e.g., "1.234") to nullable Int64 and placeholders ("-", "*", "") to missing values.
+        If the table layout is not supported, it falls back to the "bs4" engine.
+
+        Footer rows (`<tfoot>`, e.g., the "Total" row) repeat the sum of the other rows, so
+        they are skipped by both engines.
+
+        When `category_column` is set, a column with each row's parent category is added:
+        rows of class "tb_item" (and rows without a class) are their own category, and rows
+        of class "tb_subitem" belong to the last category above them. Without it, nested
+        rows sharing a name under different categories (e.g., "Tinto") could not be told apart.
+
         Args:
             html (str): The HTML content as a string.
 
@@ -50,12 +87,158 @@ class BaseParser:
             print(df)
         """
 
+        if self.engine == "lxml":
+            df = self.parse_lxml(html)
+            if df is not None:
+                return df
+            logger.warning(f"Unsupported layout for table '{self.class_name}', falling back to bs4")
+
+        return self.parse_bs4(html)
+
+    def parse_lxml(self, html):
+        """
+        Parses the table in a single pass with lxml.
+
+        Args:
+            html (str): The HTML content as a string.
+
+        Returns:
+            pd.DataFrame: A DataFrame with typed numeric columns, or None if the table has no header row.
+
+        Raises:
+            ValueError: If no table with the specified class name is found in the HTML.
+        """
+
+        tables = lxml.html.fromstring(html).xpath("//table[@class=$name]", name=self.class_name)
+
+        if not tables:
+            raise ValueError(f"Table with class '{self.class_name}' not found.")
+
+        header = None
+        rows = []
+        classes = []
+        for tr in tables[0].iter("tr"):
+            if tr.getparent().tag == "tfoot":
+                continue
+
+            cells = tr.xpath("./th|./td")
+            values = [WHITESPACE.sub(" ", cell.text_content()).strip() for cell in cells]
+
+            if header is None:
+                if tr.getparent().tag == "thead" or all(cell.tag == "th" for cell in cells):
+                    header = values
+                    continue
+                return None
+
+            if values:
+                rows.append(values)
+                classes.append(" ".join([tr.get("class", ""), cells[0].get("class", "")]).split())
+
+        if not header or any(len(values) != len(header) for values in rows):
+            return None
+
+        columns = list(zip(*rows)) if rows else [()] * len(header)
+
+        df = pd.DataFrame({
+            name: self._to_typed_column(values) for name, values in zip(header, columns)
+        })
+        return self._add_categories(df, classes)
+
+    def parse_bs4(self, html):
+        """
+        Parses the table with BeautifulSoup and `pd.read_html`.
+
+        This is the original parsing path, kept as a fallback for layouts the lxml engine does not handle.
+        Cells are read as text and typed like the lxml engine does, so both engines return
+        the same frame for the same table (pandas' own inference would read "26.415" as a float).
+
+        Args:
+            html (str): The HTML content as a string.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame containing the table data.
+
+        Raises:
+            ValueError: If no table with the specified class name is found in the HTML.
+        """
+
         soup = BeautifulSoup(html, 'html.parser')
         table = soup.find("table", class_=self.class_name)
 
         if not table:
             raise ValueError(f"Table with class '{self.class_name}' not found.")
 
-        df = pd.read_html(str(table))[0]
+        for footer in table.find_all("tfoot"):
+            footer.decompose()
+
+        width = max((len(tr.find_all(["th", "td"], recursive=False)) for tr in table.find_all("tr")), default=0)
+        df = pd.read_html(
+            StringIO(str(table)), keep_default_na=False, converters={position: str for position in range(width)}
+        )[0]
+
+        df = pd.DataFrame({
+            name: self._to_typed_column(tuple(WHITESPACE.sub(" ", str(value)).strip() for value in df[name]))
+            for name in df.columns
+        })
+
+        if self.category_column is None:
+            return df
+
+        # The body rows, in the order read_html returns them
+        rows = [tr for tr in table.find_all("tr") if tr.find(["th", "td"], recursive=False)]
+        while rows and (rows[0].parent.name == "thead" or not rows[0].find("td", recursive=False)):
+            rows.pop(0)
+
+        if len(rows) != len(df):
+            raise ValueError(f"Could not assign categories to the rows of table '{self.class_name}'.")
+
+        classes = [
+            [*tr.get("class", []), *tr.find(["th", "td"], recursive=False).get("class", [])] for tr in rows
+        ]
+        return self._add_categories(df, classes)
+
+    def _add_categories(self, df, classes):
+        """
+        Adds the parent category of every row as `category_column`.
+
+        Args:
+            df (pd.DataFrame): The parsed table, whose first column holds the row names.
+            classes (list): The CSS classes of each row and of its first cell.
+
+        Returns:
+            pd.DataFrame: The table with the category column appended, or unchanged if
+            `category_column` is not set.
+        """
+
+        if self.category_column is None:
+            return df
+
+        categories = []
+        current = ""
+        for name, row_classes in zip(df.iloc[:, 0], classes):
+            if SUBITEM_CLASS not in row_classes or ITEM_CLASS in row_classes:
+                current = str(name)
+            categories.append(current)
+
+        return df.assign(**{self.category_column: pd.Series(categories, index=df.index, dtype=object)})
+
+    @staticmethod
+    def _to_typed_column(values):
+        """
+        Converts a column of cell texts into a typed pandas Series.
+
+        Args:
+            values (tuple): The cell texts of a single column.
+
+        Returns:
+            pd.Series: An Int64 Series if every non-placeholder value is an integer in the
+            Brazilian format, otherwise an object Series with the original texts.
+        """
+
+        column = pd.Series(values, dtype=object)
+        text = mask_placeholders(column)
+
+        if not is_brazilian_integer(text):
+            return column
 
-        return df
+        return parse_integers(text)
@@ -10,6 +10,7 @@ class ProcessingParser(BaseParser):
 
     Attributes:
         class_name (str): The CSS class name of the table to parse. Inherits the default value "tb_base tb_dados" from BaseParser.
+        category_column (str): "Categoria", the column holding each row's parent category.
 
     Methods:
         parse(html: str) -> pd.DataFrame:
@@ -21,7 +22,7 @@ class ProcessingParser(BaseParser):
         Initializes the ProcessingParser with the default table class name.
 
         Inherits:
-            BaseParser.__init__: Uses the default class name "tb_base tb_dados".
+            BaseParser.__init__: Uses the default class name "tb_base tb_dados" and adds a "Categoria" column.
         """
 
-        super().__init__()
+        super().__init__(category_column="Categoria")
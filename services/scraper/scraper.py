@@ -1,11 +1,11 @@
-import time
 import logging
-import requests
 
 from requests.exceptions import RequestException
 
 from config import BASE_URL
 
+from .html_cache import html_cache
+from .http_client import http_client
 from .scraper_enums import ScraperPages
 from .scraper_parsers import ScraperParsers
 
@@ -21,19 +21,26 @@ class Scraper:
         year (int): The year for which data is being scraped.
         page (ScraperPages): The page enum indicating which data to scrape.
         url (str): The constructed URL for scraping based on the year and page.
+        force (bool): Whether to parse the page even if its content has not changed.
+        known_hash (str): Hash of the content stored by the last scrape, if known.
+        content_hash (str): SHA-256 hash of the last fetched HTML content.
+        changed (bool): Whether the last fetched content differs from the cached version.
 
     Methods:
-        fetch_data(retries=3, backoff_factor=2) -> str:
-            Fetches the HTML content from the URL with retry logic.
+        fetch_data() -> str:
+            Fetches the HTML content from the URL using the shared HTTP client.
 
         parse_data(html: str) -> pd.DataFrame:
             Parses the fetched HTML content using the appropriate parser.
 
         scrape() -> pd.DataFrame:
             Fetches and parses the data, returning it as a pandas DataFrame.
+
+        discard_cache():
+            Removes the cache entry of the page after its content failed to be parsed or stored.
     """
 
-    def __init__(self, year, page: ScraperPages, suboption: str = None):
+    def __init__(self, year, page: ScraperPages, suboption: str = None, force: bool = False, known_hash: str = None):
         """
         Initializes the Scraper with the specified year, page, and optional suboption.
 
@@ -48,6 +55,12 @@ class Scraper:
                                 This determines the `option` in the URL.
             suboption (str, optional): The suboption to scrape (if applicable).
                                     Defaults to None.
+            force (bool, optional): Parse the page even if its content is unchanged.
+                                    Defaults to False.
+            known_hash (str, optional): Hash of the content stored by the last scrape (e.g., from
+                                        the scrape state ledger). When given, the content is
+                                        unchanged if its hash matches it, regardless of the cache.
+                                        Defaults to None.
 
         Attributes:
             year (int): The year being scraped.
@@ -55,6 +68,8 @@ class Scraper:
             option (str): The option value extracted from the page enum (used in the URL).
             suboption (str or None): The suboption being scraped, if provided.
             url (str): The constructed URL for scraping data.
+            force (bool): Whether unchanged content should still be parsed.
+            known_hash (str or None): Hash of the last stored content.
 
         Example:
             Initialize a Scraper for the "PROCESSING" page with a specific suboption:
@@ -67,44 +82,80 @@ class Scraper:
         self.page = page
         self.option = page.value["option"]
         self.suboption = suboption
+        self.force = force
+        self.known_hash = known_hash
+
+        self.content_hash = None
+        self.changed = True
 
         self.url = f"{BASE_URL}?ano={year}&opcao={self.option}"
         if self.suboption:
             self.url += f"&subopcao={self.suboption}"
 
-    def fetch_data(self, retries=3, backoff_factor=2):
+    def fetch_data(self):
         """
-        Fetch the page data with retry logic.
+        Fetch the page data using the shared HTTP client and the raw HTML cache.
 
-        Args:
-            retries (int): Number of retry attempts. Defaults to 3.
-            backoff_factor (int): Backoff multiplier for retry delays. Defaults to 2.
+        Entries still within the cache TTL are served without contacting the server.
+        Stale entries are revalidated with a conditional GET (If-None-Match /
+        If-Modified-Since) when validators are known, so an unchanged page costs a single
+        304 round trip. After each fetch, `changed` reports whether the content hash
+        differs from the cached one.
+
+        Connections are reused across all Scraper instances, and retries with
+        exponential backoff and jitter are handled by the client's transport.
 
         Returns:
             str: HTML content of the page if successful.
 
         Raises:
-            RequestException: If all retry attempts fail.
+            RequestException: If the request fails after all retry attempts.
 
         Logs:
-            - Info: On each fetch attempt.
-            - Warning: For failed attempts with retry.
-            - Error: If all retry attempts fail.
+            - Info: On each fetch and on each cache hit.
+            - Error: If the request fails after all retry attempts.
         """
 
-        for attempt in range(retries):
-            try:
-                logger.info(f"Fetching data from {self.url} (Attempt {attempt + 1})")
-                response = requests.get(self.url, timeout=10)
-                response.raise_for_status()  # Raise HTTPError for bad responses
-                return response.text
-            except RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < retries - 1:
-                    time.sleep(backoff_factor * (2 ** attempt))
-                else:
-                    logger.error(f"All retry attempts failed for {self.url}")
-                    raise e
+        entry = html_cache.get(self.year, self.option, self.suboption)
+        cached_html = html_cache.read_html(entry) if entry else None
+        if cached_html is None:
+            entry = None
+
+        if entry and html_cache.is_fresh(entry):
+            logger.info(f"Serving {self.url} from cache")
+            self.content_hash = entry["content_hash"]
+            self.changed = False
+            return cached_html
+
+        try:
+            logger.info(f"Fetching data from {self.url}")
+            response = http_client.get(self.url, headers=html_cache.conditional_headers(entry))
+
+            if response.status_code == 304 and entry:
+                logger.info(f"{self.url} not modified since last fetch")
+                html_cache.touch(self.year, self.option, self.suboption, entry)
+                self.content_hash = entry["content_hash"]
+                self.changed = False
+                return cached_html
+
+            response.raise_for_status()  # Raise HTTPError for bad responses
+        except RequestException as e:
+            logger.error(f"All retry attempts failed for {self.url}: {e}")
+            raise e
+
+        html = response.text
+        new_entry = html_cache.put(
+            self.year,
+            self.option,
+            self.suboption,
+            html,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self.content_hash = new_entry["content_hash"]
+        self.changed = entry is None or entry["content_hash"] != self.content_hash
+
+        return html
 
     def parse_data(self, html):
         """
@@ -135,14 +186,44 @@ class Scraper:
         """
         Perform scraping by fetching and parsing data.
 
+        Parsing is skipped when the fetched content is identical to the cached version,
+        or to the last stored content if `known_hash` is set, unless the scraper was
+        created with `force=True`.
+
+        If parsing fails, the cache entry written by the fetch is discarded, so the page is
+        fetched and parsed again by the next scrape.
+
         Returns:
-            pd.DataFrame: A DataFrame containing the scraped and parsed data, or None if scraping fails.
+            pd.DataFrame: A DataFrame containing the scraped and parsed data, or None if scraping
+            fails or the content has not changed.
 
         Logs:
             - Info: Logs the scraping process.
         """
 
         html = self.fetch_data()
-        if html:
+        if not html:
+            return None
+
+        if self.known_hash is not None:
+            self.changed = self.content_hash != self.known_hash
+
+        if not self.changed and not self.force:
+            logger.info(f"Content of {self.url} unchanged, skipping parse")
+            return None
+
+        try:
             return self.parse_data(html)
-        return None
+        except Exception:
+            self.discard_cache()
+            raise
+
+    def discard_cache(self):
+        """
+        Removes the cache entry of the page.
+
+        Must be called when the fetched content could not be parsed or stored, so the next
+        scrape does not treat the unwritten content as unchanged.
+        """
+
+        html_cache.remove(self.year, self.option, self.suboption)
@@ -44,3 +44,30 @@ class ScraperPages(Enum):
     COMMERCIALIZATION = {"option": "opt_04", "suboptions": None}
     IMPORT = {"option": "opt_05", "suboptions": ["subopt_01", "subopt_02", "subopt_03", "subopt_04", "subopt_05"]}
     EXPORT = {"option": "opt_06", "suboptions": ["subopt_01", "subopt_02", "subopt_03", "subopt_04"]}
+
+
+class ScrapeStatus(Enum):
+    """
+    Represents the outcome of scraping one (page, year, suboption) item.
+
+    Outcomes are recorded in the `scrape_state` ledger, except `SKIPPED`, which is only
+    reported for items that were not fetched because their ledger entry was still fresh.
+
+    Members:
+        STORED (str): The content was parsed and stored.
+        UNCHANGED (str): The content hash matches the last stored content, so nothing was parsed.
+        EMPTY (str): The page was fetched but holds no rows.
+        PENDING (str): The content was parsed but is not stored yet.
+        FAILED (str): Fetching, parsing or storing failed.
+        SKIPPED (str): The item was scraped recently and was not fetched.
+
+    Example:
+        ScrapeStatus.STORED.value  # Returns "stored"
+    """
+
+    STORED = "stored"
+    UNCHANGED = "unchanged"
+    EMPTY = "empty"
+    PENDING = "pending"
+    FAILED = "failed"
+    SKIPPED = "skipped"
@@ -1,11 +1,23 @@
 from .storage_enums import PageModelMapping
 from .storage_enums import ColumnKeyMapping
 from .storage_enums import SuboptionKeyMapping
+from .storage_enums import ModelKeyMapping
+from .storage_enums import SummaryKeyMapping
+from .storage_enums import ItemKeyMapping
+from .storage_enums import AggregateFunction
+from .storage_enums import AnalyticsMetric
+from .read_cache import ReadCache, read_cache, analytics_cache
+from .pool_monitor import PoolMonitor, pool_monitor
+from .snapshot_store import SnapshotStore, snapshot_store
 from services.storage.db_handler import DBHandler
+from services.storage.async_db_handler import AsyncDBHandler
 
 # Create a global instance of DBHandler
 db_handler = DBHandler()
 
+# Create a global instance of AsyncDBHandler sharing its statement builders
+async_db_handler = AsyncDBHandler(db_handler)
+
 # Dependency function
 def get_db():
     """
@@ -16,3 +28,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async dependency function
+async def get_async_db():
+    """
+    Dependency function to provide a SQLAlchemy async session.
+    """
+    async with async_db_handler.SessionLocal() as db:
+        yield db
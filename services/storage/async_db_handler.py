@@ -0,0 +1,263 @@
+import logging
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config import DATABASE_URL, ASYNC_DATABASE_URL
+
+from .pool_monitor import pool_monitor
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# Async drivers used when ASYNC_DATABASE_URL is derived from DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_url(url):
+    """
+    Derives an async connection string from a synchronous one.
+
+    Args:
+        url (str): A database connection string (e.g., "postgresql://user:password@db/viticulture").
+
+    Returns:
+        str: The same connection string using the asyncpg or aiosqlite driver.
+
+    Raises:
+        ValueError: If no async driver is known for the database backend.
+
+    Example:
+        get_async_url("postgresql://user:password@db:5432/viticulture_db")
+        # "postgresql+asyncpg://user:password@db:5432/viticulture_db"
+    """
+
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver for '{parsed.get_backend_name()}'. Set ASYNC_DATABASE_URL explicitly.")
+
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+class AsyncDBHandler:
+    """
+    An asyncio counterpart of DBHandler for the API's `async def` routes.
+
+    Queries are built by the same DBHandler statement builders and executed on an
+    `AsyncEngine` (asyncpg for PostgreSQL, aiosqlite for SQLite), so awaiting them
+    releases the event loop instead of blocking it. Writes reuse the synchronous
+    DBHandler logic through `AsyncSession.run_sync`, which keeps data versions and
+    read cache invalidation identical on both paths.
+
+    Attributes:
+        handler (DBHandler): The synchronous handler providing statement builders and write logic.
+        engine (sqlalchemy.ext.asyncio.AsyncEngine): SQLAlchemy async engine instance.
+        SessionLocal (sqlalchemy.ext.asyncio.async_sessionmaker): Factory for creating async sessions.
+
+    Methods:
+        retrieve(db: AsyncSession, model, years: list = None, limit: int = None, after_id: int = None,
+                 filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
+            Retrieves rows from the database with SQL-side filters, projection and id pagination.
+
+        aggregate(db: AsyncSession, model, group_by: list = None, functions: list = None, measures: list = None,
+                  years: list = None, filters: dict = None, year_range: tuple = None) -> list[dict]:
+            Aggregates the measure columns of a table in a single GROUP BY query.
+
+        data_version(db: AsyncSession, model, years: list = None, year_range: tuple = None) -> tuple[int, int]:
+            Returns the data version covering the given years of a table.
+
+        summary(db: AsyncSession, model, years: list = None, year_range: tuple = None,
+                categories: list = None) -> list[dict]:
+            Returns the yearly totals per category of a table from its summary rows.
+
+        store(db: AsyncSession, model, **kwargs):
+            Stores data into the database, creating or updating records.
+
+        dispose():
+            Closes the pooled connections of the async engine.
+    """
+
+    def __init__(self, handler, url=None):
+        """
+        Initializes the AsyncDBHandler by setting up the async engine and session factory.
+
+        Args:
+            handler (DBHandler): The synchronous handler to share statement builders and write logic with.
+            url (str, optional): The async connection string. Defaults to `ASYNC_DATABASE_URL`,
+                                 or to `DATABASE_URL` with its async driver.
+
+        The engine's pool is configured by the `DB_POOL_*` settings and reported as "async"
+        by `pool_monitor`.
+        """
+
+        url = url or ASYNC_DATABASE_URL or get_async_url(DATABASE_URL)
+
+        self.handler = handler
+        self.engine = create_async_engine(url, **pool_monitor.engine_options(url, "async", asynchronous=True))
+        pool_monitor.attach(self.engine.sync_engine, "async")
+        self.SessionLocal = async_sessionmaker(self.engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    async def retrieve(
+        self,
+        db: AsyncSession,
+        model,
+        years: list = None,
+        limit: int = None,
+        after_id: int = None,
+        filters: dict = None,
+        year_range: tuple = None,
+        fields: list = None,
+    ) -> list:
+        """
+        Retrieves rows from a given table, optionally filtering by years and column values.
+
+        See `DBHandler.retrieve` for the semantics of the arguments.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            years (list, optional): List of years to filter by. Defaults to None.
+            limit (int, optional): Maximum number of rows to return. Defaults to None (no limit).
+            after_id (int, optional): Only return rows with a greater `id`. Defaults to None.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            fields (list, optional): Columns to select. Defaults to None, which selects full entities.
+
+        Returns:
+            list: List of ORM instances, or of rows with the selected columns if `fields` is given.
+
+        Raises:
+            ValueError: If a filter or field does not exist in the table.
+            Exception: If an error occurs during the query.
+
+        Logs:
+            - Error: If an exception is raised during the query.
+        """
+
+        try:
+            query, projected = self.handler._retrieve_query(model, years, limit, after_id, filters, year_range, fields)
+
+            result = await db.execute(query)
+            return result.all() if projected else result.scalars().all()
+        except Exception as e:
+            logger.error(f"Error retrieving data from {model.__tablename__}: {e}")
+            raise e
+
+    async def aggregate(
+        self,
+        db: AsyncSession,
+        model,
+        group_by: list = None,
+        functions: list = None,
+        measures: list = None,
+        years: list = None,
+        filters: dict = None,
+        year_range: tuple = None,
+    ) -> list:
+        """
+        Aggregates the measure columns of a table in a single GROUP BY query.
+
+        See `DBHandler.aggregate` for the semantics of the arguments.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            group_by (list, optional): Descriptive columns to group by. Defaults to None.
+            functions (list, optional): Aggregate functions to apply. Defaults to None ("sum").
+            measures (list, optional): Numeric columns to aggregate. Defaults to None (all of them).
+            years (list, optional): List of years to filter by. Defaults to None.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+        Returns:
+            list[dict]: One dictionary per group with the group columns and the aggregated fields.
+
+        Raises:
+            ValueError: If a group column, function or measure is not supported for the table.
+            Exception: If an error occurs during the query.
+
+        Logs:
+            - Error: If an exception is raised during the query.
+        """
+
+        query = self.handler._aggregate_query(model, group_by, functions, measures, years, filters, year_range)
+
+        try:
+            return [dict(row) for row in (await db.execute(query)).mappings()]
+        except Exception as e:
+            logger.error(f"Error aggregating data from {model.__tablename__}: {e}")
+            raise e
+
+    async def data_version(self, db: AsyncSession, model, years: list = None, year_range: tuple = None) -> tuple:
+        """
+        Returns the data version covering the given years of a table.
+
+        See `DBHandler.data_version`.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session instance.
+            model (Base): SQLAlchemy model class representing the data table.
+            years (list, optional): List of years covered by the query. Defaults to None (all years).
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+        Returns:
+            tuple[int, int]: The sum of the covered versions and the number of covered years.
+        """
+
+        version, covered = (await db.execute(self.handler._data_version_query(model, years, year_range))).one()
+        return int(version), int(covered)
+
+    async def summary(
+        self, db: AsyncSession, model, years: list = None, year_range: tuple = None, categories: list = None
+    ) -> list:
+        """
+        Returns the yearly totals per category of a table from its summary rows.
+
+        See `DBHandler.summary`.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session instance.
+            model (Base): SQLAlchemy model class representing the summarized table.
+            years (list, optional): List of years to filter by. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            categories (list, optional): Categories to filter by. Defaults to None.
+
+        Returns:
+            list[dict]: One dictionary per (year, category), ordered by year and category.
+        """
+
+        result = await db.execute(self.handler._summary_query(model, years, year_range, categories))
+        return [dict(row) for row in result.mappings()]
+
+    async def store(self, db: AsyncSession, model, **kwargs):
+        """
+        Stores data into the database with an update-or-create approach.
+
+        Runs `DBHandler.store` on the session's synchronous facade, so the natural key lookup,
+        data version bump and read cache invalidation match the synchronous path while the
+        I/O is awaited on the async driver.
+
+        Args:
+            db (AsyncSession): SQLAlchemy async session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            kwargs: Column-value mappings for the model.
+
+        Returns:
+            The created or updated model instance.
+
+        Raises:
+            Exception: If an error occurs during the database transaction.
+        """
+
+        return await db.run_sync(lambda session: self.handler.store(session, model, **kwargs))
+
+    async def dispose(self):
+        """
+        Closes the pooled connections of the async engine.
+        """
+
+        await self.engine.dispose()
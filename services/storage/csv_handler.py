@@ -1 +1,214 @@
-# TODO
\ No newline at end of file
+import io
+import csv
+import sys
+import time
+import zlib
+import logging
+import argparse
+
+from config import STREAM_BATCH_SIZE
+
+from services.storage import db_handler, PageModelMapping
+from services.storage.db_handler import DBHandler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CSVHandler:
+    """
+    Exports database tables as CSV, incrementally and in constant memory.
+
+    Rows are read through `DBHandler.stream` (a server-side cursor fetching `batch_size`
+    rows per round trip) and written as one CSV chunk per batch, optionally compressed
+    as a single gzip stream. Neither the rows nor the output are ever held in full.
+
+    Attributes:
+        batch_size (int): Number of rows fetched and written per chunk.
+        compresslevel (int): The gzip compression level (1-9).
+
+    Methods:
+        iter_csv(model, years: list = None, filters: dict = None, year_range: tuple = None,
+                 fields: list = None, compress: bool = False) -> Iterator[bytes]:
+            Returns a generator of CSV (or gzip) chunks for a table.
+
+        write(model, path: str, years: list = None, filters: dict = None, year_range: tuple = None,
+              fields: list = None, compress: bool = None) -> int:
+            Writes a table to a CSV file and returns the number of bytes written.
+    """
+
+    def __init__(self, batch_size=STREAM_BATCH_SIZE, compresslevel=6):
+        """
+        Initializes the CSVHandler.
+
+        Args:
+            batch_size (int): Rows fetched and written per chunk. Defaults to `STREAM_BATCH_SIZE`.
+            compresslevel (int): The gzip compression level. Defaults to 6.
+        """
+
+        self.batch_size = batch_size
+        self.compresslevel = compresslevel
+
+    def iter_csv(self, model, years=None, filters=None, year_range=None, fields=None, compress=False):
+        """
+        Returns a generator of CSV chunks for a table.
+
+        The filters and fields are validated before the generator is returned, so invalid
+        requests fail before any output is produced. The generator opens its own session
+        and closes it once the last row is written.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the table to export.
+            years (list, optional): List of years to filter by. Defaults to None.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            fields (list, optional): Columns to export. Defaults to None (all columns).
+            compress (bool, optional): Whether to gzip the output. Defaults to False.
+
+        Returns:
+            Iterator[bytes]: The header and rows as CSV, in chunks of `batch_size` rows.
+
+        Raises:
+            ValueError: If a filter or field does not exist in the table.
+
+        Example:
+            for chunk in csv_handler.iter_csv(Export, years=[2020], compress=True):
+                output.write(chunk)
+        """
+
+        DBHandler._build_conditions(model, years, filters, year_range)
+        columns = DBHandler._build_columns(model, fields) or list(model.__table__.columns)
+
+        return self._generate(model, [column.name for column in columns], years, filters, year_range, fields, compress)
+
+    def write(self, model, path, years=None, filters=None, year_range=None, fields=None, compress=None):
+        """
+        Writes a table to a CSV file.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the table to export.
+            path (str): The output file path, or "-" for standard output.
+            years (list, optional): List of years to filter by. Defaults to None.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            fields (list, optional): Columns to export. Defaults to None (all columns).
+            compress (bool, optional): Whether to gzip the output. Defaults to None, which
+                                       compresses when `path` ends with ".gz".
+
+        Returns:
+            int: The number of bytes written.
+
+        Logs:
+            - Info: When the export completes, with its size and duration.
+        """
+
+        if compress is None:
+            compress = path.endswith(".gz")
+
+        chunks = self.iter_csv(model, years, filters, year_range, fields, compress)
+        start = time.monotonic()
+        written = 0
+
+        output = sys.stdout.buffer if path == "-" else open(path, "wb")
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+
+        logger.info(f"Exported {model.__tablename__} to {path} ({written} bytes in {time.monotonic() - start:.2f}s)")
+        return written
+
+    def _generate(self, model, names, years, filters, year_range, fields, compress):
+        """
+        Yields the CSV chunks of a table.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the table to export.
+            names (list): The exported column names, in output order.
+            years (list): List of years to filter by.
+            filters (dict): Column names mapped to accepted values.
+            year_range (tuple): Inclusive (year_from, year_to) bounds.
+            fields (list): Columns to export.
+            compress (bool): Whether to gzip the output.
+
+        Yields:
+            bytes: A chunk of CSV output, gzip-compressed if requested.
+        """
+
+        # wbits=31 produces a gzip container rather than a raw zlib stream
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 31) if compress else None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        def flush():
+            data = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            return compressor.compress(data) if compressor else data
+
+        db = db_handler.SessionLocal()
+        try:
+            writer.writerow(names)
+            pending = 0
+            rows = db_handler.stream(
+                db, model, years, batch_size=self.batch_size, filters=filters, year_range=year_range, fields=fields
+            )
+            for row in rows:
+                writer.writerow(row.values())
+                pending += 1
+                if pending >= self.batch_size:
+                    chunk = flush()
+                    if chunk:
+                        yield chunk
+                    pending = 0
+
+            chunk = flush()
+            if compressor:
+                chunk += compressor.flush()
+            if chunk:
+                yield chunk
+        finally:
+            db.close()
+
+
+# Create a global instance for the API routes and the command line
+csv_handler = CSVHandler()
+
+
+def main(argv=None):
+    """
+    Command line entry point for full or filtered CSV dumps.
+
+    Usage:
+        python -m services.storage.csv_handler EXPORT -o export.csv.gz
+        python -m services.storage.csv_handler PRODUCTION --years 2020,2021 --fields year,product,quantity
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to None (`sys.argv`).
+    """
+
+    parser = argparse.ArgumentParser(description="Export a table as CSV.")
+    parser.add_argument("page", type=str.upper, choices=[page.name for page in PageModelMapping])
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout). A .gz suffix enables gzip.")
+    parser.add_argument("--gzip", action="store_true", default=None, help="Compress the output with gzip.")
+    parser.add_argument("--years", help="Comma-separated list of years.")
+    parser.add_argument("--year-from", type=int, help="First year of the range (inclusive).")
+    parser.add_argument("--year-to", type=int, help="Last year of the range (inclusive).")
+    parser.add_argument("--fields", help="Comma-separated list of columns.")
+    args = parser.parse_args(argv)
+
+    csv_handler.write(
+        PageModelMapping[args.page].value,
+        args.output,
+        years=[int(year) for year in args.years.split(",")] if args.years else None,
+        year_range=(args.year_from, args.year_to),
+        fields=args.fields.split(",") if args.fields else None,
+        compress=args.gzip,
+    )
+
+
+if __name__ == "__main__":
+    main()
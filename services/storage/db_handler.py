@@ -1,14 +1,31 @@
+import io
+import uuid
 import logging
+import pandas as pd
 
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    create_engine, select, table, column, text, inspect, func, case, cast, literal, null, and_, or_, bindparam,
+    BigInteger, Float, String,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateColumn
 
-from config import DATABASE_URL
-from models import Base
+from config import DATABASE_URL, BULK_BATCH_SIZE, INGEST_MODE, STREAM_BATCH_SIZE, MIGRATE_DEDUPLICATE
+from models import Base, DataVersion, YearlySummary, ScrapeState
+from services.number_format import mask_placeholders, parse_integers
+
+from .storage_enums import ModelKeyMapping, AggregateFunction, PageModelMapping, SummaryKeyMapping, ItemKeyMapping
+from .read_cache import read_cache, analytics_cache
+from .snapshot_store import snapshot_store
+from .pool_monitor import pool_monitor
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Columns holding integers written with "." as the thousands separator
+NUMERIC_COLUMNS = ("quantity", "value")
+
 
 class DBHandler:
     """
@@ -21,42 +38,318 @@ class DBHandler:
 
     Methods:
         init_db():
-            Initializes the database by creating all tables.
+            Initializes the database by creating all tables, warning about tables that need a migration.
+
+        migrate(deduplicate: bool = MIGRATE_DEDUPLICATE):
+            Adds missing columns and indexes to existing tables, deduplicating rows only when confirmed.
+
+        backfill_summaries(models: list = None):
+            Removes footer rows and recomputes the yearly summaries that differ from the rows.
 
         store(db: Session, model, **kwargs):
             Stores data into the database, creating or updating records.
 
-        retrieve(db: Session, model, years: list = None) -> list:
-            Retrieves rows from the database, optionally filtered by a list of years.
+        bulk_upsert(db: Session, model, dataframe: pd.DataFrame, key_columns: list) -> int:
+            Inserts or updates a whole DataFrame in a single transaction.
+
+        copy_upsert(db: Session, model, dataframe: pd.DataFrame, key_columns: list) -> int:
+            Loads a DataFrame through PostgreSQL COPY into a staging table and merges it.
+
+        ingest(db: Session, model, dataframe: pd.DataFrame, key_columns: list) -> int:
+            Stores a DataFrame using the configured ingest mode.
+
+        retrieve(db: Session, model, years: list = None, limit: int = None, after_id: int = None,
+                 filters: dict = None, year_range: tuple = None, fields: list = None) -> list:
+            Retrieves rows from the database with SQL-side filters, projection and id pagination.
+
+        stream(db: Session, model, years: list = None, batch_size: int = STREAM_BATCH_SIZE,
+               filters: dict = None, year_range: tuple = None, fields: list = None) -> Iterator[dict]:
+            Returns a generator of rows read through a server-side cursor, validating the query first.
+
+        aggregate(db: Session, model, group_by: list = None, functions: list = None, measures: list = None,
+                  years: list = None, filters: dict = None, year_range: tuple = None) -> list[dict]:
+            Aggregates the measure columns of a table in a single GROUP BY query.
+
+        data_version(db: Session, model, years: list = None, year_range: tuple = None) -> tuple[int, int]:
+            Returns the data version covering the given years of a table.
+
+        summary(db: Session, model, years: list = None, year_range: tuple = None,
+                categories: list = None) -> list[dict]:
+            Returns the yearly totals per category of a table from its summary rows.
+
+        scrape_states(db: Session, pages: list = None, years: list = None, year_range: tuple = None) -> list[dict]:
+            Returns the entries of the scrape state ledger.
+
+        record_scrape_states(db: Session, states: list) -> int:
+            Inserts or replaces entries of the scrape state ledger.
+
+        update_scrape_state(db: Session, page: str, year: int, suboption: str, **values):
+            Updates some columns of a scrape state ledger entry.
+
+        sanitize_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+            Sanitizes a whole DataFrame before storing it into the database.
 
         sanitize_data(data: dict) -> dict:
-            Sanitizes data before storing it into the database.
+            Sanitizes a single row before storing it into the database.
     """
 
     def __init__(self):
         """
         Initializes the DBHandler by setting up the database engine and session factory.
+
+        The engine's pool is configured by the `DB_POOL_*` settings and reported as "sync"
+        by `pool_monitor`.
         """
 
-        self.engine = create_engine(DATABASE_URL)
+        self.engine = create_engine(DATABASE_URL, **pool_monitor.engine_options(DATABASE_URL, "sync"))
+        pool_monitor.attach(self.engine, "sync")
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def init_db(self):
         """
         Initializes the database by creating all tables defined in the SQLAlchemy models.
 
+        `create_all` does not alter tables that already exist, and migrating them may rewrite
+        or delete rows, so it is left to the explicit `migrate()` command
+        (`python -m services.storage.migrate`). Startup only warns about tables that need it.
+
         Logs:
             - Info: When database initialization starts and completes.
+            - Warning: For existing tables whose columns or indexes differ from the models.
         """
 
         logger.info("Initializing database...")
         Base.metadata.create_all(bind=self.engine)
+
+        inspector = inspect(self.engine)
+        outdated = [
+            model_table.name for model_table in Base.metadata.sorted_tables
+            if any(self._schema_changes(inspector, model_table))
+        ]
+        if outdated:
+            logger.warning(
+                f"Tables {outdated} differ from the models; run `python -m services.storage.migrate` to migrate them"
+            )
+
         logger.info("Database initialized.")
 
+    def migrate(self, deduplicate: bool = MIGRATE_DEDUPLICATE):
+        """
+        Adds the columns and indexes declared on the models that are missing from existing tables.
+
+        This is a one-off maintenance routine, run once per deployment with
+        `python -m services.storage.migrate` rather than by every worker on startup.
+        Missing tables are created first.
+
+        Missing columns are added with their server default, so existing rows remain valid
+        (e.g., rows stored before categories were recorded get an empty category). Indexes
+        whose columns differ from the model (e.g., a natural key extended with a new column)
+        are dropped and created again.
+
+        A missing unique index can only be created once no two rows share the same values for
+        its columns. Duplicates are only deleted, keeping the most recently inserted row (highest
+        `id`), when `deduplicate` is set; otherwise the index is not created (a changed
+        index keeps its previous columns) and the duplicates are logged, so no row is removed
+        without confirmation. Each table is migrated in its own transaction.
+
+        When the rows of a data table change (a column is added or duplicates are removed),
+        its data versions are bumped and its yearly summaries recomputed in the same transaction,
+        its cached reads, analytics and snapshots are dropped, and the scrape state ledger entries
+        of its page are removed, so the next batch scrape writes the rows again instead of skipping them.
+
+        Finally, `backfill_summaries()` removes footer rows and recomputes outdated summaries
+        of the migrated tables and of the tables holding rows but no summaries; the other
+        tables are not scanned.
+
+        Args:
+            deduplicate (bool, optional): Delete rows preventing the creation of a unique index.
+                                          Defaults to `MIGRATE_DEDUPLICATE`.
+
+        Logs:
+            - Info: For every added column, deduplication, index creation, footer removal and summary backfill.
+            - Warning: For missing columns that cannot be added to a table holding rows.
+            - Error: For unique indexes not created because of duplicate rows.
+        """
+
+        Base.metadata.create_all(bind=self.engine)
+
+        inspector = inspect(self.engine)
+        pages = {page.value.__tablename__: page for page in PageModelMapping}
+        migrated = set()
+
+        for model_table in Base.metadata.sorted_tables:
+            new_columns, missing = self._schema_changes(inspector, model_table)
+            if not new_columns and not missing:
+                continue
+
+            existing = {index["name"] for index in inspector.get_indexes(model_table.name)}
+            migrated.add(model_table.name)
+
+            with self.engine.begin() as connection:
+                has_rows = connection.execute(select(model_table.c.id).limit(1)).first() is not None
+                modified = False
+
+                quote = connection.dialect.identifier_preparer.quote
+                for new_column in new_columns:
+                    if not new_column.nullable and new_column.server_default is None:
+                        logger.warning(f"Cannot add column {new_column.name} to {model_table.name} without a server default")
+                        continue
+
+                    connection.execute(text(
+                        f"ALTER TABLE {quote(model_table.name)} "
+                        f"ADD COLUMN {CreateColumn(new_column).compile(dialect=connection.dialect)}"
+                    ))
+                    modified = modified or has_rows
+                    logger.info(f"Added column {new_column.name} to {model_table.name}")
+
+                for index in missing:
+                    duplicates = 0
+                    if index.unique and "id" in model_table.columns:
+                        keep = select(func.max(model_table.c.id)).group_by(*index.columns)
+                        duplicates = connection.execute(
+                            select(func.count()).select_from(model_table).where(model_table.c.id.not_in(keep))
+                        ).scalar()
+
+                    if duplicates and not deduplicate:
+                        logger.error(
+                            f"Not creating {index.name} on {model_table.name}: {duplicates} rows share the values of "
+                            f"{[column.name for column in index.columns]} with a newer row. Migrate with --deduplicate "
+                            f"(or MIGRATE_DEDUPLICATE=true) to delete them"
+                        )
+                        continue
+
+                    if index.name in existing:
+                        index.drop(bind=connection)
+                        logger.info(f"Dropped index {index.name} on {model_table.name}, as its columns changed")
+
+                    if duplicates:
+                        connection.execute(model_table.delete().where(model_table.c.id.not_in(keep)))
+                        modified = True
+                        logger.info(f"Removed {duplicates} duplicate rows from {model_table.name} before creating {index.name}")
+
+                    index.create(bind=connection)
+                    logger.info(f"Created index {index.name} on {model_table.name}")
+
+                page = pages.get(model_table.name)
+                if modified and page is not None:
+                    self._bump_versions(connection, page.value)
+                    self._refresh_summaries(connection, page.value)
+                    states = ScrapeState.__table__
+                    connection.execute(states.delete().where(states.c.page == page.name))
+
+            if modified and page is not None:
+                self._invalidate_reads(page.value)
+                logger.info(f"Invalidated the cached reads, analytics, snapshots and scrape states of {model_table.name}")
+
+        # Only tables whose schema changed or that were never summarized are scanned
+        models = [
+            page.value for page in PageModelMapping
+            if page.value.__tablename__ in migrated or not self._has_summaries(page.value)
+        ]
+        if models:
+            self.backfill_summaries(models)
+
+    def backfill_summaries(self, models: list = None):
+        """
+        Removes footer rows and recomputes the yearly summaries that differ from the rows.
+
+        Footer rows stored before they were skipped by the parsers (named "Total") are removed,
+        and yearly summaries that differ from the rows (e.g., written before summaries existed
+        or with another grain) are recomputed, bumping the data versions of the table if it
+        changed what was already served. This scans every row of the tables, so `migrate()`
+        only runs it on tables it altered or that hold no summaries yet; run
+        `python -m services.storage.migrate --backfill-summaries` to check every table.
+
+        Args:
+            models (list, optional): The models of the tables to check. Defaults to None (every page).
+
+        Logs:
+            - Info: For every footer removal and summary backfill.
+        """
+
+        summaries = YearlySummary.__table__
+        for model in models or [page.value for page in PageModelMapping]:
+            name = model.__table__.c[ModelKeyMapping[model.__name__][1]]
+            with self.engine.begin() as connection:
+                footers = connection.execute(model.__table__.delete().where(name == "Total")).rowcount
+                if footers:
+                    logger.info(f"Removed {footers} footer total rows from {model.__tablename__}")
+
+                stored = set(connection.execute(
+                    select(summaries.c.table_name, summaries.c.year, summaries.c.category,
+                           *[summaries.c[measure] for measure in NUMERIC_COLUMNS], summaries.c.row_count)
+                    .where(summaries.c.table_name == model.__tablename__)
+                ).all())
+                computed = set(connection.execute(self._summaries_query(model)).all())
+
+                outdated = stored != computed
+                if outdated:
+                    self._refresh_summaries(connection, model)
+                    logger.info(f"Computed the yearly summaries of {model.__tablename__}")
+                if footers or (outdated and stored):
+                    self._bump_versions(connection, model)
+
+            if footers or (outdated and stored):
+                self._invalidate_reads(model)
+
+    def _has_summaries(self, model) -> bool:
+        """
+        Checks whether a table is empty or already has yearly summaries, reading at most one row of each.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the table.
+
+        Returns:
+            bool: False if the table holds rows but no summary.
+        """
+
+        summaries = YearlySummary.__table__
+        with self.engine.connect() as connection:
+            if connection.execute(select(model.__table__.c.id).limit(1)).first() is None:
+                return True
+            return connection.execute(
+                select(summaries.c.year).where(summaries.c.table_name == model.__tablename__).limit(1)
+            ).first() is not None
+
+    @staticmethod
+    def _schema_changes(inspector, model_table) -> tuple:
+        """
+        Compares an existing table with its model.
+
+        Only the database catalog is read, never the rows.
+
+        Args:
+            inspector (sqlalchemy.engine.Inspector): Inspector of the database.
+            model_table (sqlalchemy.Table): The table declared by the model.
+
+        Returns:
+            tuple[list, list]: The model columns missing from the table and the model indexes that
+            are missing or whose columns differ. Both are empty if the table does not exist.
+        """
+
+        if not inspector.has_table(model_table.name):
+            return [], []
+
+        existing_columns = {column["name"] for column in inspector.get_columns(model_table.name)}
+        new_columns = [column for column in model_table.columns if column.name not in existing_columns]
+
+        existing = {index["name"]: index["column_names"] for index in inspector.get_indexes(model_table.name)}
+        missing = [
+            index for index in model_table.indexes
+            if existing.get(index.name) != [column.name for column in index.columns]
+        ]
+
+        return new_columns, missing
+
     def store(self, db: Session, model, **kwargs):
         """
         Stores data into the database with an update-or-create approach.
 
+        The data version of the row's year and the yearly summary of its category are updated
+        in the same transaction and, once committed, cached reads of the table that cover that
+        year are invalidated. Only the row's (year, category) summary is recomputed, so storing
+        rows one by one does not rescan the whole year on every call.
+
         Args:
             db (Session): SQLAlchemy session instance.
             model (Base): SQLAlchemy model class representing the target table.
@@ -73,8 +366,9 @@ class DBHandler:
             # Sanitize the data before processing
             sanitized_data = self.sanitize_data(kwargs)
 
-            # Build dynamic filters based on model columns
-            filters = {key: value for key, value in sanitized_data.items() if key in model.__table__.columns.keys()}
+            # Look up the existing row by its natural key, falling back to all model columns
+            key_columns = ModelKeyMapping.get(model.__name__) or model.__table__.columns.keys()
+            filters = {key: value for key, value in sanitized_data.items() if key in key_columns}
 
             # Check for an existing instance
             instance = db.query(model).filter_by(**filters).first()
@@ -89,29 +383,233 @@ class DBHandler:
                 instance = model(**sanitized_data)
                 db.add(instance)
 
+            # Bump the data version and recompute the summary of the written category in the same transaction
+            written_years = [sanitized_data["year"]] if "year" in sanitized_data else None
+            category = SummaryKeyMapping.get(model.__name__)
+            db.flush()
+            written_categories = [getattr(instance, category) or ""] if written_years and category else None
+            self._bump_versions(db, model, written_years)
+            self._refresh_summaries(db, model, written_years, written_categories)
+
             # Commit the transaction
             db.commit()
             db.refresh(instance)
 
+            # Drop cached reads and snapshots that may include the stored row
+            self._invalidate_reads(model, [instance.year] if "year" in filters else None)
+
             return instance
         except Exception as e:
             db.rollback()
             raise Exception(f"Error storing data: {e}")
 
-    def retrieve(self, db: Session, model, years: list = None) -> list:
+    def bulk_upsert(self, db: Session, model, dataframe: pd.DataFrame, key_columns: list, batch_size: int = BULK_BATCH_SIZE) -> int:
+        """
+        Inserts or updates a whole DataFrame in a single transaction.
+
+        Rows are written with `INSERT ... ON CONFLICT (key_columns) DO UPDATE`, sent in
+        batches of `batch_size` rows (executemany / multi-row VALUES), and committed once
+        (on other databases, with the fallback described in `_upsert`).
+        The conflict target must match a unique index on the table (see `ModelKeyMapping`).
+        Rows sharing the same natural key within the DataFrame are collapsed, keeping the last one,
+        and logged as an error, since they mean the key does not identify the source rows.
+        Rows stored without a category in the written partitions are replaced (see `_drop_legacy_rows`).
+        The data versions of the written years are bumped in the same transaction and, once
+        committed, cached reads of the table that cover those years are invalidated.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            dataframe (pd.DataFrame): The rows to store. Columns not in the table are ignored.
+            key_columns (list): The natural key columns used as the conflict target.
+            batch_size (int, optional): Rows per statement. Defaults to `BULK_BATCH_SIZE`.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            Exception: If an error occurs during the database transaction.
+        """
+
+        table_columns = model.__table__.columns.keys()
+        columns = [column for column in dataframe.columns if column in table_columns and column != "id"]
+
+        if dataframe.empty or not columns:
+            return 0
+
+        try:
+            records = self._to_records(
+                self._drop_duplicate_keys(model, self.sanitize_dataframe(dataframe[columns]), key_columns)
+            )
+
+            self._drop_legacy_rows(db, model, dataframe)
+            self._upsert(db, model.__table__, records, key_columns, batch_size=batch_size)
+
+            self._bump_versions(db, model, self._written_years(dataframe))
+            self._refresh_summaries(db, model, self._written_years(dataframe))
+            db.commit()
+            self._invalidate_reads(model, self._written_years(dataframe))
+
+            return len(records)
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"Error storing data: {e}")
+
+    def copy_upsert(self, db: Session, model, dataframe: pd.DataFrame, key_columns: list, batch_size: int = BULK_BATCH_SIZE) -> int:
+        """
+        Loads a DataFrame through PostgreSQL COPY into a staging table and merges it.
+
+        The sanitized rows are streamed in CSV chunks of `batch_size` rows with
+        `COPY ... FROM STDIN` into a temporary staging table (temporary tables are not
+        WAL-logged and are dropped on commit), then merged into the target table with a
+        single `INSERT ... SELECT ... ON CONFLICT (key_columns) DO UPDATE`. Duplicate natural
+        keys and rows without a category are handled as in `bulk_upsert`. The data versions
+        of the written years are bumped in the same transaction and, once committed, cached
+        reads of the table that cover those years are invalidated.
+
+        Both psycopg2 (`copy_expert`) and psycopg 3 (`cursor.copy`) are supported. On engines
+        other than PostgreSQL, or drivers without COPY support, this falls back to `bulk_upsert`.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            dataframe (pd.DataFrame): The rows to store. Columns not in the table are ignored.
+            key_columns (list): The natural key columns used as the conflict target.
+            batch_size (int, optional): Rows per COPY chunk. Defaults to `BULK_BATCH_SIZE`.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            Exception: If an error occurs during the database transaction.
+        """
+
+        if db.get_bind().dialect.name != "postgresql":
+            return self.bulk_upsert(db, model, dataframe, key_columns, batch_size=batch_size)
+
+        table_columns = model.__table__.columns.keys()
+        columns = [name for name in dataframe.columns if name in table_columns and name != "id"]
+
+        if dataframe.empty or not columns:
+            return 0
+
+        try:
+            records = self._drop_duplicate_keys(model, self.sanitize_dataframe(dataframe[columns]), key_columns)
+
+            connection = db.connection()
+            cursor = connection.connection.cursor()
+            if not hasattr(cursor, "copy_expert") and not hasattr(cursor, "copy"):
+                cursor.close()
+                return self.bulk_upsert(db, model, dataframe, key_columns, batch_size=batch_size)
+
+            quote = connection.dialect.identifier_preparer.quote
+            staging_name = f"{model.__tablename__}_staging_{uuid.uuid4().hex[:8]}"
+            column_list = ", ".join(quote(name) for name in columns)
+
+            db.execute(text(
+                f"CREATE TEMPORARY TABLE {quote(staging_name)} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {quote(model.__tablename__)} WITH NO DATA"
+            ))
+
+            copy_sql = f"COPY {quote(staging_name)} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+            try:
+                for start in range(0, len(records), batch_size):
+                    buffer = io.StringIO()
+                    records.iloc[start:start + batch_size].to_csv(buffer, index=False, header=False, na_rep="\\N")
+                    buffer.seek(0)
+                    if hasattr(cursor, "copy_expert"):
+                        # psycopg2
+                        cursor.copy_expert(copy_sql, buffer)
+                    else:
+                        # psycopg 3
+                        with cursor.copy(copy_sql) as copy:
+                            copy.write(buffer.getvalue())
+            finally:
+                cursor.close()
+
+            staging = table(staging_name, *[column(name) for name in columns])
+            statement = postgresql.insert(model.__table__).from_select(columns, select(*staging.columns))
+            update_columns = {
+                name: statement.excluded[name] for name in columns if name not in key_columns
+            }
+            if update_columns:
+                statement = statement.on_conflict_do_update(index_elements=key_columns, set_=update_columns)
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+
+            self._drop_legacy_rows(db, model, dataframe)
+            db.execute(statement)
+            self._bump_versions(db, model, self._written_years(dataframe))
+            self._refresh_summaries(db, model, self._written_years(dataframe))
+            db.commit()
+            self._invalidate_reads(model, self._written_years(dataframe))
+
+            return len(records)
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"Error storing data: {e}")
+
+    def ingest(self, db: Session, model, dataframe: pd.DataFrame, key_columns: list) -> int:
+        """
+        Stores a DataFrame using the configured ingest mode.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            dataframe (pd.DataFrame): The rows to store.
+            key_columns (list): The natural key columns used as the conflict target.
+
+        Returns:
+            int: The number of rows written.
+
+        Notes:
+            `INGEST_MODE="copy"` uses `copy_upsert` (falling back to `bulk_upsert` on
+            non-PostgreSQL engines); `INGEST_MODE="upsert"` always uses `bulk_upsert`.
         """
-        Retrieves rows from a given table, optionally filtering by years.
+
+        if INGEST_MODE == "copy":
+            return self.copy_upsert(db, model, dataframe, key_columns)
+        return self.bulk_upsert(db, model, dataframe, key_columns)
+
+    def retrieve(
+        self,
+        db: Session,
+        model,
+        years: list = None,
+        limit: int = None,
+        after_id: int = None,
+        filters: dict = None,
+        year_range: tuple = None,
+        fields: list = None,
+    ) -> list:
+        """
+        Retrieves rows from a given table, optionally filtering by years and column values.
+
+        All filters are compiled into the SQL query. When `fields` is given, only those
+        columns (plus `id`) are selected and plain rows are returned instead of ORM entities.
+
+        When `limit` is given, rows are returned in `id` order using keyset pagination:
+        only rows with an `id` greater than `after_id` are read, so every page costs the
+        same index range scan regardless of how deep it is.
 
         Args:
             db (Session): SQLAlchemy session instance.
             model (Base): SQLAlchemy model class representing the target table.
             years (list, optional): List of years to filter by. Defaults to None,
                                     which retrieves all rows.
+            limit (int, optional): Maximum number of rows to return. Defaults to None (no limit).
+            after_id (int, optional): Only return rows with a greater `id`. Defaults to None.
+            filters (dict, optional): Column names mapped to a value or list of accepted values
+                                      (e.g., {"country": ["Argentina"]}). Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds; either may be None.
+                                          Defaults to None.
+            fields (list, optional): Columns to select. Defaults to None, which selects full entities.
 
         Returns:
-            list: List of rows matching the criteria.
+            list: List of ORM instances, or of rows with the selected columns if `fields` is given.
 
         Raises:
+            ValueError: If a filter or field does not exist in the table.
             Exception: If an error occurs during the query.
 
         Logs:
@@ -119,16 +617,670 @@ class DBHandler:
         """
 
         try:
-            if years:
-                return db.query(model).filter(model.year.in_(years)).all()
-            return db.query(model).all()
+            query, projected = self._retrieve_query(model, years, limit, after_id, filters, year_range, fields)
+
+            result = db.execute(query)
+            return result.all() if projected else result.scalars().all()
         except Exception as e:
             logger.error(f"Error retrieving data from {model.__tablename__}: {e}")
             raise e
 
+    def stream(
+        self,
+        db: Session,
+        model,
+        years: list = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        filters: dict = None,
+        year_range: tuple = None,
+        fields: list = None,
+    ):
+        """
+        Yields rows from a given table one at a time, optionally filtering by years and column values.
+
+        Rows are read as plain column mappings through a server-side cursor, fetching
+        `batch_size` rows per round trip, so memory use does not grow with the table size.
+        The filters and fields are validated before the generator is returned, so invalid
+        requests fail before any row is read or sent.
+
+        Args:
+            db (Session): SQLAlchemy session instance. It must stay open while the generator is consumed.
+            model (Base): SQLAlchemy model class representing the target table.
+            years (list, optional): List of years to filter by. Defaults to None,
+                                    which streams all rows.
+            batch_size (int, optional): Rows fetched per round trip. Defaults to `STREAM_BATCH_SIZE`.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            fields (list, optional): Columns to select. Defaults to None, which selects all columns.
+
+        Returns:
+            Iterator[dict]: One row at a time as a column-value mapping, ordered by `id`.
+
+        Raises:
+            ValueError: If a filter or field does not exist in the table.
+        """
+
+        conditions = self._build_conditions(model, years, filters, year_range)
+        columns = self._build_columns(model, fields) or list(model.__table__.columns)
+        query = select(*columns).where(*conditions).order_by(model.__table__.c.id)
+
+        return self._stream_rows(db, model, query, batch_size)
+
+    @staticmethod
+    def _stream_rows(db: Session, model, query, batch_size: int):
+        """
+        Yields the rows of a query through a server-side cursor.
+
+        Args:
+            db (Session): SQLAlchemy session instance. It must stay open while the generator is consumed.
+            model (Base): SQLAlchemy model class of the queried table.
+            query (Select): The query to run.
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            dict: One row as a column-value mapping.
+
+        Raises:
+            Exception: If an error occurs during the query.
+
+        Logs:
+            - Error: If an exception is raised during the query.
+        """
+
+        try:
+            result = db.execute(query.execution_options(yield_per=batch_size))
+            for row in result.mappings():
+                yield dict(row)
+        except Exception as e:
+            logger.error(f"Error streaming data from {model.__tablename__}: {e}")
+            raise e
+
+    def aggregate(
+        self,
+        db: Session,
+        model,
+        group_by: list = None,
+        functions: list = None,
+        measures: list = None,
+        years: list = None,
+        filters: dict = None,
+        year_range: tuple = None,
+    ) -> list:
+        """
+        Aggregates the measure columns of a table in a single GROUP BY query.
+
+        Each requested function is applied to each measure and returned as a field named
+        `{function}_{measure}` (e.g., "sum_quantity"). Groups are ordered by the `group_by`
+        columns; without `group_by`, a single row with the totals of the table is returned.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the target table.
+            group_by (list, optional): Descriptive columns to group by (e.g., ["year", "country"]).
+                                       Defaults to None.
+            functions (list, optional): Names of `AggregateFunction` members' values to apply.
+                                        Defaults to None, which applies "sum".
+            measures (list, optional): Numeric columns to aggregate. Defaults to None, which
+                                       aggregates every numeric column of the table.
+            years (list, optional): List of years to filter by. Defaults to None.
+            filters (dict, optional): Column names mapped to accepted values. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+        Returns:
+            list[dict]: One dictionary per group with the group columns and the aggregated fields.
+
+        Raises:
+            ValueError: If a group column, function or measure is not supported for the table.
+            Exception: If an error occurs during the query.
+
+        Logs:
+            - Error: If an exception is raised during the query.
+
+        Example:
+            db_handler.aggregate(db, Export, group_by=["year"], functions=["sum"], measures=["value"])
+            # [{"year": 2020, "sum_value": 123456}, {"year": 2021, "sum_value": 234567}]
+        """
+
+        query = self._aggregate_query(model, group_by, functions, measures, years, filters, year_range)
+
+        try:
+            return [dict(row) for row in db.execute(query).mappings()]
+        except Exception as e:
+            logger.error(f"Error aggregating data from {model.__tablename__}: {e}")
+            raise e
+
+    def data_version(self, db: Session, model, years: list = None, year_range: tuple = None) -> tuple:
+        """
+        Returns the data version covering the given years of a table.
+
+        Versions only grow, so the sum of the per-year versions changes whenever any of the
+        covered years is written, and the number of versioned years changes when a new year
+        is written. Only the small `data_version` table is read, never the data rows.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the data table.
+            years (list, optional): List of years covered by the query. Defaults to None (all years).
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+        Returns:
+            tuple[int, int]: The sum of the covered versions and the number of covered years.
+
+        Example:
+            version, covered = db_handler.data_version(db, Export, years=[2020, 2021])
+        """
+
+        version, covered = db.execute(self._data_version_query(model, years, year_range)).one()
+        return int(version), int(covered)
+
+    def summary(self, db: Session, model, years: list = None, year_range: tuple = None, categories: list = None) -> list:
+        """
+        Returns the yearly totals per category of a table from its summary rows.
+
+        Only the `yearly_summary` table is read, so the cost depends on the number of
+        years and categories rather than on the number of rows of the table.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class representing the summarized table.
+            years (list, optional): List of years to filter by. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+            categories (list, optional): Categories to filter by. Defaults to None.
+
+        Returns:
+            list[dict]: One dictionary per (year, category), ordered by year and category.
+
+        Example:
+            db_handler.summary(db, Export, years=[2020])
+            # [{"year": 2020, "classification": "Espumantes", "quantity": 1200, "value": 9800, "rows": 31}, ...]
+        """
+
+        return [dict(row) for row in db.execute(self._summary_query(model, years, year_range, categories)).mappings()]
+
+    def scrape_states(self, db: Session, pages: list = None, years: list = None, year_range: tuple = None) -> list:
+        """
+        Returns the entries of the scrape state ledger.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            pages (list, optional): Names of the pages to return (e.g., ["EXPORT"]). Defaults to None (all pages).
+            years (list, optional): List of years to filter by. Defaults to None.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds. Defaults to None.
+
+        Returns:
+            list[dict]: One dictionary per (page, year, suboption), ordered by page, year and suboption.
+
+        Example:
+            db_handler.scrape_states(db, pages=["EXPORT"], years=[2020])
+            # [{"page": "EXPORT", "year": 2020, "suboption": "subopt_01", "status": "stored", ...}, ...]
+        """
+
+        states = ScrapeState.__table__
+        query = (
+            select(states)
+            .where(*self._build_conditions(ScrapeState, years, {"page": pages} if pages else None, year_range))
+            .order_by(states.c.page, states.c.year, states.c.suboption)
+        )
+
+        return [dict(row) for row in db.execute(query).mappings()]
+
+    def record_scrape_states(self, db: Session, states: list) -> int:
+        """
+        Inserts or replaces entries of the scrape state ledger and commits them.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            states (list): Dictionaries with the columns of `ScrapeState`.
+
+        Returns:
+            int: The number of recorded entries.
+
+        Raises:
+            Exception: If an error occurs during the database transaction.
+        """
+
+        if not states:
+            return 0
+
+        try:
+            table = ScrapeState.__table__
+            self._upsert(db, table, states, [column.name for column in table.primary_key])
+            db.commit()
+            return len(states)
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"Error recording scrape states: {e}")
+
+    def update_scrape_state(self, db: Session, page: str, year: int, suboption: str, **values):
+        """
+        Updates some columns of a scrape state ledger entry and commits them.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            page (str): The name of the scraped page.
+            year (int): The scraped year.
+            suboption (str): The scraped suboption, or "default".
+            values: Column-value mappings to update (e.g., status="stored").
+
+        Raises:
+            Exception: If an error occurs during the database transaction.
+        """
+
+        try:
+            table = ScrapeState.__table__
+            db.execute(
+                table.update()
+                .where(table.c.page == page, table.c.year == year, table.c.suboption == suboption)
+                .values(**values)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"Error updating scrape state: {e}")
+
+    def _bump_versions(self, db: Session, model, years: list = None):
+        """
+        Increments the data versions of the written years of a table.
+
+        Must be called before the write is committed, so that versions and rows change atomically.
+
+        Args:
+            db (Session): SQLAlchemy session instance holding the write transaction.
+            model (Base): SQLAlchemy model class representing the written table.
+            years (list, optional): The written years. Defaults to None, which bumps every
+                                    versioned year of the table.
+        """
+
+        versions = DataVersion.__table__
+
+        if not years:
+            db.execute(
+                versions.update()
+                .where(versions.c.table_name == model.__tablename__)
+                .values(version=versions.c.version + 1)
+            )
+            return
+
+        # Sorted to lock the version rows in the same order in concurrent transactions
+        self._upsert(
+            db,
+            versions,
+            [{"table_name": model.__tablename__, "year": year, "version": 1} for year in sorted(years)],
+            ["table_name", "year"],
+            set_={"version": versions.c.version + 1},
+        )
+
+    def _refresh_summaries(self, db: Session, model, years: list = None, categories: list = None):
+        """
+        Recomputes the yearly summaries of the written years of a table.
+
+        Must be called before the write is committed, so that summaries and rows change
+        atomically. Upserts overwrite existing rows, so the totals of each written year are
+        recomputed from its rows (read through the year index) rather than adjusted by
+        deltas; the cost is bounded by the size of the written years, not of the table.
+        Concurrent writes to the same years are serialized by the data version row locks
+        taken by `_bump_versions`.
+
+        Args:
+            db (Session): SQLAlchemy session (or connection) holding the write transaction.
+            model (Base): SQLAlchemy model class representing the written table.
+            years (list, optional): The written years. Defaults to None, which recomputes every year.
+            categories (list, optional): Only recompute these categories of the written years
+                                         (e.g., the category of a single stored row). Defaults to None.
+        """
+
+        query = self._summaries_query(model, years, categories)
+        if query is None:
+            return
+
+        summaries = YearlySummary.__table__
+        written = [summaries.c.table_name == model.__tablename__]
+        if years:
+            written.append(summaries.c.year.in_(years))
+        if categories:
+            written.append(summaries.c.category.in_(categories))
+
+        db.execute(summaries.delete().where(*written))
+        db.execute(summaries.insert().from_select(
+            ["table_name", "year", "category", *NUMERIC_COLUMNS, "row_count"], query
+        ))
+
+    @staticmethod
+    def _summaries_query(model, years: list = None, categories: list = None):
+        """
+        Builds the SELECT statement computing the yearly summaries of a table from its rows.
+
+        Rows are grouped by year and by the table's summary column (see `SummaryKeyMapping`).
+        In tables with nested rows (see `ItemKeyMapping`), only the category rows are added
+        up, as they already hold the totals of the rows nested under them; `row_count`
+        still counts every row of the group.
+
+        Args:
+            model (Base): SQLAlchemy model class of the table.
+            years (list, optional): Only summarize these years. Defaults to None (all years).
+            categories (list, optional): Only summarize these categories. Defaults to None (all categories).
+
+        Returns:
+            Select: A statement returning the table name, year, category, measure totals and
+            row count of every group, or None if the table is not summarized.
+        """
+
+        category = SummaryKeyMapping.get(model.__name__)
+        if category is None:
+            return None
+
+        table = model.__table__
+
+        # Categories are part of the summary key, so missing ones are stored as ""
+        category_column = func.coalesce(table.c[category], "")
+        selected = []
+        if years:
+            selected.append(table.c.year.in_(years))
+        if categories:
+            selected.append(category_column.in_(categories))
+
+        item = ItemKeyMapping.get(model.__name__)
+        if item is None:
+            totals = [func.sum(table.c[name]) if name in table.c else null() for name in NUMERIC_COLUMNS]
+        else:
+            is_category_row = table.c[item] == table.c.category
+            totals = [
+                func.sum(case((is_category_row, table.c[name]))) if name in table.c else null()
+                for name in NUMERIC_COLUMNS
+            ]
+
+        return (
+            select(literal(model.__tablename__, String), table.c.year, category_column, *totals, func.count())
+            .where(*selected)
+            .group_by(table.c.year, category_column)
+        )
+
+    @staticmethod
+    def _invalidate_reads(model, years=None):
+        """
+        Drops the cached reads, analytics and snapshots of a table that may include the written years.
+
+        Args:
+            model (Base): SQLAlchemy model class of the written table.
+            years (list, optional): The written years. Defaults to None (all years).
+        """
+
+        read_cache.invalidate(model.__tablename__, years)
+        analytics_cache.invalidate(model.__tablename__, years)
+        snapshot_store.invalidate(model.__tablename__, years)
+
+    @staticmethod
+    def _retrieve_query(model, years=None, limit=None, after_id=None, filters=None, year_range=None, fields=None):
+        """
+        Builds the SELECT statement of `retrieve`.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the target table.
+            years (list, optional): List of years to filter by.
+            limit (int, optional): Maximum number of rows to return.
+            after_id (int, optional): Only match rows with a greater `id`.
+            filters (dict, optional): Column names mapped to accepted values.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds.
+            fields (list, optional): Columns to select.
+
+        Returns:
+            tuple[Select, bool]: The statement and whether it selects columns rather than ORM entities.
+
+        Raises:
+            ValueError: If a filter or field does not exist in the table.
+        """
+
+        conditions = DBHandler._build_conditions(model, years, filters, year_range, after_id)
+        columns = DBHandler._build_columns(model, fields)
+
+        query = select(*columns) if columns else select(model)
+        query = query.where(*conditions)
+        if limit is not None:
+            query = query.order_by(model.id).limit(limit)
+
+        return query, bool(columns)
+
+    @staticmethod
+    def _aggregate_query(model, group_by=None, functions=None, measures=None, years=None, filters=None, year_range=None):
+        """
+        Builds the GROUP BY statement of `aggregate`.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the target table.
+            group_by (list, optional): Descriptive columns to group by.
+            functions (list, optional): Aggregate functions to apply. Defaults to "sum".
+            measures (list, optional): Numeric columns to aggregate. Defaults to all of them.
+            years (list, optional): List of years to filter by.
+            filters (dict, optional): Column names mapped to accepted values.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds.
+
+        Returns:
+            Select: The aggregation statement.
+
+        Raises:
+            ValueError: If a group column, function or measure is not supported for the table.
+        """
+
+        table = model.__table__
+        numeric = [name for name in NUMERIC_COLUMNS if name in table.c]
+        groupable = [name for name in table.columns.keys() if name != "id" and name not in numeric]
+
+        group_by = group_by or []
+        invalid = [name for name in group_by if name not in groupable]
+        if invalid:
+            raise ValueError(f"Invalid group_by: {invalid}. Must be a subset of {groupable}.")
+
+        measures = measures or numeric
+        invalid = [name for name in measures if name not in numeric]
+        if invalid:
+            raise ValueError(f"Invalid measures: {invalid}. Must be a subset of {numeric}.")
+
+        supported = [function.value for function in AggregateFunction]
+        functions = functions or [AggregateFunction.SUM.value]
+        invalid = [name for name in functions if name not in supported]
+        if invalid:
+            raise ValueError(f"Invalid functions: {invalid}. Must be a subset of {supported}.")
+
+        group_columns = [table.c[name] for name in group_by]
+        aggregates = []
+        for name in functions:
+            for measure in measures:
+                expression = getattr(func, name)(table.c[measure])
+                # SUM of a BIGINT is NUMERIC and AVG is NUMERIC on PostgreSQL; cast them to JSON-friendly types
+                if name == AggregateFunction.SUM.value:
+                    expression = cast(expression, BigInteger)
+                elif name == AggregateFunction.AVG.value:
+                    expression = cast(expression, Float)
+                aggregates.append(expression.label(f"{name}_{measure}"))
+
+        return (
+            select(*group_columns, *aggregates)
+            .where(*DBHandler._build_conditions(model, years, filters, year_range))
+            .group_by(*group_columns)
+            .order_by(*group_columns)
+        )
+
+
+    @staticmethod
+    def _data_version_query(model, years=None, year_range=None):
+        """
+        Builds the SELECT statement of `data_version`.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the data table.
+            years (list, optional): List of years covered by the query.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds.
+
+        Returns:
+            Select: A statement returning the sum of the covered versions and the number of covered years.
+        """
+
+        versions = DataVersion.__table__
+        return select(func.coalesce(func.sum(versions.c.version), 0), func.count()).where(
+            versions.c.table_name == model.__tablename__,
+            *DBHandler._build_conditions(DataVersion, years, year_range=year_range),
+        )
+
+    @staticmethod
+    def _summary_query(model, years=None, year_range=None, categories=None):
+        """
+        Builds the SELECT statement of `summary`.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the summarized table.
+            years (list, optional): List of years to filter by.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds.
+            categories (list, optional): Categories to filter by.
+
+        Returns:
+            Select: A statement returning the year, the category (named after the table's
+                    summary column), the totals and the row count of each summary row.
+
+        Raises:
+            ValueError: If the table has no summaries.
+        """
+
+        category = SummaryKeyMapping.get(model.__name__)
+        if category is None:
+            raise ValueError(f"No summaries for {model.__tablename__}.")
+
+        summaries = YearlySummary.__table__
+        measures = [summaries.c[name] for name in NUMERIC_COLUMNS if name in model.__table__.c]
+        conditions = DBHandler._build_conditions(
+            YearlySummary, years, {"category": categories} if categories else None, year_range
+        )
+
+        return (
+            select(summaries.c.year, summaries.c.category.label(category), *measures, summaries.c.row_count.label("rows"))
+            .where(summaries.c.table_name == model.__tablename__, *conditions)
+            .order_by(summaries.c.year, summaries.c.category)
+        )
+
+    @staticmethod
+    def _build_conditions(model, years=None, filters=None, year_range=None, after_id=None) -> list:
+        """
+        Compiles the retrieval filters into SQL conditions.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the target table.
+            years (list, optional): List of years to filter by.
+            filters (dict, optional): Column names mapped to a value or list of accepted values.
+            year_range (tuple, optional): Inclusive (year_from, year_to) bounds.
+            after_id (int, optional): Only match rows with a greater `id`.
+
+        Returns:
+            list: SQLAlchemy boolean expressions to combine with AND.
+
+        Raises:
+            ValueError: If a filter column does not exist in the table.
+        """
+
+        table = model.__table__
+        conditions = []
+
+        if years:
+            conditions.append(table.c.year.in_(years))
+        if year_range:
+            year_from, year_to = year_range
+            if year_from is not None:
+                conditions.append(table.c.year >= year_from)
+            if year_to is not None:
+                conditions.append(table.c.year <= year_to)
+        if after_id is not None:
+            conditions.append(table.c.id > after_id)
+
+        for name, value in (filters or {}).items():
+            if name not in table.c:
+                raise ValueError(f"Invalid filter: {name}. Not a column of {model.__tablename__}.")
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            conditions.append(table.c[name] == values[0] if len(values) == 1 else table.c[name].in_(values))
+
+        return conditions
+
+    @staticmethod
+    def _build_columns(model, fields=None) -> list:
+        """
+        Resolves a projection into table columns, always including `id`.
+
+        Args:
+            model (Base): SQLAlchemy model class representing the target table.
+            fields (list, optional): Column names to select.
+
+        Returns:
+            list: The selected columns, or an empty list if no projection was requested.
+
+        Raises:
+            ValueError: If a field does not exist in the table.
+        """
+
+        if not fields:
+            return []
+
+        table = model.__table__
+        invalid = [name for name in fields if name not in table.c]
+        if invalid:
+            raise ValueError(f"Invalid fields: {invalid}. Must be a subset of {table.columns.keys()}.")
+
+        return [table.c.id] + [table.c[name] for name in fields if name != "id"]
+
+    def sanitize_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sanitizes a whole DataFrame before storing it in the database.
+
+        The numeric columns are converted with vectorized pandas operations in a single
+        pass per column, producing nullable Int64 columns ready for bulk insertion.
+
+        Args:
+            dataframe (pd.DataFrame): The raw data to sanitize.
+
+        Returns:
+            pd.DataFrame: A sanitized copy of the DataFrame.
+
+        Sanitization Logic:
+            - Converts `quantity` and `value` from strings with "." thousand separators to Int64.
+            - Replaces the placeholders `"-"`, `"*"` and blank cells with missing values.
+            - Casts columns that are already numeric to Int64.
+            - Replaces values that cannot be parsed with missing values, logging a warning.
+
+        Example:
+            Input:
+                   quantity    value
+                0     1.234  567.890
+                1         -        *
+            Output:
+                   quantity   value
+                0      1234  567890
+                1      <NA>    <NA>
+        """
+
+        sanitized = dataframe.copy()
+
+        for column in NUMERIC_COLUMNS:
+            if column not in sanitized.columns:
+                continue
+
+            values = sanitized[column]
+
+            if pd.api.types.is_numeric_dtype(values):
+                sanitized[column] = values.round().astype("Int64")
+                continue
+
+            text = mask_placeholders(values)
+            numbers = parse_integers(text)
+
+            invalid = numbers.isna() & text.notna()
+            if invalid.any():
+                logger.warning(f"Discarding {invalid.sum()} unparseable values in column '{column}'")
+
+            sanitized[column] = numbers
+
+        return sanitized
+
     def sanitize_data(self, data: dict) -> dict:
         """
-        Sanitizes data before storing it in the database.
+        Sanitizes a single row before storing it in the database.
+
+        This is a thin wrapper around `sanitize_dataframe` for callers that store one row at a time.
 
         Args:
             data (dict): The raw data to sanitize.
@@ -136,11 +1288,6 @@ class DBHandler:
         Returns:
             dict: Sanitized data ready for database insertion.
 
-        Sanitization Logic:
-            - Converts `quantity` from a string with thousand separators to an integer.
-            - Converts `value` from a string with thousand separators to an integer.
-            - Replaces `"-"` with None for `quantity` and `value`.
-
         Example:
             Input:
                 {"quantity": "1.234", "value": "567.890"}
@@ -148,13 +1295,165 @@ class DBHandler:
                 {"quantity": 1234, "value": 567890}
         """
 
-        sanitized_data = data.copy()
+        return self._to_records(self.sanitize_dataframe(pd.DataFrame([data])))[0]
+
+    @staticmethod
+    def _upsert(db: Session, target, records: list, key_columns: list, set_: dict = None, batch_size: int = BULK_BATCH_SIZE):
+        """
+        Inserts rows, updating the existing rows with the same key instead.
+
+        On PostgreSQL and SQLite, rows are written with `INSERT ... ON CONFLICT (key_columns)`
+        in batches of `batch_size` rows. Other databases fall back to selecting the keys of each
+        batch that already exist, then updating those rows and inserting the others, within the
+        caller's transaction. The fallback is not atomic with respect to concurrent inserts of
+        the same keys, which then fail on the unique index and roll the write back.
+
+        Args:
+            db (Session): SQLAlchemy session (or connection) holding the write transaction.
+            target (Table): The table to write to. `key_columns` must match one of its unique indexes.
+            records (list): Dictionaries with the same columns, with unique keys.
+            key_columns (list): The columns identifying a row.
+            set_ (dict, optional): The values assigned to existing rows (e.g., `{"version": table.c.version + 1}`).
+                                   Defaults to None, which assigns the new values of the non-key columns.
+            batch_size (int, optional): Rows per statement. Defaults to `BULK_BATCH_SIZE`.
+        """
+
+        if not records:
+            return
+
+        dialect = db.get_bind().dialect if isinstance(db, Session) else db.dialect
+        new_columns = [name for name in records[0] if name not in key_columns]
+
+        if dialect.name in ("postgresql", "sqlite"):
+            statement = (postgresql if dialect.name == "postgresql" else sqlite).insert(target)
+            values = set_ if set_ is not None else {name: statement.excluded[name] for name in new_columns}
+            if values:
+                statement = statement.on_conflict_do_update(index_elements=key_columns, set_=values)
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+
+            for start in range(0, len(records), batch_size):
+                db.execute(statement, records[start:start + batch_size])
+            return
+
+        keys = [target.c[name] for name in key_columns]
+        update = target.update().where(*[key == bindparam(f"key_{key.name}") for key in keys])
+        update = update.values(set_ if set_ is not None else {name: bindparam(f"new_{name}") for name in new_columns})
+
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            existing = {tuple(row) for row in db.execute(
+                select(*keys).where(or_(*[and_(*[key == record[key.name] for key in keys]) for record in batch]))
+            )}
+
+            updated = [record for record in batch if tuple(record[name] for name in key_columns) in existing]
+            inserted = [record for record in batch if tuple(record[name] for name in key_columns) not in existing]
+
+            if updated and (set_ or new_columns):
+                db.execute(update, [
+                    {
+                        **{f"key_{name}": record[name] for name in key_columns},
+                        **({} if set_ is not None else {f"new_{name}": record[name] for name in new_columns}),
+                    }
+                    for record in updated
+                ])
+            if inserted:
+                db.execute(target.insert(), inserted)
+
+    @staticmethod
+    def _written_years(dataframe: pd.DataFrame) -> list:
+        """
+        Returns the distinct years of the rows being written.
+
+        Args:
+            dataframe (pd.DataFrame): The rows being written.
+
+        Returns:
+            list: The distinct years, or None if the DataFrame has no year column (every year may be affected).
+        """
+
+        if "year" not in dataframe.columns:
+            return None
+        return [int(year) for year in pd.unique(dataframe["year"].dropna())]
+
+    @staticmethod
+    def _drop_duplicate_keys(model, dataframe: pd.DataFrame, key_columns: list) -> pd.DataFrame:
+        """
+        Collapses rows sharing the same natural key, keeping the last one.
+
+        A conflict target can only be written once per statement, but duplicate keys within
+        a single page mean the key does not identify the source rows, so they are logged.
+
+        Args:
+            model (Base): SQLAlchemy model class of the rows.
+            dataframe (pd.DataFrame): The sanitized rows being written.
+            key_columns (list): The natural key columns.
+
+        Returns:
+            pd.DataFrame: The rows with unique natural keys.
+
+        Logs:
+            - Error: With the number of dropped rows and some of their keys, if any.
+        """
 
-        # Sanitize the `quantity` field
-        if "quantity" in sanitized_data and isinstance(sanitized_data["quantity"], str):
-            sanitized_data["quantity"] = int(sanitized_data["quantity"].replace(".", "")) if sanitized_data["quantity"] != "-" else None
-        # Sanitize the `value` field
-        if "value" in sanitized_data and isinstance(sanitized_data["value"], str):
-            sanitized_data["value"] = int(sanitized_data["value"].replace(".", "")) if sanitized_data["value"] != "-" else None
+        subset = [name for name in key_columns if name in dataframe.columns]
+        duplicated = dataframe.duplicated(subset=subset, keep="last")
+
+        if duplicated.any():
+            examples = dataframe.loc[duplicated, subset].head(5).to_dict("records")
+            logger.error(
+                f"Dropped {int(duplicated.sum())} rows of {model.__tablename__} sharing the natural key "
+                f"{subset} with a later row (e.g., {examples})"
+            )
+
+        return dataframe[~duplicated]
+
+    @staticmethod
+    def _drop_legacy_rows(db: Session, model, dataframe: pd.DataFrame) -> int:
+        """
+        Deletes the rows stored without a category in the partitions being written.
+
+        Rows stored before categories were recorded have an empty category, so they would not
+        conflict with the rows of the same products written with their category. The rows of the
+        written years (and classifications, if any) without a category are replaced instead.
+
+        Args:
+            db (Session): SQLAlchemy session instance.
+            model (Base): SQLAlchemy model class of the rows.
+            dataframe (pd.DataFrame): The rows being written.
+
+        Returns:
+            int: The number of deleted rows.
+        """
+
+        model_table = model.__table__
+        if "category" not in model_table.columns or "category" not in dataframe.columns or "year" not in dataframe.columns:
+            return 0
+
+        statement = model_table.delete().where(
+            model_table.c.category == "",
+            model_table.c.year.in_([int(year) for year in pd.unique(dataframe["year"].dropna())]),
+        )
+        if "classification" in model_table.columns and "classification" in dataframe.columns:
+            statement = statement.where(
+                model_table.c.classification.in_([str(value) for value in pd.unique(dataframe["classification"].dropna())])
+            )
+
+        deleted = db.execute(statement).rowcount
+        if deleted:
+            logger.info(f"Replaced {deleted} rows of {model.__tablename__} stored without a category")
+        return deleted
+
+    @staticmethod
+    def _to_records(dataframe: pd.DataFrame) -> list:
+        """
+        Converts a DataFrame into a list of dictionaries with native Python values.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to convert.
+
+        Returns:
+            list: One dictionary per row, with missing values as None.
+        """
 
-        return sanitized_data
+        return dataframe.astype(object).where(dataframe.notna(), None).to_dict("records")
@@ -0,0 +1,50 @@
+import logging
+import argparse
+
+from config import MIGRATE_DEDUPLICATE
+
+from services.storage import db_handler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the database migration.
+
+    Run it once per deployment, before starting the API on a database written by an
+    older version (see `DBHandler.migrate`).
+
+    Usage:
+        python -m services.storage.migrate
+        python -m services.storage.migrate --deduplicate
+        python -m services.storage.migrate --backfill-summaries
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to None (`sys.argv`).
+    """
+
+    parser = argparse.ArgumentParser(description="Migrate existing tables to the current models.")
+    parser.add_argument(
+        "--deduplicate",
+        action="store_true",
+        default=MIGRATE_DEDUPLICATE,
+        help="Delete rows sharing a natural key with a newer row so its unique index can be created.",
+    )
+    parser.add_argument(
+        "--backfill-summaries",
+        action="store_true",
+        help="Remove footer rows and recompute outdated yearly summaries of every table, not only the migrated ones.",
+    )
+    args = parser.parse_args(argv)
+
+    logger.info("Migrating database...")
+    db_handler.migrate(deduplicate=args.deduplicate)
+    if args.backfill_summaries:
+        db_handler.backfill_summaries()
+    logger.info("Database migrated.")
+
+
+if __name__ == "__main__":
+    main()
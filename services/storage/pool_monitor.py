@@ -0,0 +1,335 @@
+import time
+import logging
+import threading
+
+from collections import deque
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from config import (
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_TIMEOUT,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Number of recent checkouts kept to compute latency percentiles
+LATENCY_SAMPLES = 1024
+
+
+class PoolMonitor:
+    """
+    Collects connection pool telemetry for the database engines.
+
+    Engines created with `engine_options` use a pool class that times every checkout,
+    and `attach` listens to their pool events. The collected figures answer the questions needed to size
+    the pools and the worker pools drawing from them:
+
+    - Checkout latency: time spent in `Pool.connect()`, including new connections and pre-pings.
+    - Wait time: latency of the checkouts that found every connection in use.
+    - Overflow usage and the peak number of connections checked out at once.
+    - Hold time: how long connections stay checked out.
+    - Timeouts, new connections and invalidations (e.g., stale connections after a database restart).
+
+    Attributes:
+        samples (int): Number of recent checkouts kept to compute latency percentiles.
+
+    Methods:
+        engine_options(url: str, name: str, asynchronous: bool = False) -> dict:
+            Builds the configured pool and connection options of a monitored engine.
+
+        pool_class(name: str, base: type) -> type:
+            Returns a subclass of `base` that reports its checkouts under `name`.
+
+        attach(engine, name: str):
+            Listens to the pool events of an engine.
+
+        snapshot() -> dict:
+            Returns the telemetry and current state of every monitored pool.
+
+        reset():
+            Clears the collected telemetry.
+    """
+
+    def __init__(self, samples=LATENCY_SAMPLES):
+        """
+        Initializes the PoolMonitor.
+
+        Args:
+            samples (int): Number of recent checkouts kept per pool. Defaults to `LATENCY_SAMPLES`.
+        """
+
+        self.samples = samples
+        self._engines = {}
+        self._stats = {}
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+
+    def engine_options(self, url, name, asynchronous=False):
+        """
+        Builds the pool and connection options of an engine from the configuration.
+
+        The pool is sized by `DB_POOL_SIZE` and `DB_MAX_OVERFLOW`, connections are recycled
+        after `DB_POOL_RECYCLE` seconds and tested with a ping on checkout if `DB_POOL_PRE_PING`
+        is set, so connections dropped by a database restart are replaced transparently.
+        `DB_STATEMENT_TIMEOUT` is applied as a PostgreSQL session setting on every new connection.
+
+        In-memory SQLite databases keep SQLAlchemy's single-connection pool, which cannot be sized.
+
+        Args:
+            url (str): The database connection string.
+            name (str): The name the pool is reported under (e.g., "sync").
+            asynchronous (bool, optional): Whether the options are for an async engine. Defaults to False.
+
+        Returns:
+            dict: Keyword arguments for `create_engine` or `create_async_engine`.
+
+        Example:
+            engine = create_engine(DATABASE_URL, **pool_monitor.engine_options(DATABASE_URL, "sync"))
+        """
+
+        parsed = make_url(url)
+        options = {"pool_pre_ping": DB_POOL_PRE_PING, "pool_recycle": DB_POOL_RECYCLE}
+
+        if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+            return options
+
+        options.update(
+            poolclass=self.pool_class(name, AsyncAdaptedQueuePool if asynchronous else QueuePool),
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+
+        if DB_STATEMENT_TIMEOUT and parsed.get_backend_name() == "postgresql":
+            if parsed.get_driver_name() == "asyncpg":
+                options["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT)}}
+            else:
+                options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT}"}
+
+        return options
+
+    def pool_class(self, name, base):
+        """
+        Returns a subclass of a pool class that reports its checkouts.
+
+        The subclass survives `Engine.dispose()`, which recreates the pool from its class.
+        Its `connect` counts as a wait when every connection is checked out and the
+        overflow is exhausted, so the caller blocks until one is returned.
+
+        Args:
+            name (str): The name the pool is reported under (e.g., "sync").
+            base (type): The pool class to extend (e.g., `QueuePool`).
+
+        Returns:
+            type: The instrumented pool class.
+        """
+
+        monitor = self
+
+        class MonitoredPool(base):
+            def connect(self):
+                waited = self.checkedin() == 0 and self.overflow() >= self._max_overflow > -1
+                start = time.monotonic()
+                try:
+                    connection = super().connect()
+                except exc.TimeoutError:
+                    monitor._record_timeout(name, time.monotonic() - start)
+                    raise
+                monitor._record_checkout(name, time.monotonic() - start, waited, self.checkedout(), self.overflow())
+                return connection
+
+        MonitoredPool.__name__ = MonitoredPool.__qualname__ = f"Monitored{base.__name__}"
+        return MonitoredPool
+
+    def attach(self, engine, name):
+        """
+        Listens to the pool events of an engine.
+
+        Args:
+            engine (sqlalchemy.engine.Engine): The engine to monitor (`AsyncEngine.sync_engine` for async engines).
+            name (str): The name the pool is reported under.
+        """
+
+        with self._lock:
+            self._engines[name] = engine
+            self._stats[name] = self._new_stats()
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self._increment(name, "connects")
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            connection_record.info["checked_out_at"] = time.monotonic()
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            checked_out_at = connection_record.info.pop("checked_out_at", None)
+            held = time.monotonic() - checked_out_at if checked_out_at is not None else None
+            with self._lock:
+                stats = self._stats[name]
+                stats["checkins"] += 1
+                if held is not None:
+                    stats["held_total"] += held
+                    stats["held_max"] = max(stats["held_max"], held)
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self._increment(name, "invalidations")
+            logger.warning(f"Invalidated a {name} pool connection ({exception!r})")
+
+        @event.listens_for(engine, "soft_invalidate")
+        def on_soft_invalidate(dbapi_connection, connection_record, exception):
+            self._increment(name, "soft_invalidations")
+
+    def snapshot(self):
+        """
+        Returns the telemetry and current state of every monitored pool.
+
+        Returns:
+            dict: Pool names mapped to their configuration, current state, counters and
+                  checkout latency statistics in milliseconds.
+
+        Example:
+            pool_monitor.snapshot()["sync"]["checkout_ms"]["p95"]
+        """
+
+        with self._lock:
+            stats = {name: dict(values, latencies=list(values["latencies"])) for name, values in self._stats.items()}
+            engines = dict(self._engines)
+
+        return {
+            "since": self._started_at,
+            "pools": {name: self._describe(engines[name].pool, stats[name]) for name in engines},
+        }
+
+    def reset(self):
+        """
+        Clears the collected telemetry.
+        """
+
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = self._new_stats()
+            self._started_at = time.time()
+
+    def _new_stats(self):
+        return {
+            "checkouts": 0,
+            "checkins": 0,
+            "connects": 0,
+            "invalidations": 0,
+            "soft_invalidations": 0,
+            "timeouts": 0,
+            "waits": 0,
+            "checkout_total": 0.0,
+            "checkout_max": 0.0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "held_total": 0.0,
+            "held_max": 0.0,
+            "peak_checked_out": 0,
+            "peak_overflow": 0,
+            "latencies": deque(maxlen=self.samples),
+        }
+
+    def _increment(self, name, counter):
+        with self._lock:
+            self._stats[name][counter] += 1
+
+    def _record_checkout(self, name, seconds, waited, checked_out, overflow):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                return
+            stats["checkouts"] += 1
+            stats["checkout_total"] += seconds
+            stats["checkout_max"] = max(stats["checkout_max"], seconds)
+            stats["latencies"].append(seconds)
+            stats["peak_checked_out"] = max(stats["peak_checked_out"], checked_out)
+            stats["peak_overflow"] = max(stats["peak_overflow"], overflow)
+            if waited:
+                stats["waits"] += 1
+                stats["wait_total"] += seconds
+                stats["wait_max"] = max(stats["wait_max"], seconds)
+
+    def _record_timeout(self, name, seconds):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                return
+            stats["timeouts"] += 1
+            stats["wait_total"] += seconds
+            stats["wait_max"] = max(stats["wait_max"], seconds)
+
+        logger.warning(f"Timed out after {seconds:.2f}s waiting for a {name} pool connection")
+
+    @staticmethod
+    def _describe(pool, stats):
+        """
+        Formats the state and telemetry of a pool.
+
+        Args:
+            pool (sqlalchemy.pool.Pool): The current pool of the engine.
+            stats (dict): The collected telemetry of the pool.
+
+        Returns:
+            dict: The pool configuration, current state, counters and latencies in milliseconds.
+        """
+
+        def ms(seconds):
+            return round(seconds * 1000, 3)
+
+        latencies = sorted(stats["latencies"])
+
+        def percentile(fraction):
+            return ms(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]) if latencies else None
+
+        sized = isinstance(pool, QueuePool)
+        return {
+            "class": type(pool).__name__,
+            "pool_size": pool.size() if sized else None,
+            "max_overflow": pool._max_overflow if sized else None,
+            "timeout": pool.timeout() if sized else None,
+            "recycle": pool._recycle,
+            "pre_ping": pool._pre_ping,
+            "checked_out": pool.checkedout() if sized else None,
+            "checked_in": pool.checkedin() if sized else None,
+            "overflow": pool.overflow() if sized else None,
+            "peak_checked_out": stats["peak_checked_out"],
+            "peak_overflow": stats["peak_overflow"],
+            "checkouts": stats["checkouts"],
+            "checkins": stats["checkins"],
+            "connects": stats["connects"],
+            "invalidations": stats["invalidations"],
+            "soft_invalidations": stats["soft_invalidations"],
+            "timeouts": stats["timeouts"],
+            "waits": stats["waits"],
+            "checkout_ms": {
+                "mean": ms(stats["checkout_total"] / stats["checkouts"]) if stats["checkouts"] else None,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": ms(stats["checkout_max"]),
+            },
+            "wait_ms": {
+                "total": ms(stats["wait_total"]),
+                "max": ms(stats["wait_max"]),
+            },
+            "held_ms": {
+                "mean": ms(stats["held_total"] / stats["checkins"]) if stats["checkins"] else None,
+                "max": ms(stats["held_max"]),
+            },
+        }
+
+
+# Create a global instance shared by the sync and async engines
+pool_monitor = PoolMonitor()
@@ -0,0 +1,222 @@
+import time
+import logging
+import threading
+
+from collections import OrderedDict
+
+from config import READ_CACHE_TTL, READ_CACHE_MAX_BYTES, ANALYTICS_CACHE_TTL, ANALYTICS_CACHE_MAX_BYTES
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ReadCache:
+    """
+    An in-process LRU/TTL cache for encoded retrieval results.
+
+    Entries are keyed by (table name, normalized query) and remember the years their
+    query covers, so writes only invalidate the entries that may contain the written years.
+    Memory is bounded by the total size of the cached values: the least recently used
+    entries are evicted once `max_bytes` is exceeded, and values larger than the whole
+    budget are never cached.
+
+    The cache is local to the process, so `invalidate` does not see writes made by other
+    processes. The retrieval and analytics routes therefore include the ETag derived from
+    the data versions in their keys; other entries are only refreshed once they expire
+    after `ttl` seconds.
+
+    Attributes:
+        ttl (int): Number of seconds an entry is served. 0 disables the cache.
+        max_bytes (int): Maximum total size of the cached values in bytes. 0 disables the cache.
+
+    Methods:
+        get(table_name: str, key: tuple) -> bytes:
+            Returns the cached value for a query, or None.
+
+        generation(table_name: str) -> int:
+            Returns the invalidation counter of a table.
+
+        put(table_name: str, key: tuple, value: bytes, years: list = None, year_range: tuple = None,
+            generation: int = None):
+            Caches a value along with the years its query covers.
+
+        invalidate(table_name: str, years: list = None) -> int:
+            Removes the entries of a table whose queries cover any of the given years.
+
+        clear():
+            Removes all entries.
+    """
+
+    def __init__(self, ttl=READ_CACHE_TTL, max_bytes=READ_CACHE_MAX_BYTES):
+        """
+        Initializes the ReadCache.
+
+        Args:
+            ttl (int): Freshness lifetime in seconds. Defaults to `READ_CACHE_TTL`.
+            max_bytes (int): Maximum total size of the cached values. Defaults to `READ_CACHE_MAX_BYTES`.
+        """
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """
+        Returns whether the cache stores entries.
+
+        Returns:
+            bool: True if both `ttl` and `max_bytes` are positive.
+        """
+
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def get(self, table_name, key):
+        """
+        Returns the cached value for a query.
+
+        Args:
+            table_name (str): The name of the queried table.
+            key (tuple): The normalized query parameters.
+
+        Returns:
+            bytes: The cached value, or None if it is missing or expired.
+        """
+
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get((table_name, key))
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.monotonic():
+                self._remove((table_name, key))
+                return None
+            self._entries.move_to_end((table_name, key))
+            return entry["value"]
+
+    def generation(self, table_name):
+        """
+        Returns the invalidation counter of a table.
+
+        Read it before querying the database and pass it to `put`, so that a result read
+        while a write to the same table was being committed is not cached.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            int: A counter incremented by every invalidation of the table.
+        """
+
+        with self._lock:
+            return self._generations.get(table_name, 0)
+
+    def put(self, table_name, key, value, years=None, year_range=None, generation=None):
+        """
+        Caches a value along with the years its query covers.
+
+        Args:
+            table_name (str): The name of the queried table.
+            key (tuple): The normalized query parameters.
+            value (bytes): The value to cache.
+            years (list, optional): The years the query is restricted to. Defaults to None (all years).
+            year_range (tuple, optional): The inclusive (year_from, year_to) bounds of the query. Defaults to None.
+            generation (int, optional): The table's `generation` read before the query. If the table
+                                        was invalidated since, the value is not cached. Defaults to None.
+        """
+
+        if not self.enabled or len(value) > self.max_bytes:
+            return
+
+        year_from, year_to = year_range or (None, None)
+        entry = {
+            "value": value,
+            "years": frozenset(years) if years else None,
+            "year_from": year_from,
+            "year_to": year_to,
+            "expires_at": time.monotonic() + self.ttl,
+        }
+
+        with self._lock:
+            if generation is not None and generation != self._generations.get(table_name, 0):
+                return
+            if (table_name, key) in self._entries:
+                self._remove((table_name, key))
+            self._entries[(table_name, key)] = entry
+            self._size += len(value)
+
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, table_name, years=None):
+        """
+        Removes the entries of a table whose queries cover any of the given years.
+
+        Args:
+            table_name (str): The name of the written table.
+            years (list, optional): The written years. Defaults to None, which removes every entry of the table.
+
+        Returns:
+            int: The number of removed entries.
+        """
+
+        years = set(years) if years else None
+
+        with self._lock:
+            self._generations[table_name] = self._generations.get(table_name, 0) + 1
+            stale = [
+                cache_key for cache_key, entry in self._entries.items()
+                if cache_key[0] == table_name and (years is None or self._covers(entry, years))
+            ]
+            for cache_key in stale:
+                self._remove(cache_key)
+
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cached reads of {table_name}")
+
+        return len(stale)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, cache_key):
+        entry = self._entries.pop(cache_key)
+        self._size -= len(entry["value"])
+
+    @staticmethod
+    def _covers(entry, years):
+        """
+        Checks whether a cached query may include any of the given years.
+
+        Args:
+            entry (dict): A cache entry.
+            years (set): The written years.
+
+        Returns:
+            bool: True if at least one year matches both the year list and the year range of the query.
+        """
+
+        return any(
+            (entry["years"] is None or year in entry["years"])
+            and (entry["year_from"] is None or year >= entry["year_from"])
+            and (entry["year_to"] is None or year <= entry["year_to"])
+            for year in years
+        )
+
+
+# Create a global instance shared by the retrieval routes and the write paths
+read_cache = ReadCache()
+
+# Create a global instance for the analytics routes, whose results are keyed by data version
+analytics_cache = ReadCache(ttl=ANALYTICS_CACHE_TTL, max_bytes=ANALYTICS_CACHE_MAX_BYTES)
@@ -0,0 +1,194 @@
+import os
+import gzip
+import logging
+import tempfile
+
+import brotli
+
+from config import SNAPSHOT_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Supported content codings mapped to their file suffixes
+ENCODINGS = {
+    "br": ".br",
+    "gzip": ".gz",
+}
+
+# Name of the snapshot holding a whole table
+FULL_TABLE = "all"
+
+# Brotli quality of the snapshots (11 compresses full tables about 25% smaller but is ~60x slower)
+BROTLI_QUALITY = 9
+
+# Gzip compression level of the snapshots
+GZIP_LEVEL = 9
+
+
+class SnapshotStore:
+    """
+    A disk store of pre-compressed response bodies, one per (table, year) and per table.
+
+    Each snapshot is stored once per content coding (brotli and gzip) next to the ETag
+    of its body, so requests can be answered by sending the stored bytes with a
+    `Content-Encoding` header, without querying the database or encoding anything. Files are replaced atomically, and the ETag is written
+    last and removed first, so a snapshot without an ETag is never served.
+
+    The store lives on disk, so every API worker on the host shares it and sees
+    invalidations made by the others.
+
+    Attributes:
+        directory (str): The directory holding the snapshots. Empty disables the store.
+
+    Methods:
+        get(table_name: str, name: str, encoding: str) -> tuple[bytes, str]:
+            Returns the compressed body and the ETag of a snapshot, or None.
+
+        put(table_name: str, name: str, body: bytes, etag: str) -> dict:
+            Compresses and stores a body under every supported content coding.
+
+        invalidate(table_name: str, years: list = None) -> int:
+            Removes the snapshots of the given years and the full-table snapshot.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        """
+        Initializes the SnapshotStore.
+
+        Args:
+            directory (str): The snapshot directory. Defaults to `SNAPSHOT_DIR`.
+        """
+
+        self.directory = directory
+
+    @property
+    def enabled(self):
+        """
+        Returns whether the store is configured.
+
+        Returns:
+            bool: True if a snapshot directory is set.
+        """
+
+        return bool(self.directory)
+
+    def get(self, table_name, name, encoding):
+        """
+        Returns the compressed body and the ETag of a snapshot.
+
+        Args:
+            table_name (str): The name of the table.
+            name (str): The year of the snapshot, or `FULL_TABLE`.
+            encoding (str): The content coding, a key of `ENCODINGS`.
+
+        Returns:
+            tuple[bytes, str]: The compressed body and its ETag, or None if the snapshot does not exist.
+        """
+
+        if not self.enabled:
+            return None
+
+        path = self._path(table_name, name)
+        try:
+            with open(path + ".etag", "r", encoding="utf-8") as file:
+                etag = file.read()
+            with open(path + ENCODINGS[encoding], "rb") as file:
+                return file.read(), etag
+        except FileNotFoundError:
+            return None
+
+    def put(self, table_name, name, body, etag):
+        """
+        Compresses and stores a body under every supported content coding.
+
+        Args:
+            table_name (str): The name of the table.
+            name (str): The year of the snapshot, or `FULL_TABLE`.
+            body (bytes): The uncompressed response body.
+            etag (str): The ETag of the body.
+
+        Returns:
+            dict: The size in bytes of each stored encoding, and of the uncompressed body under "identity".
+        """
+
+        if not self.enabled:
+            return {}
+
+        path = self._path(table_name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        compressed = {
+            "br": brotli.compress(body, quality=BROTLI_QUALITY, mode=brotli.MODE_TEXT),
+            "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        }
+        for encoding, data in compressed.items():
+            self._write(path + ENCODINGS[encoding], data)
+        self._write(path + ".etag", etag.encode("utf-8"))
+
+        return {"identity": len(body), **{encoding: len(data) for encoding, data in compressed.items()}}
+
+    def invalidate(self, table_name, years=None):
+        """
+        Removes the snapshots of the given years and the full-table snapshot.
+
+        Args:
+            table_name (str): The name of the written table.
+            years (list, optional): The written years. Defaults to None, which removes every snapshot of the table.
+
+        Returns:
+            int: The number of removed snapshots.
+        """
+
+        if not self.enabled:
+            return 0
+
+        directory = os.path.join(self.directory, table_name)
+        if years is None:
+            entries = os.listdir(directory) if os.path.isdir(directory) else []
+            names = [entry[:-len(".json.etag")] for entry in entries if entry.endswith(".json.etag")]
+        else:
+            names = [FULL_TABLE] + [str(year) for year in sorted(set(years))]
+
+        removed = 0
+        for name in names:
+            path = self._path(table_name, name)
+            if not os.path.exists(path + ".etag"):
+                continue
+            for suffix in (".etag",) + tuple(ENCODINGS.values()):
+                try:
+                    os.remove(path + suffix)
+                except FileNotFoundError:
+                    pass
+            removed += 1
+
+        if removed:
+            logger.info(f"Invalidated {removed} snapshots of {table_name}")
+
+        return removed
+
+    def _path(self, table_name, name):
+        return os.path.join(self.directory, table_name, f"{name}.json")
+
+    @staticmethod
+    def _write(path, data):
+        """
+        Writes a file atomically, so readers see either the old or the new content.
+
+        Args:
+            path (str): The destination path.
+            data (bytes): The file content.
+        """
+
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+# Create a global instance shared by the retrieval routes and the ingest paths
+snapshot_store = SnapshotStore()
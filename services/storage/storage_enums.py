@@ -26,6 +26,47 @@ class PageModelMapping(Enum):
     IMPORT = Import
     EXPORT = Export
 
+
+class AggregateFunction(Enum):
+    """
+    Aggregate functions supported by SQL-side aggregation.
+
+    Each member's value is the name of the SQL function applied to a measure column
+    (e.g., SUM(quantity)) and the prefix of the resulting field (e.g., "sum_quantity").
+
+    Members:
+        SUM (str): Total of the non-null values.
+        AVG (str): Average of the non-null values.
+        MIN (str): Smallest value.
+        MAX (str): Largest value.
+        COUNT (str): Number of non-null values.
+    """
+
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    COUNT = "count"
+
+
+class AnalyticsMetric(Enum):
+    """
+    Derived time-series metrics computed by the analytics endpoint.
+
+    Each member's value is the name of the metric in the request and the response.
+
+    Members:
+        YOY (str): Year-over-year relative change.
+        CAGR (str): Compound annual growth rate between the first and last years with data.
+        ROLLING_MEAN (str): Trailing moving average over a window of years.
+        SHARE (str): Share of the yearly total across all entities.
+    """
+
+    YOY = "yoy"
+    CAGR = "cagr"
+    ROLLING_MEAN = "rolling_mean"
+    SHARE = "share"
+
 """
 Maps column names from scraped HTML tables to database field names.
 
@@ -44,6 +85,7 @@ Supported Keys:
     - "País": Maps to "country".
     - "Países": Maps to "country".
     - "Cultivar": Maps to "variety".
+    - "Categoria": Maps to "category" (added by the parsers of nested tables).
 """
 ColumnKeyMapping = {
     "produto": "product",
@@ -55,6 +97,7 @@ ColumnKeyMapping = {
     "países": "country",
     "cultivar": "variety",
     "sem definição": "variety",
+    "categoria": "category",
 }
 
 """
@@ -97,3 +140,73 @@ SuboptionKeyMapping = {
         "subopt_04": "Sem classificacao",
     }
 }
+
+"""
+Maps model names to the columns that form their natural key.
+
+The natural key identifies a row independently of its surrogate `id` and matches the
+unique index declared on each model. It is used as the conflict target of bulk upserts.
+Tables with nested rows include the parent category, as the same product or variety
+(e.g., "Tinto") is listed under several categories of a page.
+
+Structure:
+    - Keys: Names of models (e.g., "Import", "Production").
+    - Values: Lists of column names forming the natural key.
+
+Usage:
+    key_columns = ModelKeyMapping[model.__name__]
+    print(key_columns)  # Output: ["year", "country", "classification"] for Import
+"""
+ModelKeyMapping = {
+    "Production": ["year", "product", "category"],
+    "Processing": ["year", "variety", "classification", "category"],
+    "Commercialization": ["year", "product", "category"],
+    "Import": ["year", "country", "classification"],
+    "Export": ["year", "country", "classification"],
+}
+
+"""
+Maps model names to the column their yearly summaries are grouped by.
+
+Summaries hold the totals per (year, category) of each data table and are maintained
+by `DBHandler` on every write.
+
+Structure:
+    - Keys: Names of models (e.g., "Production", "Export").
+    - Values: The category column of the model (e.g., "category", "classification").
+
+Usage:
+    Retrieve the summary column of a model:
+        category = SummaryKeyMapping[model.__name__]
+        print(category)  # Output: "classification" for Export
+"""
+SummaryKeyMapping = {
+    "Production": "category",
+    "Processing": "classification",
+    "Commercialization": "category",
+    "Import": "classification",
+    "Export": "classification",
+}
+
+"""
+Maps the models of tables with nested rows to the column naming each row.
+
+These tables list every category (e.g., "VINHO DE MESA") followed by its products or
+varieties (e.g., "Tinto"), so a category row already holds the total of the rows nested
+under it. Rows whose name equals their category are the category rows; totals computed
+from them alone do not count the nested rows twice.
+
+Structure:
+    - Keys: Names of models with a `category` column (e.g., "Production").
+    - Values: The column naming each row (e.g., "product").
+
+Usage:
+    Select the category rows of a table:
+        name = ItemKeyMapping[model.__name__]
+        query = select(table).where(table.c[name] == table.c.category)
+"""
+ItemKeyMapping = {
+    "Production": "product",
+    "Processing": "variety",
+    "Commercialization": "product",
+}
@@ -0,0 +1,68 @@
+"""
+Shared fixtures of the test suite.
+
+The settings are pointed at a temporary SQLite database and cache directories before
+any application module reads them.
+"""
+
+import os
+import tempfile
+
+TEMP_DIR = tempfile.mkdtemp(prefix="viti-data-api-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TEMP_DIR, 'test.db')}"
+os.environ["SCRAPER_CACHE_DIR"] = os.path.join(TEMP_DIR, "html")
+os.environ["SCRAPER_RATE_LIMIT"] = "0"
+os.environ["SCRAPER_RETRIES"] = "0"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["SNAPSHOT_DIR"] = os.path.join(TEMP_DIR, "snapshots")
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+from models import Base
+from services.storage import db_handler, PageModelMapping
+from services.storage.read_cache import read_cache, analytics_cache
+from services.storage.snapshot_store import snapshot_store
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def fixture_html():
+    def read(name):
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as fixture:
+            return fixture.read()
+
+    return read
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    db_handler.init_db()
+    yield db_handler.engine
+
+
+@pytest.fixture
+def db(database):
+    with database.begin() as connection:
+        for model_table in reversed(Base.metadata.sorted_tables):
+            connection.execute(model_table.delete())
+
+    read_cache.clear()
+    analytics_cache.clear()
+    for page in PageModelMapping:
+        snapshot_store.invalidate(page.value.__tablename__)
+
+    session = db_handler.SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db):
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,68 @@
+"""
+Tests for the time-series analytics of the pages.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from api.routes.analytics import compute_metrics
+from models import Export
+from services.storage import db_handler, ModelKeyMapping
+
+
+@pytest.fixture
+def exports(db):
+    data = pd.DataFrame({
+        "year": [2019, 2020, 2021, 2019, 2021],
+        "country": ["Alemanha", "Alemanha", "Alemanha", "Angola", "Angola"],
+        "quantity": [100, 110, 121, 50, 50],
+        "value": [10, 11, 12, 5, 5],
+        "classification": "Vinhos de mesa",
+    })
+    db_handler.bulk_upsert(db, Export, data, ModelKeyMapping["Export"])
+    return data
+
+
+def test_metrics_are_computed_per_entity():
+    matrix = pd.DataFrame([[100.0, 110.0, 121.0], [0.0, 50.0, np.nan]], index=["a", "b"], columns=[2019, 2020, 2021])
+
+    result = compute_metrics(matrix, ["yoy", "cagr", "rolling_mean", "share"], window=2)
+
+    np.testing.assert_allclose(result["yoy"][0], [np.nan, 0.1, 0.1])
+    assert np.isnan(result["yoy"][1]).all()
+    np.testing.assert_allclose(result["cagr"], [0.1, np.nan])
+    np.testing.assert_allclose(result["rolling_mean"], [[100.0, 105.0, 115.5], [0.0, 25.0, 50.0]])
+    np.testing.assert_allclose(result["share"][:, 1], [110 / 160, 50 / 160])
+
+
+def test_analytics_endpoint(client, exports):
+    response = client.get("/analytics/export", params={"metrics": "yoy,cagr,share", "window": 2})
+    body = response.json()
+    series = {item["entity"]: item for item in body["series"]}
+
+    assert response.status_code == 200
+    assert body["entity"] == "country"
+    assert body["years"] == [2019, 2020, 2021]
+    assert series["Alemanha"]["yoy"][0] is None
+    assert series["Alemanha"]["yoy"][1:] == pytest.approx([0.1, 0.1])
+    assert series["Alemanha"]["cagr"] == pytest.approx(0.1)
+    assert series["Angola"]["values"] == [50.0, None, 50.0]
+    assert body["total"]["values"] == [150.0, 110.0, 171.0]
+    assert "share" not in body["total"]
+
+
+def test_analytics_filters_entities_and_years(client, exports):
+    body = client.get(
+        "/analytics/export",
+        params={"measure": "value", "entities": "Angola", "year_from": 2020, "metrics": "rolling_mean"},
+    ).json()
+
+    assert body["years"] == [2021]
+    assert [item["entity"] for item in body["series"]] == ["Angola"]
+    assert body["series"][0]["rolling_mean"] == [5.0]
+
+
+@pytest.mark.parametrize("params", [{"entity": "bogus"}, {"entity": "year"}, {"measure": "country"}, {"metrics": "bogus"}])
+def test_invalid_analytics_are_rejected(client, exports, params):
+    assert client.get("/analytics/export", params=params).status_code == 400
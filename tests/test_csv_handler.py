@@ -0,0 +1,95 @@
+"""
+Tests for the streaming CSV export.
+"""
+
+import csv
+import gzip
+import io
+
+import pytest
+from sqlalchemy import select
+
+from api.routes.scrape import translate_columns
+from models import Export
+from services.scraper import ScraperPages, ScraperParsers
+from services.storage import db_handler, ColumnKeyMapping, ModelKeyMapping
+from services.storage.csv_handler import CSVHandler, main
+
+
+@pytest.fixture
+def exports(db, fixture_html):
+    data = translate_columns(ScraperParsers.get_parser(ScraperPages.EXPORT).parse(fixture_html("export.html")), ColumnKeyMapping)
+    for year in (2020, 2021):
+        db_handler.ingest(db, Export, data.assign(year=year, classification="Vinhos de mesa"), ModelKeyMapping["Export"])
+    return len(data)
+
+
+def stored_rows(db, *columns, years=None):
+    table = Export.__table__
+    query = select(*[table.c[name] for name in columns]).order_by(table.c.id)
+    if years:
+        query = query.where(table.c.year.in_(years))
+    return [["" if value is None else str(value) for value in row] for row in db.execute(query)]
+
+
+def read_csv(content):
+    return list(csv.reader(io.StringIO(content.decode("utf-8"))))
+
+
+def test_chunks_hold_every_stored_row(db, exports):
+    chunks = list(CSVHandler(batch_size=2).iter_csv(Export))
+
+    header, *rows = read_csv(b"".join(chunks))
+    assert header == Export.__table__.columns.keys()
+    assert rows == stored_rows(db, *header)
+    assert len(chunks) == exports  # 2 years of rows, 2 rows per chunk
+
+
+def test_gzip_output_is_a_single_stream(db, exports):
+    chunks = list(CSVHandler(batch_size=2).iter_csv(Export, years=[2021], fields=["year", "quantity"], compress=True))
+
+    header, *rows = read_csv(gzip.decompress(b"".join(chunks)))
+    assert header == ["id", "year", "quantity"]
+    assert rows == stored_rows(db, *header, years=[2021])
+
+
+def test_invalid_fields_fail_before_any_output(exports):
+    with pytest.raises(ValueError):
+        CSVHandler().iter_csv(Export, fields=["bogus"])
+
+
+def test_write_compresses_gz_paths(db, exports, tmp_path):
+    path = tmp_path / "export.csv.gz"
+
+    written = CSVHandler().write(Export, str(path), filters={"country": ["Alemanha"]})
+
+    assert written == path.stat().st_size
+    assert read_csv(gzip.decompress(path.read_bytes()))[1:] == [
+        row for row in stored_rows(db, *Export.__table__.columns.keys()) if row[2] == "Alemanha"
+    ]
+
+
+def test_command_line_dump(db, exports, tmp_path, capsysbinary):
+    path = tmp_path / "export.csv.gz"
+
+    main(["export", "-o", str(path), "--years", "2020", "--fields", "year,country"])
+    main(["EXPORT", "--year-from", "2021", "--year-to", "2021", "--fields", "country"])
+
+    assert read_csv(gzip.decompress(path.read_bytes()))[1:] == stored_rows(db, "id", "year", "country", years=[2020])
+    assert read_csv(capsysbinary.readouterr().out)[1:] == stored_rows(db, "id", "country", years=[2021])
+
+
+def test_csv_route(client, db, exports):
+    response = client.get("/export-csv/export", params={"years": "2020", "gzip": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="export.csv.gz"' in response.headers["content-disposition"]
+    assert read_csv(gzip.decompress(response.content))[1:] == stored_rows(db, *Export.__table__.columns.keys(), years=[2020])
+
+
+def test_csv_route_rejects_invalid_fields(client, exports):
+    response = client.get("/export-csv/export", params={"fields": "bogus"})
+
+    assert response.status_code == 400
+    assert "bogus" in response.json()["detail"]
@@ -0,0 +1,269 @@
+"""
+Tests for the sanitization, upserts and migrations of the database handler.
+"""
+
+import logging
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from api.routes.scrape import translate_columns
+from models import Export, Production, Processing
+from services.scraper import ScraperPages, ScraperParsers
+from services.storage import db_handler, ColumnKeyMapping, ModelKeyMapping
+from services.storage import migrate as migrate_command
+from services.storage.db_handler import DBHandler
+
+
+def parse_page(page, html):
+    return translate_columns(ScraperParsers.get_parser(page).parse(html), ColumnKeyMapping)
+
+
+def stored_rows(db, model, *columns):
+    return db.execute(select(*[model.__table__.c[name] for name in columns])).all()
+
+
+def test_sanitize_dataframe_parses_numeric_columns(caplog):
+    data = pd.DataFrame({
+        "country": ["Alemanha", "Angola", "Chile", "Peru"],
+        "quantity": [" 1.234.567 ", "-", "*", "n/d"],
+        "value": [567890.0, None, 12.4, 3],
+    })
+
+    with caplog.at_level(logging.WARNING):
+        sanitized = db_handler.sanitize_dataframe(data)
+
+    assert sanitized["quantity"].dtype == sanitized["value"].dtype == "Int64"
+    assert sanitized["quantity"].tolist() == [1234567, pd.NA, pd.NA, pd.NA]
+    assert sanitized["value"].tolist() == [567890, pd.NA, 12, 3]
+    assert sanitized["country"].tolist() == data["country"].tolist()
+    assert "Discarding 1 unparseable values in column 'quantity'" in caplog.text
+    assert data["quantity"].tolist()[0] == " 1.234.567 "
+
+
+def test_products_under_several_categories_are_all_kept(db, fixture_html):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+
+    written = db_handler.bulk_upsert(db, Production, data, ModelKeyMapping["Production"])
+
+    rows = stored_rows(db, Production, "category", "product", "quantity")
+    assert written == len(data) == len(rows)
+    assert ("VINHO DE MESA", "Tinto", 139320884) in rows
+    assert ("VINHO FINO DE MESA (VINIFERA)", "Tinto", 23674365) in rows
+
+
+def test_upsert_updates_rows_in_place(db, fixture_html):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+    db_handler.bulk_upsert(db, Production, data, ModelKeyMapping["Production"])
+    ids = dict(((category, product), row_id) for row_id, category, product in stored_rows(db, Production, "id", "category", "product"))
+
+    updated = data.assign(quantity=data["quantity"].fillna(0) + 1)
+    db_handler.bulk_upsert(db, Production, updated, ModelKeyMapping["Production"])
+
+    rows = stored_rows(db, Production, "id", "category", "product", "quantity")
+    assert len(rows) == len(data)
+    assert all(ids[(category, product)] == row_id for row_id, category, product, _ in rows)
+    assert ("VINHO FINO DE MESA (VINIFERA)", "Branco") in {(category, product) for _, category, product, quantity in rows if quantity == 1}
+
+
+def test_processing_varieties_keep_their_category(db, fixture_html):
+    data = parse_page(ScraperPages.PROCESSING, fixture_html("processing.html"))
+
+    db_handler.bulk_upsert(db, Processing, data.assign(year=2020, classification="Viniferas"), ModelKeyMapping["Processing"])
+
+    rows = stored_rows(db, Processing, "category", "variety")
+    assert ("TINTAS", "Alicante Bouschet") in rows
+    assert ("BRANCAS E ROSADAS", "Moscato Giallo") in rows
+
+
+def test_summaries_add_up_category_rows(db, fixture_html):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+
+    db_handler.ingest(db, Production, data, ModelKeyMapping["Production"])
+
+    assert db_handler.summary(db, Production, years=[2020]) == [
+        {"year": 2020, "category": "VINHO DE MESA", "quantity": 169762429, "rows": 4},
+        {"year": 2020, "category": "VINHO FINO DE MESA (VINIFERA)", "quantity": 46268556, "rows": 4},
+    ]
+
+
+def test_store_refreshes_the_summary_of_its_category(db, fixture_html):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+    db_handler.ingest(db, Production, data, ModelKeyMapping["Production"])
+
+    db_handler.store(db, Production, year=2020, category="VINHO DE MESA", product="VINHO DE MESA", quantity=1)
+    db_handler.store(db, Production, year=2020, category="ESPUMANTES", product="ESPUMANTES", quantity=2)
+
+    totals = {row["category"]: (row["quantity"], row["rows"]) for row in db_handler.summary(db, Production, years=[2020])}
+    assert totals == {
+        "VINHO DE MESA": (1, 4),
+        "VINHO FINO DE MESA (VINIFERA)": (46268556, 4),
+        "ESPUMANTES": (2, 1),
+    }
+
+
+def test_duplicate_natural_keys_are_logged(db, caplog):
+    data = pd.DataFrame({
+        "year": [2020, 2020],
+        "category": ["VINHO DE MESA", "VINHO DE MESA"],
+        "product": ["Tinto", "Tinto"],
+        "quantity": [1, 2],
+    })
+
+    with caplog.at_level(logging.ERROR):
+        written = db_handler.bulk_upsert(db, Production, data, ModelKeyMapping["Production"])
+
+    assert written == 1
+    assert stored_rows(db, Production, "quantity") == [(2,)]
+    assert "Dropped 1 rows of production" in caplog.text
+
+
+@pytest.fixture
+def legacy_handler(tmp_path):
+    """A handler bound to a database written before categories were recorded."""
+
+    handler = DBHandler()
+    handler.engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    handler.SessionLocal.configure(bind=handler.engine)
+
+    with handler.engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE production (id INTEGER PRIMARY KEY AUTOINCREMENT, year INTEGER NOT NULL, "
+            "product VARCHAR NOT NULL, quantity BIGINT)"
+        ))
+        connection.execute(text("CREATE UNIQUE INDEX uq_production_natural_key ON production (year, product)"))
+        connection.execute(text(
+            "INSERT INTO production (year, product, quantity) VALUES (2020, 'Tinto', 5), (2021, 'Tinto', 7), (2021, 'Total', 7)"
+        ))
+        connection.execute(text("CREATE TABLE export (id INTEGER PRIMARY KEY AUTOINCREMENT, year INTEGER NOT NULL, "
+                                "country VARCHAR NOT NULL, quantity BIGINT, value BIGINT, classification VARCHAR NOT NULL)"))
+        connection.execute(text(
+            "INSERT INTO export (year, country, quantity, value, classification) VALUES "
+            "(2020, 'Alemanha', 1, 1, 'Vinhos de mesa'), (2020, 'Alemanha', 2, 2, 'Vinhos de mesa')"
+        ))
+
+    return handler
+
+
+def test_startup_does_not_migrate(legacy_handler, caplog):
+    with caplog.at_level(logging.WARNING):
+        legacy_handler.init_db()
+
+    columns = {column["name"] for column in inspect(legacy_handler.engine).get_columns("production")}
+    with legacy_handler.SessionLocal() as session:
+        assert len(stored_rows(session, Export, "id")) == 2
+    assert "category" not in columns
+    assert "services.storage.migrate" in caplog.text
+
+
+def test_migrate_extends_the_natural_key(legacy_handler, fixture_html):
+    legacy_handler.migrate()
+
+    with legacy_handler.SessionLocal() as session:
+        assert (2021, "Total") not in stored_rows(session, Production, "year", "product")
+
+    indexes = {index["name"]: index["column_names"] for index in inspect(legacy_handler.engine).get_indexes("production")}
+    assert indexes["uq_production_natural_key"] == ["year", "product", "category"]
+
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+    with legacy_handler.SessionLocal() as session:
+        legacy_handler.bulk_upsert(session, Production, data, ModelKeyMapping["Production"])
+        rows = stored_rows(session, Production, "year", "category", "product")
+
+    # The legacy rows of the written year are replaced, the others are kept
+    assert (2020, "", "Tinto") not in rows
+    assert (2021, "", "Tinto") in rows
+    assert len(rows) == len(data) + 1
+
+
+def test_migrate_keeps_duplicates_without_confirmation(legacy_handler, caplog):
+    with caplog.at_level(logging.ERROR):
+        legacy_handler.migrate()
+
+    indexes = {index["name"] for index in inspect(legacy_handler.engine).get_indexes("export")}
+    with legacy_handler.SessionLocal() as session:
+        assert len(stored_rows(session, Export, "id")) == 2
+    assert "uq_export_natural_key" not in indexes
+    assert "--deduplicate" in caplog.text
+
+
+def test_migrate_invalidates_deduplicated_tables(legacy_handler, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(DBHandler, "_invalidate_reads", staticmethod(lambda model, years=None: invalidated.append(model)))
+
+    with legacy_handler.engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE data_version (table_name VARCHAR NOT NULL, year INTEGER NOT NULL, "
+            "version BIGINT NOT NULL, PRIMARY KEY (table_name, year))"
+        ))
+        connection.execute(text("INSERT INTO data_version VALUES ('export', 2020, 3)"))
+
+    legacy_handler.migrate(deduplicate=True)
+
+    with legacy_handler.SessionLocal() as session:
+        assert stored_rows(session, Export, "quantity") == [(2,)]
+        assert session.execute(text("SELECT version FROM data_version WHERE table_name = 'export'")).scalar() == 4
+        assert session.execute(text("SELECT row_count FROM yearly_summary WHERE table_name = 'export'")).scalar() == 1
+    assert {Export, Production} <= set(invalidated)
+
+
+def test_migration_command(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db_handler, "migrate", lambda deduplicate: calls.append(("migrate", deduplicate)))
+    monkeypatch.setattr(db_handler, "backfill_summaries", lambda: calls.append(("backfill_summaries",)))
+
+    migrate_command.main([])
+    migrate_command.main(["--deduplicate", "--backfill-summaries"])
+
+    assert calls == [("migrate", False), ("migrate", True), ("backfill_summaries",)]
+
+
+def test_migrate_only_scans_unsummarized_tables(db, fixture_html, monkeypatch):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+    db_handler.ingest(db, Production, data, ModelKeyMapping["Production"])
+    with db_handler.engine.begin() as connection:
+        connection.execute(text("INSERT INTO export (year, country, quantity, value, classification) "
+                                "VALUES (2020, 'Alemanha', 1, 1, 'Vinhos de mesa')"))
+    scanned = []
+    summaries_query = DBHandler._summaries_query
+
+    def recording_query(model, years=None, categories=None):
+        scanned.append(model)
+        return summaries_query(model, years, categories)
+
+    monkeypatch.setattr(DBHandler, "_summaries_query", staticmethod(recording_query))
+
+    db_handler.migrate()
+    assert set(scanned) == {Export}
+
+    scanned.clear()
+    db_handler.migrate()
+    assert scanned == []
+
+    assert db_handler.summary(db, Export) == [
+        {"year": 2020, "classification": "Vinhos de mesa", "quantity": 1, "value": 1, "rows": 1}
+    ]
+
+
+def test_upsert_falls_back_on_other_dialects(db, fixture_html, monkeypatch):
+    data = parse_page(ScraperPages.PRODUCTION, fixture_html("production.html")).assign(year=2020)
+    db_handler.ingest(db, Production, data, ModelKeyMapping["Production"])
+    versions = db.execute(text("SELECT version FROM data_version WHERE table_name = 'production'")).scalar()
+
+    monkeypatch.setattr(db_handler.engine.dialect, "name", "generic")
+    updated = pd.concat([data.assign(quantity=1), data.head(1).assign(year=2021)])
+    db_handler.bulk_upsert(db, Production, updated, ModelKeyMapping["Production"])
+    db_handler.store(db, Production, year=2022, category="ESPUMANTES", product="ESPUMANTES", quantity=3)
+    db_handler.record_scrape_states(db, [{
+        "page": "PRODUCTION", "year": 2020, "suboption": "default", "row_count": 8,
+        "fetched_at": pd.Timestamp("2024-01-01", tz="UTC").to_pydatetime(), "status": "stored",
+    }])
+    monkeypatch.undo()
+
+    rows = stored_rows(db, Production, "year", "quantity")
+    assert len(rows) == len(data) + 2
+    assert {quantity for year, quantity in rows if year == 2020} == {1}
+    assert db.execute(text("SELECT version FROM data_version WHERE table_name = 'production' AND year = 2020")).scalar() == versions + 1
+    assert db.execute(text("SELECT version FROM data_version WHERE table_name = 'production' AND year = 2022")).scalar() == 1
+    assert db_handler.scrape_states(db, pages=["PRODUCTION"])[0]["row_count"] == 8
@@ -0,0 +1,77 @@
+"""
+Tests for the conditional requests backed by the per-year data versions.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from api.routes.scrape import translate_columns
+from models import Export
+from services.scraper import ScraperPages, ScraperParsers
+from services.storage import db_handler, ColumnKeyMapping, ModelKeyMapping
+
+
+@pytest.fixture
+def exports(db, fixture_html):
+    data = translate_columns(ScraperParsers.get_parser(ScraperPages.EXPORT).parse(fixture_html("export.html")), ColumnKeyMapping)
+    for year in (2020, 2021):
+        db_handler.ingest(db, Export, data.assign(year=year, classification="Vinhos de mesa"), ModelKeyMapping["Export"])
+    return data
+
+
+def store_export(db, year, quantity):
+    db_handler.store(db, Export, year=year, country="Alemanha", classification="Vinhos de mesa", quantity=str(quantity), value="1")
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/export", {"years": "2020", "country": "Alemanha"}),
+    ("/summary/export", {"years": "2020"}),
+    ("/aggregate", {"page": "export", "group_by": "year", "years": "2020"}),
+    ("/analytics/export", {"year_from": 2020, "year_to": 2020}),
+])
+def test_unchanged_years_answer_304(client, db, exports, path, params):
+    first = client.get(path, params=params)
+    etag = first.headers["ETag"]
+
+    assert first.status_code == 200
+    assert client.get(path, params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    # Writes to other years keep the ETag
+    store_export(db, 2021, 5)
+    assert client.get(path, params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    store_export(db, 2020, 5)
+    changed = client.get(path, params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_etag_depends_on_the_query(client, exports):
+    first = client.get("/export", params={"years": "2020"}).headers["ETag"]
+    projected = client.get("/export", params={"years": "2020", "fields": "year"}).headers["ETag"]
+
+    assert first != projected
+    assert client.get("/export", params={"years": "2020", "fields": "year"}, headers={"If-None-Match": first}).status_code == 200
+
+
+def test_weak_and_listed_etags_match(client, exports):
+    etag = client.get("/export", params={"years": "2021"}).headers["ETag"]
+
+    assert client.get("/export", params={"years": "2021"}, headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/export", params={"years": "2021"}, headers={"If-None-Match": "*"}).status_code == 304
+
+
+def test_writes_of_other_processes_are_not_served_from_the_read_cache(client, db, exports):
+    params = {"years": "2020", "country": "Alemanha", "fields": "quantity"}
+    first = client.get("/export", params=params)
+
+    # Another process writes the row: the data version changes but this process' read cache is not invalidated
+    with db_handler.engine.begin() as connection:
+        connection.execute(text("UPDATE export SET quantity = 5 WHERE year = 2020 AND country = 'Alemanha'"))
+        connection.execute(text("UPDATE data_version SET version = version + 1 WHERE table_name = 'export' AND year = 2020"))
+
+    second = client.get("/export", params=params)
+
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert [row["quantity"] for row in first.json()["data"]] != [5]
+    assert [row["quantity"] for row in second.json()["data"]] == [5]
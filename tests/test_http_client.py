@@ -0,0 +1,71 @@
+"""
+Tests for the rate limiting of the shared HTTP client.
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.scraper import HTTPClient, RateLimiter
+
+
+class RecordingRateLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(rate=0)
+        self.urls = []
+
+    def wait(self, url):
+        self.urls.append(url)
+
+
+@pytest.fixture
+def flaky_server():
+    attempts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            attempts.append(self.path)
+            status = 503 if len(attempts) < 3 else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/index.php", attempts
+    server.shutdown()
+
+
+def test_every_retry_attempt_is_rate_limited(flaky_server):
+    url, attempts = flaky_server
+    client = HTTPClient(retries=3, backoff_factor=0, backoff_jitter=0)
+    client.rate_limiter = limiter = RecordingRateLimiter()
+
+    try:
+        response = client.get(url)
+    finally:
+        client.close()
+
+    assert response.status_code == 200
+    assert len(attempts) == 3
+    assert len(limiter.urls) == 3
+    assert limiter.urls[1:] == ["http://127.0.0.1", "http://127.0.0.1"]
+
+
+def test_rate_limiter_spaces_requests_per_host(monkeypatch):
+    limiter = RateLimiter(rate=2)
+    sleeps = []
+    monkeypatch.setattr(sys.modules["services.scraper.http_client"].time, "sleep", sleeps.append)
+
+    limiter.wait("http://example.org/a")
+    limiter.wait("http://example.org:80/b")
+    limiter.wait("http://example.com/a")
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
@@ -0,0 +1,100 @@
+"""
+Tests for the background scrape jobs.
+
+The scraper serves the page fixtures instead of fetching the Embrapa site.
+"""
+
+import time
+
+import pytest
+
+from models import Production
+from services.jobs import JobManager, JobStatus
+from services.scraper import HTMLCache, Scraper, ScraperPages
+
+
+@pytest.fixture
+def stub_scraper(monkeypatch, fixture_html):
+    def fetch_data(self):
+        if self.page == ScraperPages.COMMERCIALIZATION:
+            raise ConnectionError("Embrapa is unavailable.")
+        html = fixture_html(f"{self.page.name.lower()}.html")
+        self.content_hash = HTMLCache.content_hash(html)
+        self.changed = True
+        return html
+
+    monkeypatch.setattr(Scraper, "fetch_data", fetch_data)
+
+
+def wait_for(client, response, timeout=10):
+    assert response.status_code == 202
+    status_url = response.json()["status_url"]
+
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(status_url).json()["job"]
+        if job["status"] in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value) or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def test_scrape_job_reports_its_stored_rows(stub_scraper, client, db):
+    job = wait_for(client, client.post("/scrape?year=2020&page=production"))
+
+    assert job["status"] == "succeeded"
+    assert job["kind"] == "scrape"
+    assert job["params"] == {"year": 2020, "page": "PRODUCTION", "force": False}
+    assert job["rows"] == db.query(Production).filter(Production.year == 2020).count() > 0
+    assert job["result"]["suboptions"] == {"default": job["rows"]}
+    assert job["run_seconds"] is not None
+
+
+def test_batch_job_reports_every_item(stub_scraper, client, db):
+    job = wait_for(client, client.post("/scrape/batch?year_from=2020&year_to=2021&pages=production,commercialization"))
+
+    assert job["status"] == "succeeded"
+    items = {(item["page"], item["year"]): item for item in job["result"]["items"]}
+    assert {key: item["status"] for key, item in items.items()} == {
+        ("PRODUCTION", 2020): "stored",
+        ("PRODUCTION", 2021): "stored",
+        ("COMMERCIALIZATION", 2020): "failed",
+        ("COMMERCIALIZATION", 2021): "failed",
+    }
+    assert items[("COMMERCIALIZATION", 2020)]["error"] == "Embrapa is unavailable."
+    assert job["rows"] == db.query(Production).count()
+
+
+def test_failed_fetches_are_left_out_of_the_job(stub_scraper, client):
+    job = wait_for(client, client.post("/scrape?year=2020&page=commercialization"))
+
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"suboptions": {}, "rows": 0}
+
+
+def test_failing_job_reports_its_error():
+    def fail():
+        raise RuntimeError("Database unavailable.")
+
+    manager = JobManager(max_workers=1)
+    job = manager.submit("test", {}, fail)
+    manager.executor.shutdown(wait=True)
+
+    assert job.status == JobStatus.FAILED
+    assert job.to_dict()["error"] == "Database unavailable."
+    assert job.rows == 0
+    assert job.finished_at >= job.started_at
+
+
+def test_invalid_jobs_are_rejected(client):
+    assert client.post("/scrape?year=2020&page=unknown").status_code == 400
+    assert client.post("/scrape/batch?year_from=2021&year_to=2020").status_code == 400
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_job_history_is_bounded():
+    manager = JobManager(max_workers=1, history_size=2)
+    jobs = [manager.submit("test", {"index": index}, lambda index=index: {"rows": index}) for index in range(3)]
+    manager.executor.shutdown(wait=True)
+
+    assert manager.get(jobs[0].id) is None
+    assert [manager.get(job.id).rows for job in jobs[1:]] == [1, 2]
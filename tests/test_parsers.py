@@ -0,0 +1,109 @@
+"""
+Parity tests between the lxml and BeautifulSoup parsing engines.
+
+The fixtures under `tests/fixtures` reproduce the table layout of each Embrapa page.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from services.scraper import ScraperPages, ScraperParsers
+from services.scraper.parsers import BaseParser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+PAGE_FIXTURES = {
+    ScraperPages.PRODUCTION: "production.html",
+    ScraperPages.PROCESSING: "processing.html",
+    ScraperPages.COMMERCIALIZATION: "commercialization.html",
+    ScraperPages.IMPORT: "import.html",
+    ScraperPages.EXPORT: "export.html",
+}
+
+# A table without a header row, which the lxml engine does not handle
+HEADERLESS_TABLE = """
+<table class="tb_base tb_dados">
+<tr><td>Alemanha</td><td>26.415</td></tr>
+<tr><td>Angola</td><td>-</td></tr>
+</table>
+"""
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as fixture:
+        return fixture.read()
+
+
+@pytest.mark.parametrize("page", list(PAGE_FIXTURES), ids=lambda page: page.name)
+def test_engines_return_identical_frames(page):
+    html = read_fixture(PAGE_FIXTURES[page])
+    parser = ScraperParsers.get_parser(page)
+
+    lxml_frame = parser.parse_lxml(html)
+    bs4_frame = parser.parse_bs4(html)
+
+    assert lxml_frame is not None
+    pd.testing.assert_frame_equal(lxml_frame, bs4_frame)
+
+
+@pytest.mark.parametrize("page", list(PAGE_FIXTURES), ids=lambda page: page.name)
+def test_numeric_columns_are_typed(page):
+    frame = ScraperParsers.get_parser(page).parse(read_fixture(PAGE_FIXTURES[page]))
+
+    numeric = [name for name in frame.columns if name.lower().startswith(("quantidade", "valor"))]
+    assert numeric
+    for name in numeric:
+        assert frame[name].dtype == "Int64"
+
+
+def test_placeholders_and_thousands_separators():
+    frame = BaseParser().parse(read_fixture("export.html"))
+
+    assert frame["Quantidade (Kg)"].tolist()[:3] == [pd.NA, 26415, 100]
+    assert frame["Países"].tolist()[:3] == ["Afeganistão", "Alemanha", "Angola"]
+
+
+def test_whitespace_is_normalized():
+    frame = BaseParser().parse(read_fixture("commercialization.html"))
+
+    assert "Tinto" in frame["Produto"].tolist()
+
+
+def test_unsupported_layout_falls_back_to_bs4():
+    parser = BaseParser(engine="lxml")
+
+    assert parser.parse_lxml(HEADERLESS_TABLE) is None
+    pd.testing.assert_frame_equal(parser.parse(HEADERLESS_TABLE), parser.parse_bs4(HEADERLESS_TABLE))
+    pd.testing.assert_frame_equal(parser.parse(HEADERLESS_TABLE), BaseParser(engine="bs4").parse(HEADERLESS_TABLE))
+
+
+def test_missing_table_raises():
+    for engine in ("lxml", "bs4"):
+        with pytest.raises(ValueError):
+            BaseParser(engine=engine).parse("<html><body><table class='other'></table></body></html>")
+
+
+@pytest.mark.parametrize("engine", ["lxml", "bs4"])
+def test_nested_rows_carry_their_category(engine):
+    parser = ScraperParsers.get_parser(ScraperPages.PRODUCTION)
+    parser.engine = engine
+
+    frame = parser.parse(read_fixture("production.html"))
+
+    assert frame.loc[frame["Produto"] == "Tinto", "Categoria"].tolist() == [
+        "VINHO DE MESA", "VINHO FINO DE MESA (VINIFERA)"
+    ]
+    assert frame.loc[frame["Produto"] == "VINHO DE MESA", "Categoria"].tolist() == ["VINHO DE MESA"]
+
+
+@pytest.mark.parametrize("engine", ["lxml", "bs4"])
+@pytest.mark.parametrize("page", list(PAGE_FIXTURES), ids=lambda page: page.name)
+def test_footer_total_is_skipped(page, engine):
+    parser = ScraperParsers.get_parser(page)
+    parser.engine = engine
+
+    frame = parser.parse(read_fixture(PAGE_FIXTURES[page]))
+
+    assert "Total" not in frame.iloc[:, 0].tolist()
@@ -0,0 +1,106 @@
+"""
+Tests for the connection pool telemetry.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from services.storage import PoolMonitor
+
+
+@pytest.fixture
+def monitored(tmp_path):
+    monitor = PoolMonitor()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=monitor.pool_class("test", QueuePool),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    monitor.attach(engine, "test")
+    yield monitor, engine
+    engine.dispose()
+
+
+def test_checkouts_are_counted(monitored):
+    monitor, engine = monitored
+
+    for _ in range(2):
+        with engine.connect():
+            time.sleep(0.01)
+
+    stats = monitor.snapshot()["pools"]["test"]
+    assert stats["class"] == "MonitoredQueuePool"
+    assert (stats["pool_size"], stats["max_overflow"], stats["checked_out"]) == (1, 0, 0)
+    assert (stats["checkouts"], stats["checkins"], stats["connects"]) == (2, 2, 1)
+    assert stats["peak_checked_out"] == 1
+    assert stats["waits"] == stats["timeouts"] == 0
+    assert stats["held_ms"]["max"] >= 10
+
+
+def test_checkouts_of_an_exhausted_pool_wait(monitored):
+    monitor, engine = monitored
+    checked_out = threading.Event()
+
+    def hold():
+        with engine.connect():
+            checked_out.set()
+            time.sleep(0.1)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    checked_out.wait()
+    with engine.connect():
+        pass
+    holder.join()
+
+    stats = monitor.snapshot()["pools"]["test"]
+    assert stats["checkouts"] == 2
+    assert stats["waits"] == 1
+    assert stats["wait_ms"]["max"] >= 50
+
+
+def test_timeouts_are_recorded(monitored):
+    monitor, engine = monitored
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = monitor.snapshot()["pools"]["test"]
+    assert stats["timeouts"] == 1
+    assert stats["checkouts"] == 1
+    assert stats["wait_ms"]["total"] >= 200
+
+
+def test_latency_percentiles_and_reset(monitored):
+    monitor, engine = monitored
+    monitor.samples = 100
+    monitor.reset()
+
+    for latency in range(100, 0, -1):
+        monitor._record_checkout("test", latency / 1000, False, 1, 0)
+    monitor._record_checkout("test", 0.5, False, 1, 0)
+
+    checkout_ms = monitor.snapshot()["pools"]["test"]["checkout_ms"]
+    # The mean covers every checkout, the percentiles the last `samples` ones (1 to 99 ms and 500 ms)
+    assert checkout_ms == {"mean": 54.95, "p50": 51.0, "p95": 96.0, "p99": 500.0, "max": 500.0}
+
+    monitor.reset()
+    assert monitor.snapshot()["pools"]["test"]["checkout_ms"]["p50"] is None
+
+
+def test_pool_stats_route(client):
+    client.get("/production")
+
+    response = client.get("/pool-stats", params={"reset": "true"})
+
+    assert response.status_code == 200
+    assert {"sync", "async"} <= set(response.json()["pools"])
+    assert response.json()["pools"]["async"]["checkouts"] >= 1
+    assert client.get("/pool-stats").json()["pools"]["async"]["checkouts"] == 0
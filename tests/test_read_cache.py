@@ -0,0 +1,111 @@
+"""
+Tests for the in-process read cache.
+"""
+
+import sys
+
+import pytest
+
+from services.storage import ReadCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(sys.modules[ReadCache.__module__], "time", clock)
+    return clock
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = ReadCache(ttl=10, max_bytes=100)
+    cache.put("export", ("a",), b"body")
+
+    clock.now += 9
+    assert cache.get("export", ("a",)) == b"body"
+
+    clock.now += 1
+    assert cache.get("export", ("a",)) is None
+    assert cache._size == 0
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = ReadCache(ttl=10, max_bytes=10)
+    cache.put("export", ("a",), b"aaaa")
+    cache.put("export", ("b",), b"bbbb")
+    cache.get("export", ("a",))
+
+    cache.put("export", ("c",), b"cccc")
+
+    assert cache.get("export", ("a",)) == b"aaaa"
+    assert cache.get("export", ("b",)) is None
+    assert cache.get("export", ("c",)) == b"cccc"
+    assert cache._size == 8
+
+
+def test_values_larger_than_the_budget_are_not_cached(clock):
+    cache = ReadCache(ttl=10, max_bytes=3)
+    cache.put("export", ("a",), b"aaaa")
+
+    assert cache.get("export", ("a",)) is None
+
+
+def test_replacing_an_entry_keeps_the_size(clock):
+    cache = ReadCache(ttl=10, max_bytes=10)
+    cache.put("export", ("a",), b"aaaa")
+    cache.put("export", ("a",), b"aa")
+
+    assert cache.get("export", ("a",)) == b"aa"
+    assert cache._size == 2
+
+
+@pytest.mark.parametrize("enabled", [{"ttl": 0, "max_bytes": 10}, {"ttl": 10, "max_bytes": 0}])
+def test_disabled_cache_stores_nothing(clock, enabled):
+    cache = ReadCache(**enabled)
+    cache.put("export", ("a",), b"a")
+
+    assert not cache.enabled
+    assert cache.get("export", ("a",)) is None
+
+
+def test_writes_invalidate_the_entries_covering_their_years(clock):
+    cache = ReadCache(ttl=10, max_bytes=100)
+    cache.put("export", ("all",), b"all")
+    cache.put("export", ("2020",), b"2020", years=[2020])
+    cache.put("export", ("2021",), b"2021", years=[2021])
+    cache.put("export", ("2015-2019",), b"range", year_range=(2015, 2019))
+    cache.put("export", ("from 2021",), b"from", year_range=(2021, None))
+    cache.put("import", ("all",), b"import")
+
+    assert cache.invalidate("export", [2020]) == 2
+
+    assert cache.get("export", ("all",)) is None
+    assert cache.get("export", ("2020",)) is None
+    assert cache.get("export", ("2021",)) == b"2021"
+    assert cache.get("export", ("2015-2019",)) == b"range"
+    assert cache.get("export", ("from 2021",)) == b"from"
+    assert cache.get("import", ("all",)) == b"import"
+
+    assert cache.invalidate("export") == 3
+    assert cache.get("import", ("all",)) == b"import"
+
+
+def test_results_read_across_an_invalidation_are_not_cached(clock):
+    cache = ReadCache(ttl=10, max_bytes=100)
+    generation = cache.generation("export")
+
+    # A write is committed while the query runs
+    cache.invalidate("export", [2020])
+    cache.put("export", ("2020",), b"old", years=[2020], generation=generation)
+
+    assert cache.get("export", ("2020",)) is None
+
+    cache.put("export", ("2020",), b"new", years=[2020], generation=cache.generation("export"))
+    assert cache.get("export", ("2020",)) == b"new"
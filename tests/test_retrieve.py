@@ -0,0 +1,99 @@
+"""
+Tests for the retrieval endpoints and the paths answering them.
+"""
+
+import orjson
+import pyarrow as pa
+import pytest
+
+from api.routes.retrieve import build_snapshots
+from api.routes.scrape import translate_columns
+from models import Export
+from services.scraper import ScraperPages, ScraperParsers
+from services.storage import db_handler, ColumnKeyMapping, ModelKeyMapping
+
+
+@pytest.fixture
+def exports(db, fixture_html):
+    data = translate_columns(ScraperParsers.get_parser(ScraperPages.EXPORT).parse(fixture_html("export.html")), ColumnKeyMapping)
+    for year in (2020, 2021):
+        db_handler.ingest(db, Export, data.assign(year=year, classification="Vinhos de mesa"), ModelKeyMapping["Export"])
+    return len(data)
+
+
+def test_pages_are_returned_as_json(client, exports):
+    response = client.get("/export", params={"years": "2020", "country": "Alemanha", "fields": "year,quantity"})
+
+    assert response.status_code == 200
+    assert response.json()["data"] == [{"id": 2, "year": 2020, "quantity": 26415}]
+
+
+def test_pages_are_paginated(client, exports):
+    first = client.get("/export", params={"limit": exports}).json()
+    second = client.get("/export", params={"limit": exports, "cursor": first["next_cursor"]}).json()
+
+    assert [row["year"] for row in first["data"]] == [2020] * exports
+    assert [row["year"] for row in second["data"]] == [2021] * exports
+    assert second["next_cursor"] is None
+
+
+def test_unfiltered_years_are_served_from_snapshots(client, exports):
+    assert build_snapshots(Export, [2020]) > 0
+
+    response = client.get("/export", params={"years": "2020"}, headers={"Accept-Encoding": "br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert len(response.json()["data"]) == exports
+
+
+def test_writes_remove_the_snapshots_of_their_years(client, db, exports):
+    build_snapshots(Export, [2020])
+    db_handler.store(db, Export, year=2020, country="Alemanha", classification="Vinhos de mesa", quantity="1", value="1")
+
+    response = client.get("/export", params={"years": "2020", "country": "Alemanha"}, headers={"Accept-Encoding": "br"})
+    snapshot = client.get("/export", params={"years": "2020"}, headers={"Accept-Encoding": "br"})
+
+    assert response.json()["data"][0]["quantity"] == 1
+    assert "Content-Encoding" not in snapshot.headers
+
+
+def test_columnar_pages(client, exports):
+    response = client.get("/export", params={"format": "arrow", "years": "2021", "fields": "year,country"})
+
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.file"
+    frame = pa.ipc.open_file(pa.py_buffer(response.content)).read_all()
+    assert frame.column_names == ["id", "year", "country"]
+    assert frame.num_rows == exports
+
+
+def test_rows_are_streamed_as_ndjson(client, exports):
+    response = client.get("/export", params={"stream": "ndjson", "years": "2021", "fields": "country"})
+
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(lines) == exports
+    assert lines[0] == {"id": exports + 1, "country": "Afeganistão"}
+
+
+def test_invalid_parameters_are_rejected(client, exports):
+    assert client.get("/export", params={"years": "20x0"}).status_code == 400
+    assert client.get("/export", params={"cursor": "bogus"}).status_code == 400
+    assert client.get("/export", params={"fields": "bogus"}).status_code == 400
+    assert client.get("/export", params={"format": "xml"}).status_code == 400
+
+
+def test_invalid_streams_are_rejected_before_the_response_starts(client, db, exports):
+    response = client.get("/export", params={"stream": "ndjson", "fields": "bogus"})
+
+    assert response.status_code == 400
+    assert "bogus" in response.json()["detail"]
+    with pytest.raises(ValueError):
+        db_handler.stream(db, Export, fields=["bogus"])
+
+
+@pytest.mark.parametrize("params", [{"limit": 1}, {"cursor": "MQ"}, {"format": "arrow"}], ids=lambda params: next(iter(params)))
+def test_streams_reject_pagination_and_formats(client, exports, params):
+    response = client.get("/export", params={"stream": "ndjson", **params})
+
+    assert response.status_code == 400
+    assert next(iter(params)) in response.json()["detail"]
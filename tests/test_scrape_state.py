@@ -0,0 +1,154 @@
+"""
+Tests for the scrape state ledger.
+
+The Embrapa site is replaced by a local server answering every page with its fixture.
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from models import Production, ScrapeState
+from services.scraper import ScraperPages, html_cache
+from api.routes.scrape import scrape_batch
+
+OPTION_FIXTURES = {page.value["option"]: f"{page.name.lower()}.html" for page in ScraperPages}
+
+# Pages answered with a server error
+FAILING_OPTIONS = {ScraperPages.COMMERCIALIZATION.value["option"]}
+
+
+@pytest.fixture
+def embrapa(monkeypatch, tmp_path, fixture_html):
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            option = parse_qs(urlparse(self.path).query)["opcao"][0]
+            requests.append(option)
+            if option in FAILING_OPTIONS:
+                self.send_response(500)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = fixture_html(OPTION_FIXTURES[option]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(
+        sys.modules["services.scraper.scraper"], "BASE_URL", f"http://127.0.0.1:{server.server_port}/index.php"
+    )
+    # Every fetch reaches the server instead of the raw HTML cache
+    monkeypatch.setattr(html_cache, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(html_cache, "ttl", 0)
+
+    yield requests
+    server.shutdown()
+
+
+def ledger(db):
+    db.expire_all()
+    return {(state.page, state.year): state for state in db.query(ScrapeState).all()}
+
+
+def statuses(summary):
+    return [item["status"] for item in summary]
+
+
+def test_first_scrape_stores_rows_and_records_them(embrapa, db):
+    summary = scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+
+    assert statuses(summary) == ["stored"]
+    assert embrapa == ["opt_02"]
+
+    rows = db.query(Production).filter(Production.year == 2020).count()
+    state = ledger(db)[("PRODUCTION", 2020)]
+    assert rows == summary[0]["rows"] > 0
+    assert state.status == "stored"
+    assert state.row_count == rows
+    assert len(state.content_hash) == 64
+    assert state.error is None
+
+
+def test_fresh_items_are_skipped_without_any_request(embrapa, db):
+    scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+    fetched_at = ledger(db)[("PRODUCTION", 2020)].fetched_at
+
+    summary = scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+
+    assert statuses(summary) == ["skipped"]
+    assert embrapa == ["opt_02"]
+    assert ledger(db)[("PRODUCTION", 2020)].fetched_at == fetched_at
+
+
+def test_stale_unchanged_items_are_not_stored_again(embrapa, db, monkeypatch):
+    scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+    ids = [row.id for row in db.query(Production.id).order_by(Production.id)]
+    monkeypatch.setattr(sys.modules["api.routes.scrape"], "SCRAPE_STATE_TTL", 0)
+
+    summary = scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+
+    assert statuses(summary) == ["unchanged"]
+    assert embrapa == ["opt_02", "opt_02"]
+    assert [row.id for row in db.query(Production.id).order_by(Production.id)] == ids
+    assert ledger(db)[("PRODUCTION", 2020)].status == "unchanged"
+
+
+def test_force_stores_fresh_items_again(embrapa, db):
+    scrape_batch([2020], [ScraperPages.PRODUCTION], db)
+    rows = db.query(Production).count()
+
+    summary = scrape_batch([2020], [ScraperPages.PRODUCTION], db, force=True)
+
+    assert statuses(summary) == ["stored"]
+    assert embrapa == ["opt_02", "opt_02"]
+    assert db.query(Production).count() == rows
+
+
+def test_failed_items_are_recorded_and_retried(embrapa, db):
+    summary = scrape_batch([2020], [ScraperPages.COMMERCIALIZATION], db)
+
+    assert statuses(summary) == ["failed"]
+    state = ledger(db)[("COMMERCIALIZATION", 2020)]
+    assert state.status == "failed"
+    assert state.error
+
+    scrape_batch([2020], [ScraperPages.COMMERCIALIZATION], db)
+
+    assert embrapa == ["opt_04", "opt_04"]
+
+
+def test_coverage_reports_the_ledger(embrapa, db, client):
+    scrape_batch([2020], [ScraperPages.PRODUCTION, ScraperPages.COMMERCIALIZATION], db)
+    db.query(ScrapeState).filter(ScrapeState.page == "PRODUCTION", ScrapeState.year == 2020).update(
+        {"fetched_at": datetime.now(timezone.utc) - timedelta(days=30)}
+    )
+    db.commit()
+    scrape_batch([2021], [ScraperPages.PRODUCTION], db)
+
+    response = client.get("/scrape/coverage?year_from=2020&year_to=2022&pages=production,commercialization")
+
+    assert response.status_code == 200
+    coverage = {(item["page"], item["year"]): item["state"] for item in response.json()["items"]}
+    assert coverage == {
+        ("PRODUCTION", 2020): "stale",
+        ("PRODUCTION", 2021): "fresh",
+        ("PRODUCTION", 2022): "missing",
+        ("COMMERCIALIZATION", 2020): "failed",
+        ("COMMERCIALIZATION", 2021): "missing",
+        ("COMMERCIALIZATION", 2022): "missing",
+    }